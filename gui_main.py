@@ -5,6 +5,7 @@ Texas Children's Hospital Transfer Center GUI Application
 This is the main entry point for the GUI application that allows interaction
 with the pediatric hospital transfer decision support system.
 """
+import logging
 import os
 import sys
 
@@ -15,4 +16,5 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
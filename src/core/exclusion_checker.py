@@ -14,9 +14,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.models import CampusExclusion, HospitalCampus, PatientData
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Path to exclusion criteria JSON file
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
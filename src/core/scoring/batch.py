@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Batch Pediatric Scoring
+
+Vectorized versions of the pediatric scoring systems for scoring whole cohorts
+at once with NumPy. Vitals are passed as compact integer arrays (int16 for rates,
+blood pressure and age, int8 for SpO2 and capillary refill) and every threshold
+is cast to the same dtype, so NumPy never silently upcasts to int64.
+
+Optional vitals use MISSING (-1) for individual patients with no value.
+
+extract_vitals_batch and process_patient_batch wrap these kernels for lists of
+PatientData: clinical text is parsed once per patient, then the numeric vitals
+are laid out as columns and scored together.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.core.models import PatientData
+from src.core.scoring.pediatric import (
+    _CHEWS_SUBSCORE_KEYS,
+    _CHEWS_THRESHOLDS,
+    calculate_chews,
+)
+from src.core.scoring.score_processor import _VITAL_KEYS, extract_vital_signs
+from src.core.scoring.utils import (
+    AGE_BASED_RANGES,
+    OXYGEN_THERAPY_MAP,
+    RESPIRATORY_EFFORT_MAP,
+    safe_get_from_map,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "MISSING",
+    "CHEWS_ALERT_LEVELS",
+    "calculate_chews_batch",
+    "extract_vitals_batch",
+    "process_patient_batch",
+]
+
+# Marker for a missing optional vital in an integer array
+MISSING = -1
+
+# Alert levels indexed by the "alert_level_index" returned from
+# calculate_chews_batch
+CHEWS_ALERT_LEVELS = tuple(level for _, level, _ in _CHEWS_THRESHOLDS)
+_CHEWS_ALERT_BOUNDS = np.array(
+    [threshold for threshold, _, _ in _CHEWS_THRESHOLDS[:-1]], dtype=np.int8
+)
+
+# Age band lookup tables built from AGE_BASED_RANGES. The extra final row holds
+# the adolescent defaults used by get_age_based_ranges for out-of-range ages.
+_AGE_BANDS = sorted(AGE_BASED_RANGES.items())
+_AGE_BAND_BOUNDS = np.array([max_age for (_, max_age), _ in _AGE_BANDS], np.int16)
+_DEFAULT_BAND = len(_AGE_BANDS)
+_HR_MIN, _HR_MAX, _RR_MIN, _RR_MAX = (
+    np.array(column + (default,), dtype=np.int16)
+    for column, default in zip(
+        zip(*(ranges for _, ranges in _AGE_BANDS)), (60, 90, 15, 20)
+    )
+)
+
+
+# Vitals returned as float64 columns (NaN when missing); the rest are descriptors
+_NUMERIC_VITAL_KEYS = (
+    "age_months",
+    "respiratory_rate",
+    "oxygen_saturation",
+    "heart_rate",
+    "systolic_bp",
+    "diastolic_bp",
+    "gcs",
+    "capillary_refill",
+    "weight_kg",
+)
+
+
+def _count_true(*conditions):
+    """Sum boolean arrays as int8 counts (NumPy adds bools as logical OR)"""
+    total = conditions[0].astype(np.int8)
+    for condition in conditions[1:]:
+        total += condition
+    return total
+
+
+def _map_descriptors(values, mapping, size):
+    """Map a sequence of descriptors to an int8 array of subscores"""
+    if values is None:
+        return np.zeros(size, dtype=np.int8)
+    return np.fromiter(
+        (safe_get_from_map(value, mapping) for value in values),
+        dtype=np.int8,
+        count=size,
+    )
+
+
+def calculate_chews_batch(
+    respiratory_rate: np.ndarray,
+    heart_rate: np.ndarray,
+    age_months: np.ndarray,
+    systolic_bp: Optional[np.ndarray] = None,
+    capillary_refill_tenths: Optional[np.ndarray] = None,
+    oxygen_saturation: Optional[np.ndarray] = None,
+    respiratory_effort: Optional[Iterable[Any]] = None,
+    oxygen_therapy: Optional[Iterable[Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Calculate CHEWS for a cohort of patients
+
+    Produces the same scores as calculate_chews for whole-number vitals.
+
+    Args:
+        respiratory_rate: Breaths per minute (int16 array)
+        heart_rate: Beats per minute (int16 array)
+        age_months: Age in months (int16 array)
+        systolic_bp: Systolic blood pressure in mmHg (int16 array, MISSING if absent)
+        capillary_refill_tenths: Capillary refill in tenths of a second
+            (int8 array, MISSING if absent)
+        oxygen_saturation: SpO2 percentage (int8 array, MISSING if absent)
+        respiratory_effort: Respiratory effort descriptors, one per patient
+        oxygen_therapy: Oxygen support descriptors, one per patient
+
+    Returns:
+        Dictionary with int8 "score" and "alert_level_index" arrays (index into
+        CHEWS_ALERT_LEVELS) and a "subscores" dictionary of int8 arrays.
+    """
+    rr = np.asarray(respiratory_rate, dtype=np.int16)
+    hr = np.asarray(heart_rate, dtype=np.int16)
+    age = np.asarray(age_months, dtype=np.int16)
+    size = len(rr)
+
+    # Age-appropriate reference ranges
+    band = np.searchsorted(_AGE_BAND_BOUNDS, age, side="right")
+    band[age < 0] = _DEFAULT_BAND
+    rr_min, rr_max = _RR_MIN[band], _RR_MAX[band]
+    hr_min, hr_max = _HR_MIN[band], _HR_MAX[band]
+
+    subscores = {
+        "respiratory_rate": _count_true(
+            rr < rr_min,
+            rr < rr_min - 5,
+            rr < rr_min - 10,
+            rr > rr_max + 5,
+            rr > rr_max + 10,
+            rr > rr_max + 15,
+        ),
+        "respiratory_effort": _map_descriptors(
+            respiratory_effort, RESPIRATORY_EFFORT_MAP, size
+        ),
+        "heart_rate": _count_true(
+            hr < hr_min,
+            hr < hr_min - 10,
+            hr < hr_min - 20,
+            hr > hr_max + 10,
+            hr > hr_max + 15,
+            hr > hr_max + 20,
+        ),
+    }
+
+    # Systolic BP against 70 + age/6 mmHg, scaled by 6 to stay in integers
+    if systolic_bp is None:
+        subscores["systolic_bp"] = np.zeros(size, dtype=np.int8)
+    else:
+        sbp = np.asarray(systolic_bp, dtype=np.int16)
+        sbp6 = sbp * 6
+        subscores["systolic_bp"] = _count_true(
+            sbp6 < 390 + age, sbp6 < 360 + age, sbp6 < 300 + age
+        ) * (sbp != MISSING)
+
+    if capillary_refill_tenths is None:
+        subscores["capillary_refill"] = np.zeros(size, dtype=np.int8)
+    else:
+        cap = np.asarray(capillary_refill_tenths, dtype=np.int8)
+        subscores["capillary_refill"] = _count_true(cap > 20, cap > 30, cap > 40)
+
+    subscores["oxygen_therapy"] = _map_descriptors(
+        oxygen_therapy, OXYGEN_THERAPY_MAP, size
+    )
+
+    if oxygen_saturation is None:
+        subscores["oxygen_saturation"] = np.zeros(size, dtype=np.int8)
+    else:
+        spo2 = np.asarray(oxygen_saturation, dtype=np.int8)
+        subscores["oxygen_saturation"] = _count_true(
+            spo2 < 93, spo2 < 90, spo2 < 85
+        ) * (spo2 != MISSING)
+
+    total = np.zeros(size, dtype=np.int8)
+    for key in _CHEWS_SUBSCORE_KEYS:
+        total += subscores[key]
+
+    return {
+        "score": total,
+        "alert_level_index": np.searchsorted(_CHEWS_ALERT_BOUNDS, total).astype(
+            np.int8
+        ),
+        "subscores": {key: subscores[key] for key in _CHEWS_SUBSCORE_KEYS},
+    }
+
+
+def extract_vitals_batch(patients: List[PatientData]) -> Dict[str, np.ndarray]:
+    """
+    Extract vital signs for a list of patients as columns
+
+    Args:
+        patients: Patient data objects
+
+    Returns:
+        Dictionary of one array per vital sign key, in patient order. Numeric
+        vitals are float64 arrays with NaN for missing values; descriptors such as
+        respiratory_effort are object arrays with None for missing values.
+    """
+    rows = [extract_vital_signs(patient) for patient in patients]
+    columns = {}
+    for key in _VITAL_KEYS:
+        values = [row[key] for row in rows]
+        if key in _NUMERIC_VITAL_KEYS:
+            columns[key] = np.array(
+                [np.nan if value is None else value for value in values],
+                dtype=np.float64,
+            )
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            columns[key] = column
+    return columns
+
+
+def _whole_in_range(values, low, high):
+    """Mask of values that are whole numbers within [low, high]"""
+    return (values == np.floor(values)) & (values >= low) & (values <= high)
+
+
+def _optional_column(values, low, high, scale=1):
+    """Convert an optional float column to integers, with MISSING for NaN
+
+    Returns the integer column and a mask of rows that can be scored exactly in
+    integer arithmetic (missing, or whole and in range after scaling).
+    """
+    missing = np.isnan(values)
+    scaled = np.round(values * scale) if scale != 1 else values
+    exact = missing | (_whole_in_range(scaled, low, high) & (scaled == values * scale))
+    return np.where(exact & ~missing, scaled, MISSING), exact
+
+
+def _optional_float(values, row):
+    """Read a float column entry as a Python float, or None for NaN"""
+    value = values[row].item()
+    return None if value != value else value
+
+
+def process_patient_batch(patients: List[PatientData]) -> "pd.DataFrame":
+    """
+    Extract vitals and calculate CHEWS for a list of patients
+
+    Patients whose vitals are whole numbers are scored together with
+    calculate_chews_batch; any others (e.g. fractional rates) are scored with
+    calculate_chews so every row matches the per-patient result.
+
+    Args:
+        patients: Patient data objects
+
+    Returns:
+        DataFrame with one row per patient: patient_id, the extracted vitals,
+        chews_score (nullable integer, missing when CHEWS cannot be calculated)
+        and chews_alert_level.
+    """
+    import pandas as pd
+
+    columns = extract_vitals_batch(patients)
+    size = len(patients)
+
+    rr = columns["respiratory_rate"]
+    hr = columns["heart_rate"]
+    age = columns["age_months"]
+    scorable = ~(np.isnan(rr) | np.isnan(hr) | np.isnan(age))
+
+    sbp, sbp_exact = _optional_column(columns["systolic_bp"], 0, 5000)
+    cap, cap_exact = _optional_column(columns["capillary_refill"], 0, 127, scale=10)
+    spo2, spo2_exact = _optional_column(columns["oxygen_saturation"], 0, 127)
+    vectorized = scorable & np.logical_and.reduce(
+        (
+            _whole_in_range(rr, 0, 32767),
+            _whole_in_range(hr, 0, 32767),
+            _whole_in_range(age, 0, 5000),
+            sbp_exact,
+            cap_exact,
+            spo2_exact,
+        )
+    )
+
+    scores = np.zeros(size, dtype=np.int16)
+    alert_levels = np.full(size, None, dtype=object)
+
+    rows = np.flatnonzero(vectorized)
+    if len(rows):
+        result = calculate_chews_batch(
+            rr[rows],
+            hr[rows],
+            age[rows],
+            systolic_bp=sbp[rows],
+            capillary_refill_tenths=cap[rows],
+            oxygen_saturation=spo2[rows],
+            respiratory_effort=columns["respiratory_effort"][rows],
+            oxygen_therapy=columns["oxygen_requirement"][rows],
+        )
+        scores[rows] = result["score"]
+        alert_levels[rows] = np.array(CHEWS_ALERT_LEVELS, dtype=object)[
+            result["alert_level_index"]
+        ]
+
+    # calculate_chews needs Python floats: NumPy bools add as logical OR
+    for row in np.flatnonzero(scorable & ~vectorized):
+        chews = calculate_chews(
+            respiratory_rate=_optional_float(rr, row),
+            respiratory_effort=columns["respiratory_effort"][row],
+            heart_rate=_optional_float(hr, row),
+            systolic_bp=_optional_float(columns["systolic_bp"], row),
+            capillary_refill=_optional_float(columns["capillary_refill"], row),
+            oxygen_therapy=columns["oxygen_requirement"][row],
+            oxygen_saturation=_optional_float(columns["oxygen_saturation"], row),
+            age_months=_optional_float(age, row),
+            lazy=True,
+        )
+        scores[row] = chews["score"]
+        alert_levels[row] = chews["alert_level"]
+
+    frame = pd.DataFrame(
+        {"patient_id": [patient.patient_id for patient in patients], **columns}
+    )
+    frame["chews_score"] = pd.array(scores, dtype="Int16")
+    frame.loc[~scorable, "chews_score"] = pd.NA
+    frame["chews_alert_level"] = alert_levels
+    return frame
@@ -12,6 +12,8 @@ and validated research, with appropriate thresholds and interpretations.
 """
 
 import logging
+from bisect import bisect_right
+from collections.abc import Mapping
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Import utility functions and constants from the new location
@@ -24,6 +26,7 @@ from src.core.scoring.utils import (
     check_missing_params,
     create_na_response,
     get_age_based_ranges,
+    intern_keys,
     normalize_to_risk_level,
     parse_numeric_or_map,
     safe_get_from_map,
@@ -40,8 +43,127 @@ __all__ = [
     "calculate_queensland_trauma",
     "calculate_tps",
     "calculate_chews",
+    "ChewsResult",
 ]
 
+# Descriptor maps for the Queensland Trauma and TPS scores. Built once at import
+# with interned keys rather than rebuilt inside every call.
+
+_QLD_TRAUMA_MECHANISM_MAP = intern_keys(
+    {
+        "minor": 0,
+        "low energy": 0,
+        "isolated": 0,
+        "moderate": 1,
+        "medium energy": 1,
+        "severe": 2,
+        "high energy": 2,
+        "multiple": 2,
+        "high-energy": 2,
+        "critical": 3,
+        "very high energy": 3,
+        "extreme": 3,
+    }
+)
+
+_QLD_TRAUMA_AIRWAY_MAP = intern_keys(
+    {
+        "clear": 0,
+        "patent": 0,
+        "normal": 0,
+        "maintainable": 1,
+        "requires support": 1,
+        "assisted": 1,
+        "unmaintainable": 2,
+        "compromised": 2,
+        "intervention required": 2,
+        "obstructed": 3,
+        "failed": 3,
+        "intubated": 3,
+    }
+)
+
+_QLD_TRAUMA_BREATHING_MAP = intern_keys(
+    {
+        "normal": 0,
+        "comfortable": 0,
+        "regular": 0,
+        "unlabored": 0,
+        "distressed": 1,
+        "increased work": 1,
+        "mild increased work": 1,
+        "moderate work": 1,
+        "labored": 2,
+        "severe distress": 2,
+        "significant work": 2,
+        "retractions": 2,
+        "absent": 3,
+        "inadequate": 3,
+        "apneic": 3,
+        "failing": 3,
+    }
+)
+
+_QLD_TRAUMA_CIRCULATION_MAP = intern_keys(
+    {
+        "normal": 0,
+        "good": 0,
+        "stable": 0,
+        "abnormal": 1,
+        "mild tachycardia": 1,
+        "delayed capillary refill": 1,
+        "unstable": 2,
+        "tachycardic": 2,
+        "poor perfusion": 2,
+        "decompensated": 3,
+        "shock": 3,
+        "absent pulses": 3,
+        "failure": 3,
+    }
+)
+
+_TPS_RESPIRATORY_MAP = intern_keys(
+    {
+        "normal": 0,
+        "stable": 0,
+        "no distress": 0,
+        "mild": 1,
+        "minor": 1,
+        "slight": 1,
+        "minimal distress": 1,
+        "moderate": 2,
+        "significant": 2,
+        "distressed": 2,
+        "moderate distress": 2,
+        "severe": 3,
+        "critical": 3,
+        "intubated": 3,
+        "respiratory failure": 3,
+        "severe distress": 3,
+    }
+)
+
+_TPS_CIRCULATION_MAP = intern_keys(
+    {
+        "normal": 0,
+        "stable": 0,
+        "good perfusion": 0,
+        "mild": 1,
+        "minor": 1,
+        "compensated": 1,
+        "mild tachycardia": 1,
+        "moderate": 2,
+        "significant": 2,
+        "compromised": 2,
+        "poor perfusion": 2,
+        "severe": 3,
+        "critical": 3,
+        "shock": 3,
+        "decompensated": 3,
+        "failure": 3,
+    }
+)
+
 # PEWS - Pediatric Early Warning Score
 
 
@@ -876,9 +998,103 @@ def calculate_prism3(vitals=None, labs=None, age_months=None, ventilated=False):
     }
 
 
+# Queensland Non-Trauma per-age-band vital sign scorers. Each ladder is written
+# as a sum of comparisons: the low and high threshold regions are disjoint, so at
+# most one side contributes and the result is a 0-3 subscore.
+
+
+def _score_rr_infant(resp_rate: float) -> int:
+    return (
+        (resp_rate < 30)
+        + (resp_rate < 25)
+        + (resp_rate < 20)
+        + (resp_rate > 40)
+        + (resp_rate > 50)
+        + (resp_rate > 60)
+    )
+
+
+def _score_rr_toddler(resp_rate: float) -> int:
+    return (
+        (resp_rate < 25)
+        + (resp_rate < 20)
+        + (resp_rate < 15)
+        + (resp_rate > 30)
+        + (resp_rate > 35)
+        + (resp_rate > 40)
+    )
+
+
+def _score_rr_school_age(resp_rate: float) -> int:
+    return (
+        (resp_rate < 20)
+        + (resp_rate < 15)
+        + (resp_rate < 10)
+        + (resp_rate > 25)
+        + (resp_rate > 30)
+        + (resp_rate > 35)
+    )
+
+
+def _score_rr_adolescent(resp_rate: float) -> int:
+    return (
+        (resp_rate < 15)
+        + (resp_rate < 12)
+        + (resp_rate < 10)
+        + (resp_rate > 20)
+        + (resp_rate > 25)
+        + (resp_rate > 30)
+    )
+
+
+def _score_hr_infant(HR: float) -> int:
+    return (HR < 120) + (HR < 110) + (HR < 90) + (HR > 140) + (HR > 150) + (HR > 170)
+
+
+def _score_hr_toddler(HR: float) -> int:
+    return (HR < 110) + (HR < 95) + (HR < 80) + (HR > 130) + (HR > 140) + (HR > 160)
+
+
+def _score_hr_school_age(HR: float) -> int:
+    return (HR < 90) + (HR < 80) + (HR < 70) + (HR > 120) + (HR > 130) + (HR > 140)
+
+
+def _score_hr_adolescent(HR: float) -> int:
+    return (HR < 70) + (HR < 65) + (HR < 60) + (HR > 110) + (HR > 120) + (HR > 130)
+
+
+# Upper bounds (in months, exclusive) of the infant, toddler and school-age bands;
+# bisect_right over these yields the age band index used by the tables below
+_QLD_AGE_BAND_BOUNDS = (12, 60, 144)
+
+# Indexed by age band: <1 year, 1-4 years, 5-11 years, 12+ years
+_QLD_AGE_CATEGORIES = (
+    "Infant (<1 year)",
+    "Toddler (1-4 years)",
+    "School Age (5-11 years)",
+    "Adolescent (12+ years)",
+)
+_QLD_RR_SCORERS = (
+    _score_rr_infant,
+    _score_rr_toddler,
+    _score_rr_school_age,
+    _score_rr_adolescent,
+)
+_QLD_HR_SCORERS = (
+    _score_hr_infant,
+    _score_hr_toddler,
+    _score_hr_school_age,
+    _score_hr_adolescent,
+)
+
+
 def calculate_queensland_non_trauma(
-    resp_rate=None, HR=None, mental_status=None, SpO2=None, age_months=None
-):
+    resp_rate: Optional[float] = None,
+    HR: Optional[float] = None,
+    mental_status: Optional[str] = None,
+    SpO2: Optional[float] = None,
+    age_months: Optional[float] = None,
+) -> Dict[str, Any]:
     """
     Calculate the Queensland Pediatric Non-Trauma Early Warning Score
 
@@ -896,174 +1112,42 @@ def calculate_queensland_non_trauma(
         Dictionary with score, risk level, action recommendations, and age category.
         Returns 'N/A' for score and all metrics if required parameters are missing.
     """
-    # Check for required parameters
-    required_params = {"resp_rate": resp_rate, "HR": HR, "mental_status": mental_status}
-
-    # Critical parameters for score calculation
-    critical_params = {"resp_rate": resp_rate, "HR": HR}
-
-    # Check for missing critical parameters
-    missing_critical = [
-        param for param, value in critical_params.items() if value is None
-    ]
-    if missing_critical or age_months is None:
+    # Check for missing critical parameters; the names are only collected on
+    # the (uncommon) missing-data path
+    if resp_rate is None or HR is None or age_months is None:
+        missing_critical = [
+            param
+            for param, value in (
+                ("resp_rate", resp_rate),
+                ("HR", HR),
+                ("age_months", age_months),
+            )
+            if value is None
+        ]
         return create_na_response(
             "Queensland Non-Trauma",
-            missing_critical + ([] if age_months is not None else ["age_months"]),
+            missing_critical,
             ["respiratory_rate", "heart_rate", "mental_status", "spo2"],
             include_interpretation=False,
         )
 
-    # Determine age category
-    if age_months < 12:  # <1 year
-        age_category = "Infant (<1 year)"
-    elif age_months < 60:  # 1-4 years
-        age_category = "Toddler (1-4 years)"
-    elif age_months < 144:  # 5-11 years
-        age_category = "School Age (5-11 years)"
-    else:  # 12+ years
-        age_category = "Adolescent (12+ years)"
+    # Determine the age band once and dispatch to the per-band scorers
+    band = bisect_right(_QLD_AGE_BAND_BOUNDS, age_months)
 
-    # Initialize subscores
-    subscores = {}
+    age_category = _QLD_AGE_CATEGORIES[band]
 
-    # Score respiratory rate based on age category
-    if age_months < 12:  # Infant <1 year
-        if resp_rate < 20:
-            subscores["respiratory_rate"] = 3
-        elif resp_rate < 25:
-            subscores["respiratory_rate"] = 2
-        elif resp_rate < 30:
-            subscores["respiratory_rate"] = 1
-        elif resp_rate > 60:
-            subscores["respiratory_rate"] = 3
-        elif resp_rate > 50:
-            subscores["respiratory_rate"] = 2
-        elif resp_rate > 40:
-            subscores["respiratory_rate"] = 1
-        else:
-            subscores["respiratory_rate"] = 0
-    elif age_months < 60:  # Toddler 1-4 years
-        if resp_rate < 15:
-            subscores["respiratory_rate"] = 3
-        elif resp_rate < 20:
-            subscores["respiratory_rate"] = 2
-        elif resp_rate < 25:
-            subscores["respiratory_rate"] = 1
-        elif resp_rate > 40:
-            subscores["respiratory_rate"] = 3
-        elif resp_rate > 35:
-            subscores["respiratory_rate"] = 2
-        elif resp_rate > 30:
-            subscores["respiratory_rate"] = 1
-        else:
-            subscores["respiratory_rate"] = 0
-    elif age_months < 144:  # School Age 5-11 years
-        if resp_rate < 10:
-            subscores["respiratory_rate"] = 3
-        elif resp_rate < 15:
-            subscores["respiratory_rate"] = 2
-        elif resp_rate < 20:
-            subscores["respiratory_rate"] = 1
-        elif resp_rate > 35:
-            subscores["respiratory_rate"] = 3
-        elif resp_rate > 30:
-            subscores["respiratory_rate"] = 2
-        elif resp_rate > 25:
-            subscores["respiratory_rate"] = 1
-        else:
-            subscores["respiratory_rate"] = 0
-    else:  # Adolescent 12+ years
-        if resp_rate < 10:
-            subscores["respiratory_rate"] = 3
-        elif resp_rate < 12:
-            subscores["respiratory_rate"] = 2
-        elif resp_rate < 15:
-            subscores["respiratory_rate"] = 1
-        elif resp_rate > 30:
-            subscores["respiratory_rate"] = 3
-        elif resp_rate > 25:
-            subscores["respiratory_rate"] = 2
-        elif resp_rate > 20:
-            subscores["respiratory_rate"] = 1
-        else:
-            subscores["respiratory_rate"] = 0
-
-    # Score heart rate based on age category
-    if age_months < 12:  # Infant <1 year
-        if HR < 90:
-            subscores["heart_rate"] = 3
-        elif HR < 110:
-            subscores["heart_rate"] = 2
-        elif HR < 120:
-            subscores["heart_rate"] = 1
-        elif HR > 170:
-            subscores["heart_rate"] = 3
-        elif HR > 150:
-            subscores["heart_rate"] = 2
-        elif HR > 140:
-            subscores["heart_rate"] = 1
-        else:
-            subscores["heart_rate"] = 0
-    elif age_months < 60:  # Toddler 1-4 years
-        if HR < 80:
-            subscores["heart_rate"] = 3
-        elif HR < 95:
-            subscores["heart_rate"] = 2
-        elif HR < 110:
-            subscores["heart_rate"] = 1
-        elif HR > 160:
-            subscores["heart_rate"] = 3
-        elif HR > 140:
-            subscores["heart_rate"] = 2
-        elif HR > 130:
-            subscores["heart_rate"] = 1
-        else:
-            subscores["heart_rate"] = 0
-    elif age_months < 144:  # School Age 5-11 years
-        if HR < 70:
-            subscores["heart_rate"] = 3
-        elif HR < 80:
-            subscores["heart_rate"] = 2
-        elif HR < 90:
-            subscores["heart_rate"] = 1
-        elif HR > 140:
-            subscores["heart_rate"] = 3
-        elif HR > 130:
-            subscores["heart_rate"] = 2
-        elif HR > 120:
-            subscores["heart_rate"] = 1
-        else:
-            subscores["heart_rate"] = 0
-    else:  # Adolescent 12+ years
-        if HR < 60:
-            subscores["heart_rate"] = 3
-        elif HR < 65:
-            subscores["heart_rate"] = 2
-        elif HR < 70:
-            subscores["heart_rate"] = 1
-        elif HR > 130:
-            subscores["heart_rate"] = 3
-        elif HR > 120:
-            subscores["heart_rate"] = 2
-        elif HR > 110:
-            subscores["heart_rate"] = 1
-        else:
-            subscores["heart_rate"] = 0
+    # Initialize subscores
+    subscores: Dict[str, int] = {
+        "respiratory_rate": _QLD_RR_SCORERS[band](resp_rate),
+        "heart_rate": _QLD_HR_SCORERS[band](HR),
+    }
 
     # Score mental status
     subscores["mental_status"] = safe_get_from_map(mental_status, MENTAL_STATUS_MAP)
 
     # Score SpO2
     if SpO2 is not None:
-        if SpO2 < 85:
-            subscores["spo2"] = 3
-        elif SpO2 < 90:
-            subscores["spo2"] = 2
-        elif SpO2 < 94:
-            subscores["spo2"] = 1
-        else:
-            subscores["spo2"] = 0
+        subscores["spo2"] = (SpO2 < 94) + (SpO2 < 90) + (SpO2 < 85)
     else:
         subscores["spo2"] = 0  # Default if not provided
 
@@ -1094,8 +1178,12 @@ def calculate_queensland_non_trauma(
 
 
 def calculate_queensland_trauma(
-    mechanism=None, consciousness=None, airway=None, breathing=None, circulation=None
-):
+    mechanism: Optional[str] = None,
+    consciousness: Optional[str] = None,
+    airway: Optional[str] = None,
+    breathing: Optional[str] = None,
+    circulation: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Calculate the Queensland Pediatric Trauma Score
 
@@ -1114,18 +1202,23 @@ def calculate_queensland_trauma(
         Returns 'N/A' if critical parameters are missing.
     """
     # All parameters are required for this score
-    required_params = {
-        "mechanism": mechanism,
-        "consciousness": consciousness,
-        "airway": airway,
-        "breathing": breathing,
-        "circulation": circulation,
-    }
-
-    missing_params = [
-        param for param, value in required_params.items() if value is None
-    ]
-    if missing_params:
+    if (
+        mechanism is None
+        or consciousness is None
+        or airway is None
+        or breathing is None
+        or circulation is None
+    ):
+        required_params = {
+            "mechanism": mechanism,
+            "consciousness": consciousness,
+            "airway": airway,
+            "breathing": breathing,
+            "circulation": circulation,
+        }
+        missing_params = [
+            param for param, value in required_params.items() if value is None
+        ]
         return create_na_response(
             "Queensland Trauma",
             missing_params,
@@ -1134,83 +1227,24 @@ def calculate_queensland_trauma(
         )
 
     # Initialize subscores
-    subscores = {}
+    subscores: Dict[str, int] = {}
 
     # Score mechanism of injury
-    mechanism_map = {
-        "minor": 0,
-        "low energy": 0,
-        "isolated": 0,
-        "moderate": 1,
-        "medium energy": 1,
-        "severe": 2,
-        "high energy": 2,
-        "multiple": 2,
-        "high-energy": 2,
-        "critical": 3,
-        "very high energy": 3,
-        "extreme": 3,
-    }
-    subscores["mechanism"] = safe_get_from_map(mechanism, mechanism_map)
+    subscores["mechanism"] = safe_get_from_map(mechanism, _QLD_TRAUMA_MECHANISM_MAP)
 
     # Score consciousness
     subscores["consciousness"] = safe_get_from_map(consciousness, MENTAL_STATUS_MAP)
 
     # Score airway
-    airway_map = {
-        "clear": 0,
-        "patent": 0,
-        "normal": 0,
-        "maintainable": 1,
-        "requires support": 1,
-        "assisted": 1,
-        "unmaintainable": 2,
-        "compromised": 2,
-        "intervention required": 2,
-        "obstructed": 3,
-        "failed": 3,
-        "intubated": 3,
-    }
-    subscores["airway"] = safe_get_from_map(airway, airway_map)
+    subscores["airway"] = safe_get_from_map(airway, _QLD_TRAUMA_AIRWAY_MAP)
 
     # Score breathing
-    breathing_map = {
-        "normal": 0,
-        "comfortable": 0,
-        "regular": 0,
-        "unlabored": 0,
-        "distressed": 1,
-        "increased work": 1,
-        "mild increased work": 1,
-        "moderate work": 1,
-        "labored": 2,
-        "severe distress": 2,
-        "significant work": 2,
-        "retractions": 2,
-        "absent": 3,
-        "inadequate": 3,
-        "apneic": 3,
-        "failing": 3,
-    }
-    subscores["breathing"] = safe_get_from_map(breathing, breathing_map)
+    subscores["breathing"] = safe_get_from_map(breathing, _QLD_TRAUMA_BREATHING_MAP)
 
     # Score circulation
-    circulation_map = {
-        "normal": 0,
-        "good": 0,
-        "stable": 0,
-        "abnormal": 1,
-        "mild tachycardia": 1,
-        "delayed capillary refill": 1,
-        "unstable": 2,
-        "tachycardic": 2,
-        "poor perfusion": 2,
-        "decompensated": 3,
-        "shock": 3,
-        "absent pulses": 3,
-        "failure": 3,
-    }
-    subscores["circulation"] = safe_get_from_map(circulation, circulation_map)
+    subscores["circulation"] = safe_get_from_map(
+        circulation, _QLD_TRAUMA_CIRCULATION_MAP
+    )
 
     # Calculate total score
     total_score = sum(subscores.values())
@@ -1246,8 +1280,10 @@ def calculate_queensland_trauma(
 
 
 def calculate_tps(
-    respiratory_status=None, circulation_status=None, neurologic_status=None
-):
+    respiratory_status: Optional[Union[int, float, str]] = None,
+    circulation_status: Optional[Union[int, float, str]] = None,
+    neurologic_status: Optional[Union[int, float, str]] = None,
+) -> Dict[str, Any]:
     """
     Calculate the Transport Physiology Score (TPS)
 
@@ -1276,54 +1312,15 @@ def calculate_tps(
             include_interpretation=False,
         )
 
-    # Define maps for string inputs
-    respiratory_map = {
-        "normal": 0,
-        "stable": 0,
-        "no distress": 0,
-        "mild": 1,
-        "minor": 1,
-        "slight": 1,
-        "minimal distress": 1,
-        "moderate": 2,
-        "significant": 2,
-        "distressed": 2,
-        "moderate distress": 2,
-        "severe": 3,
-        "critical": 3,
-        "intubated": 3,
-        "respiratory failure": 3,
-        "severe distress": 3,
-    }
-
-    circulation_map = {
-        "normal": 0,
-        "stable": 0,
-        "good perfusion": 0,
-        "mild": 1,
-        "minor": 1,
-        "compensated": 1,
-        "mild tachycardia": 1,
-        "moderate": 2,
-        "significant": 2,
-        "compromised": 2,
-        "poor perfusion": 2,
-        "severe": 3,
-        "critical": 3,
-        "shock": 3,
-        "decompensated": 3,
-        "failure": 3,
-    }
-
     # Initialize subscores
-    subscores = {
+    subscores: Dict[str, int] = {
         "respiratory": (
-            parse_numeric_or_map(respiratory_status, respiratory_map)
+            parse_numeric_or_map(respiratory_status, _TPS_RESPIRATORY_MAP)
             if respiratory_status is not None
             else 0
         ),
         "circulation": (
-            parse_numeric_or_map(circulation_status, circulation_map)
+            parse_numeric_or_map(circulation_status, _TPS_CIRCULATION_MAP)
             if circulation_status is not None
             else 0
         ),
@@ -1357,16 +1354,205 @@ def calculate_tps(
     }
 
 
+_CHEWS_SUBSCORE_KEYS = (
+    "respiratory_rate",
+    "respiratory_effort",
+    "heart_rate",
+    "systolic_bp",
+    "capillary_refill",
+    "oxygen_therapy",
+    "oxygen_saturation",
+)
+
+
+# CHEWS alert level thresholds as (max score, alert level, action)
+_CHEWS_THRESHOLDS = (
+    (2, "Low Alert Level", "Routine care; reassess per unit standard"),
+    (
+        4,
+        "Medium Alert Level",
+        "Increase assessment frequency; consider medical review",
+    ),
+    (
+        6,
+        "High Alert Level",
+        "Urgent medical review required; consider PICU consult",
+    ),
+    (
+        999,
+        "Critical Alert Level",
+        "Immediate medical intervention; PICU consult/transfer indicated",
+    ),
+)
+
+
+class ChewsResult(Mapping):
+    """
+    Read-only CHEWS result that builds its nested dictionaries on demand
+
+    Supports the same keys as the dictionary returned by calculate_chews
+    (score, alert_level, action, subscores, normal_ranges). The subscores and
+    normal_ranges dictionaries are only materialized on first access.
+    """
+
+    __slots__ = (
+        "score",
+        "alert_level",
+        "action",
+        "_subs",
+        "_ranges",
+        "_subscores",
+        "_normal_ranges",
+    )
+
+    _KEYS = ("score", "alert_level", "action", "subscores", "normal_ranges")
+
+    def __init__(self, score, alert_level, action, subs, ranges):
+        self.score = score
+        self.alert_level = alert_level
+        self.action = action
+        self._subs = subs
+        self._ranges = ranges
+        self._subscores = None
+        self._normal_ranges = None
+
+    @property
+    def subscores(self) -> Dict[str, int]:
+        if self._subscores is None:
+            self._subscores = dict(zip(_CHEWS_SUBSCORE_KEYS, self._subs))
+        return self._subscores
+
+    @property
+    def normal_ranges(self) -> Dict[str, str]:
+        if self._normal_ranges is None:
+            hr_min, hr_max, rr_min, rr_max, normal_sbp = self._ranges
+            self._normal_ranges = {
+                "heart_rate": f"{hr_min}-{hr_max} bpm",
+                "respiratory_rate": f"{rr_min}-{rr_max} bpm",
+                "systolic_bp": f"~{int(normal_sbp)} mmHg",
+            }
+        return self._normal_ranges
+
+    def __getitem__(self, key):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+
+def _chews_score_fast(
+    respiratory_rate: float,
+    resp_effort_score: int,
+    heart_rate: float,
+    systolic_bp: Optional[float],
+    capillary_refill: Optional[float],
+    oxygen_therapy_score: int,
+    oxygen_saturation: Optional[float],
+    ranges: Tuple[int, int, int, int, float],
+) -> Tuple[Tuple[int, ...], int]:
+    """
+    Score the CHEWS vitals once parameters are validated and descriptors mapped
+
+    Kept free of validation and result assembly so the numeric path stays small.
+
+    Args:
+        respiratory_rate: Breaths per minute
+        resp_effort_score: Mapped respiratory effort subscore
+        heart_rate: Beats per minute
+        systolic_bp: Systolic blood pressure in mmHg, or None
+        capillary_refill: Time in seconds, or None
+        oxygen_therapy_score: Mapped oxygen therapy subscore
+        oxygen_saturation: SpO2 percentage, or None
+        ranges: (hr_min, hr_max, rr_min, rr_max, normal_sbp) for the patient's age
+
+    Returns:
+        Tuple of (subscores in _CHEWS_SUBSCORE_KEYS order, total score)
+    """
+    hr_min, hr_max, rr_min, rr_max, normal_sbp = ranges
+
+    # Presence of the optional vitals, computed once up front
+    flags = (
+        (systolic_bp is not None) << 0
+        | (capillary_refill is not None) << 1
+        | (oxygen_saturation is not None) << 2
+    )
+
+    # Score respiratory rate. The low and high threshold regions are disjoint,
+    # so summing the comparisons yields the same 0-3 subscore as a ladder.
+    resp_rate_score = (
+        (respiratory_rate < rr_min)
+        + (respiratory_rate < rr_min - 5)
+        + (respiratory_rate < rr_min - 10)
+        + (respiratory_rate > rr_max + 5)
+        + (respiratory_rate > rr_max + 10)
+        + (respiratory_rate > rr_max + 15)
+    )
+
+    # Score heart rate
+    hr_score = (
+        (heart_rate < hr_min)
+        + (heart_rate < hr_min - 10)
+        + (heart_rate < hr_min - 20)
+        + (heart_rate > hr_max + 10)
+        + (heart_rate > hr_max + 15)
+        + (heart_rate > hr_max + 20)
+    )
+
+    # Score systolic blood pressure
+    sbp_score = 0
+    if flags & 1:
+        sbp_score = (
+            (systolic_bp < normal_sbp - 5)
+            + (systolic_bp < normal_sbp - 10)
+            + (systolic_bp < normal_sbp - 20)
+        )
+
+    # Score capillary refill
+    cap_refill_score = 0
+    if flags & 2:
+        cap_refill_score = (
+            (capillary_refill > 2) + (capillary_refill > 3) + (capillary_refill > 4)
+        )
+
+    # Score oxygen saturation
+    o2_sat_score = 0
+    if flags & 4:
+        o2_sat_score = (
+            (oxygen_saturation < 93)
+            + (oxygen_saturation < 90)
+            + (oxygen_saturation < 85)
+        )
+
+    # Subscores in _CHEWS_SUBSCORE_KEYS order
+    subs = (
+        resp_rate_score,
+        resp_effort_score,
+        hr_score,
+        sbp_score,
+        cap_refill_score,
+        oxygen_therapy_score,
+        o2_sat_score,
+    )
+
+    return subs, sum(subs)
+
+
 def calculate_chews(
-    respiratory_rate=None,
-    respiratory_effort=None,
-    heart_rate=None,
-    systolic_bp=None,
-    capillary_refill=None,
-    oxygen_therapy=None,
-    oxygen_saturation=None,
-    age_months=None,
-):
+    respiratory_rate: Optional[float] = None,
+    respiratory_effort: Optional[str] = None,
+    heart_rate: Optional[float] = None,
+    systolic_bp: Optional[float] = None,
+    capillary_refill: Optional[float] = None,
+    oxygen_therapy: Optional[str] = None,
+    oxygen_saturation: Optional[float] = None,
+    age_months: Optional[float] = None,
+    lazy: bool = False,
+) -> Union[Dict[str, Any], "ChewsResult"]:
     """
     Calculate the Children's Hospital Early Warning Score (CHEWS)
 
@@ -1382,162 +1568,55 @@ def calculate_chews(
         oxygen_therapy: Type of oxygen support ('none', 'nasal cannula', etc.)
         oxygen_saturation: SpO2 percentage
         age_months: Age in months (for age-appropriate thresholds)
+        lazy: Return a ChewsResult whose subscores and normal_ranges are only
+            built when accessed, for screening passes that read just the score
 
     Returns:
         Dictionary with score, alert level, action recommendations, and subscores.
         Returns 'N/A' for score and all metrics if required parameters are missing.
     """
-    # Check for minimum required parameters
-    critical_params = {
-        "respiratory_rate": respiratory_rate,
-        "heart_rate": heart_rate,
-        "age_months": age_months,
-    }
-
-    # Define subscore keys for consistent NA responses
-    subscore_keys = [
-        "respiratory_rate",
-        "respiratory_effort",
-        "heart_rate",
-        "systolic_bp",
-        "capillary_refill",
-        "oxygen_therapy",
-        "oxygen_saturation",
-    ]
-
-    # Check for missing critical parameters
-    missing_critical = [
-        param for param, value in critical_params.items() if value is None
-    ]
-    if missing_critical:
-        response = create_na_response("CHEWS", missing_critical, subscore_keys)
+    # Check for missing critical parameters; the names and NA subscore keys are
+    # only built on the (uncommon) missing-data path
+    if respiratory_rate is None or heart_rate is None or age_months is None:
+        missing_critical = [
+            param
+            for param, value in (
+                ("respiratory_rate", respiratory_rate),
+                ("heart_rate", heart_rate),
+                ("age_months", age_months),
+            )
+            if value is None
+        ]
+        response = create_na_response("CHEWS", missing_critical, _CHEWS_SUBSCORE_KEYS)
         response["alert_level"] = "Cannot calculate: missing critical parameters"
         response["normal_ranges"] = {}
         return response
 
     # Get reference ranges for this age
-    ranges = get_age_based_ranges(age_months)
-    hr_min, hr_max = ranges["heart_rate"]
-    rr_min, rr_max = ranges["respiratory_rate"]
+    age_ranges = get_age_based_ranges(age_months)
+    hr_min, hr_max = age_ranges["heart_rate"]
+    rr_min, rr_max = age_ranges["respiratory_rate"]
 
     # Approximation of normal systolic BP by age
-    # Rule of thumb: 70 + (2 × age in years)
-    normal_sbp = 70 + (2 * (age_months / 12))
-
-    # Initialize subscores
-    subscores = {}
-
-    # Score respiratory rate
-    resp_rate_score = 0
-    if respiratory_rate < rr_min - 10:
-        resp_rate_score = 3
-    elif respiratory_rate < rr_min - 5:
-        resp_rate_score = 2
-    elif respiratory_rate < rr_min:
-        resp_rate_score = 1
-    elif respiratory_rate > rr_max + 15:
-        resp_rate_score = 3
-    elif respiratory_rate > rr_max + 10:
-        resp_rate_score = 2
-    elif respiratory_rate > rr_max + 5:
-        resp_rate_score = 1
-
-    subscores["respiratory_rate"] = resp_rate_score
-
-    # Score respiratory effort
-    subscores["respiratory_effort"] = safe_get_from_map(
-        respiratory_effort, RESPIRATORY_EFFORT_MAP
+    # Rule of thumb: 70 + (2 × age in years); 2.0 / 12.0 is folded to a
+    # constant at compile time, so this is a multiply rather than a divide
+    normal_sbp = 70.0 + age_months * (2.0 / 12.0)
+
+    ranges = (hr_min, hr_max, rr_min, rr_max, normal_sbp)
+
+    # Score the numeric vitals in the hot kernel
+    subs, total_score = _chews_score_fast(
+        respiratory_rate,
+        safe_get_from_map(respiratory_effort, RESPIRATORY_EFFORT_MAP),
+        heart_rate,
+        systolic_bp,
+        capillary_refill,
+        safe_get_from_map(oxygen_therapy, OXYGEN_THERAPY_MAP),
+        oxygen_saturation,
+        ranges,
     )
 
-    # Score heart rate
-    hr_score = 0
-    if heart_rate < hr_min - 20:
-        hr_score = 3
-    elif heart_rate < hr_min - 10:
-        hr_score = 2
-    elif heart_rate < hr_min:
-        hr_score = 1
-    elif heart_rate > hr_max + 20:
-        hr_score = 3
-    elif heart_rate > hr_max + 15:
-        hr_score = 2
-    elif heart_rate > hr_max + 10:
-        hr_score = 1
-
-    subscores["heart_rate"] = hr_score
-
-    # Score systolic blood pressure
-    sbp_score = 0
-    if systolic_bp is not None:
-        if systolic_bp < normal_sbp - 20:
-            sbp_score = 3
-        elif systolic_bp < normal_sbp - 10:
-            sbp_score = 2
-        elif systolic_bp < normal_sbp - 5:
-            sbp_score = 1
-
-    subscores["systolic_bp"] = sbp_score
-
-    # Score capillary refill
-    cap_refill_score = 0
-    if capillary_refill is not None:
-        if capillary_refill > 4:
-            cap_refill_score = 3
-        elif capillary_refill > 3:
-            cap_refill_score = 2
-        elif capillary_refill > 2:
-            cap_refill_score = 1
-
-    subscores["capillary_refill"] = cap_refill_score
-
-    # Score oxygen therapy
-    subscores["oxygen_therapy"] = safe_get_from_map(oxygen_therapy, OXYGEN_THERAPY_MAP)
-
-    # Score oxygen saturation
-    o2_sat_score = 0
-    if oxygen_saturation is not None:
-        if oxygen_saturation < 85:
-            o2_sat_score = 3
-        elif oxygen_saturation < 90:
-            o2_sat_score = 2
-        elif oxygen_saturation < 93:
-            o2_sat_score = 1
-
-    subscores["oxygen_saturation"] = o2_sat_score
+    alert_level, action = normalize_to_risk_level(total_score, _CHEWS_THRESHOLDS)
 
-    # Calculate total score
-    total_score = sum(subscores.values())
-
-    # Define alert level thresholds
-    chews_thresholds = [
-        (2, "Low Alert Level", "Routine care; reassess per unit standard"),
-        (
-            4,
-            "Medium Alert Level",
-            "Increase assessment frequency; consider medical review",
-        ),
-        (
-            6,
-            "High Alert Level",
-            "Urgent medical review required; consider PICU consult",
-        ),
-        (
-            999,
-            "Critical Alert Level",
-            "Immediate medical intervention; PICU consult/transfer indicated",
-        ),
-    ]
-
-    alert_level, action = normalize_to_risk_level(total_score, chews_thresholds)
-
-    return {
-        "score": total_score,
-        "alert_level": alert_level,
-        "action": action,
-        "subscores": subscores,
-        "normal_ranges": {
-            "heart_rate": f"{hr_min}-{hr_max} bpm",
-            "respiratory_rate": f"{rr_min}-{rr_max} bpm",
-            "systolic_bp": f"~{int(normal_sbp)} mmHg",
-        },
-    }
+    result = ChewsResult(total_score, alert_level, action, subs, ranges)
+    return result if lazy else dict(result)
@@ -8,9 +8,18 @@ This module integrates the pediatric scoring systems to determine appropriate ca
 and provide comprehensive severity assessments for transfer decisions.
 """
 
+import functools
 import logging
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from src.core.models import PatientData
 from src.core.scoring.pediatric import (
     calculate_cameo2,
@@ -22,296 +31,336 @@ from src.core.scoring.pediatric import (
     calculate_tps,
     calculate_trap,
 )
+from src.core.scoring.utils import NA, intern_keys
 
 logger = logging.getLogger(__name__)
 
+# Order of the vital sign values in the score cache key
+_VITAL_KEYS = (
+    "age_months",
+    "respiratory_rate",
+    "respiratory_effort",
+    "oxygen_requirement",
+    "oxygen_saturation",
+    "heart_rate",
+    "systolic_bp",
+    "diastolic_bp",
+    "gcs",
+    "mental_status",
+    "capillary_refill",
+    "weight_kg",
+)
+
+# Care level grades used by determine_care_level:
+# score key -> (label, ascending thresholds, (care level, risk) per threshold)
+_CARE_LEVEL_GRADES = intern_keys(
+    {
+        "pews": (
+            "PEWS",
+            (3, 5, 7),
+            (
+                ("Intermediate", "Medium Risk"),
+                ("PICU", "High Risk"),
+                ("PICU", "Critical Risk"),
+            ),
+        ),
+        "chews": (
+            "CHEWS",
+            (3, 5, 7),
+            (
+                ("Intermediate", "Medium Alert Level"),
+                ("PICU", "High Alert Level"),
+                ("PICU", "Critical Alert Level"),
+            ),
+        ),
+        "prism3": ("PRISM III", (10,), (("PICU", "High mortality risk"),)),
+        "queensland_trauma": (
+            "Queensland Trauma",
+            (9,),
+            (("PICU", "High/Critical Risk"),),
+        ),
+        "queensland_non_trauma": (
+            "Queensland Non-Trauma",
+            (7,),
+            (("PICU", "High/Critical Risk"),),
+        ),
+    }
+)
+
+# Clinical text keywords used by scan_patient
+_RESP_TERMS = ("respiratory effort", "work of breathing", "breathing effort")
+_RESP_DESCRIPTORS = ("normal", "mild", "moderate", "severe", "increased", "labored")
+_OXYGEN_TERMS = ("oxygen", "o2", "ventilat", "intubat", "nasal cannula", "high flow")
+# Oxygen support keywords in priority order, with the requirement they imply
+_OXYGEN_RULES = (
+    ("nasal cannula", "nasal cannula"),
+    ("low flow", "nasal cannula"),
+    ("high flow", "high flow"),
+    ("ventilat", "ventilator"),
+    ("intubat", "ventilator"),
+    ("room air", "none"),
+    ("no oxygen", "none"),
+)
+_STATUS_TERMS = ("alert", "voice", "pain", "unresponsive", "avpu")
+
+# Keywords that suggest trauma, read from the same keyword scan
+_TRAUMA_KEYWORDS = (
+    "trauma",
+    "accident",
+    "injury",
+    "fracture",
+    "collision",
+    "fall",
+    "mvc",
+    "motor vehicle",
+    "crash",
+    "assault",
+    "burn",
+    "blast",
+    "gunshot",
+    "stab",
+    "penetrating",
+    "blunt",
+    "wound",
+)
+
+_TEXT_KEYWORDS = (
+    ("respiratory effort is increased", "increased work of breathing")
+    + _RESP_TERMS
+    + _OXYGEN_TERMS
+    + ("low flow", "room air", "no oxygen")
+    + _STATUS_TERMS
+    + ("responds to voice", "responds to pain", "unconscious")
+    + ("gcs", "capillary refill")
+    + _TRAUMA_KEYWORDS
+)
 
-def extract_vital_signs(patient_data: PatientData) -> Dict[str, Any]:
+# Numbers following "gcs" / "capillary refill", matched at the keyword offset.
+# The windows match the number of characters previously scanned after each term.
+_GCS_VALUE_RE = re.compile(r"gcs\D{0,16}(\d+)")
+_CAPILLARY_REFILL_VALUE_RE = re.compile(r"capillary refill\D{0,13}?(\d*\.?\d+)")
+
+# Multi-pattern automaton over all keywords, when pyahocorasick is installed
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _TEXT_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, (len(_keyword) - 1, _keyword))
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+
+def _scan_keywords(text_lower: str) -> Dict[str, int]:
     """
-    Extract vital signs from patient data in a structured format suitable for scoring functions.
+    Find the first occurrence of every clinical text keyword.
+
+    Uses a single Aho-Corasick pass over the text when pyahocorasick is
+    available, otherwise one substring search per keyword.
 
     Args:
-        patient_data: The patient data object
+        text_lower: Lower-cased clinical text
 
     Returns:
-        Dictionary containing vital sign parameters
+        Dictionary mapping each keyword found to the index of its first occurrence
     """
-    # Initialize vital signs dictionary
-    vitals = {}
-
-    # Extract age from extracted_data if available
-    age_months = None
-    if "age_years" in patient_data.extracted_data:
-        age_years = patient_data.extracted_data.get("age_years")
-        if age_years is not None:
+    hits: Dict[str, int] = {}
+    if _KEYWORD_AUTOMATON is not None:
+        for end, (offset, keyword) in _KEYWORD_AUTOMATON.iter(text_lower):
+            if keyword not in hits:
+                hits[keyword] = end - offset
+    else:
+        for keyword in _TEXT_KEYWORDS:
+            idx = text_lower.find(keyword)
+            if idx >= 0:
+                hits[keyword] = idx
+    return hits
+
+
+def _coerce_float(*values: Any) -> Optional[float]:
+    """
+    Convert the first usable candidate value to a float.
+
+    Args:
+        *values: Candidate values in order of preference (None entries are skipped)
+
+    Returns:
+        The first value that converts to a float, or None
+    """
+    for value in values:
+        if value is not None:
             try:
-                age_months = float(age_years) * 12
+                return float(value)
             except (ValueError, TypeError):
                 pass
+    return None
+
 
-    if "age_months" in patient_data.extracted_data:
-        age_months_value = patient_data.extracted_data.get("age_months")
-        if age_months_value is not None:
+def _coerce_int(*values: Any) -> Optional[int]:
+    """
+    Convert the first usable candidate value to an int.
+
+    Args:
+        *values: Candidate values in order of preference (None entries are skipped)
+
+    Returns:
+        The first value that converts to an int, or None
+    """
+    for value in values:
+        if value is not None:
             try:
-                if age_months is not None:
-                    age_months += float(age_months_value)
-                else:
-                    age_months = float(age_months_value)
+                return int(value)
             except (ValueError, TypeError):
                 pass
+    return None
+
+
+def get_clinical_text(patient_data: PatientData) -> str:
+    """
+    Get the clinical text for a patient.
+
+    Args:
+        patient_data: The patient data object
+
+    Returns:
+        clinical_text, falling back to clinical_notes in extracted_data
+    """
+    return (
+        patient_data.clinical_text
+        or patient_data.extracted_data.get("clinical_notes")
+        or ""
+    )
+
+
+def scan_patient(
+    patient_data: PatientData, clinical_text: Optional[str] = None
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Extract vital signs and trauma status from patient data in one pass.
+
+    The clinical text is lower-cased and scanned for keywords once, and both
+    results are read from the same keyword hits.
+
+    Args:
+        patient_data: The patient data object
+        clinical_text: Clinical text already resolved with get_clinical_text
+
+    Returns:
+        Tuple of (vital sign parameters, True if trauma is detected)
+    """
+    # Structured values may sit at the top level or under "vital_signs"
+    extracted_data = patient_data.extracted_data
+    vital_signs = extracted_data.get("vital_signs")
+    if not isinstance(vital_signs, dict):
+        vital_signs = {}
+
+    # Extract age from extracted_data if available. age_months is either the
+    # total age or, when it is under a year, the months remainder alongside
+    # age_years ("2 years 6 months" is extracted as age_years=2, age_months=6)
+    age_months = _coerce_float(extracted_data.get("age_months"))
+    age_years = _coerce_float(extracted_data.get("age_years"))
+    if age_years is not None and (age_months is None or age_months < 12):
+        age_months = age_years * 12 + (age_months or 0.0)
 
     # Get clinical text from either clinical_text or clinical_notes in extracted_data
-    clinical_text = patient_data.clinical_text or ""
-    if not clinical_text and "clinical_notes" in patient_data.extracted_data:
-        clinical_text = patient_data.extracted_data.get("clinical_notes", "")
+    if clinical_text is None:
+        clinical_text = get_clinical_text(patient_data)
+
+    # Lower-case the clinical text once and find every keyword in a single pass;
+    # every text check below reads text_lower or keyword_hits
+    text_lower = clinical_text.lower()
+    keyword_hits: Dict[str, int] = _scan_keywords(text_lower) if text_lower else {}
 
     # Extract vital signs from extracted_data
-    respiratory_rate = None
-    if "respiratory_rate" in patient_data.extracted_data:
-        try:
-            respiratory_rate = float(patient_data.extracted_data["respiratory_rate"])
-        except (ValueError, TypeError):
-            pass
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "respiratory_rate" in patient_data.extracted_data["vital_signs"]
-    ):
-        try:
-            respiratory_rate = float(
-                patient_data.extracted_data["vital_signs"]["respiratory_rate"]
-            )
-        except (ValueError, TypeError):
-            pass
-
-    # Extract heart rate
-    heart_rate = None
-    if "heart_rate" in patient_data.extracted_data:
-        try:
-            heart_rate = float(patient_data.extracted_data["heart_rate"])
-        except (ValueError, TypeError):
-            pass
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "heart_rate" in patient_data.extracted_data["vital_signs"]
-    ):
-        try:
-            heart_rate = float(patient_data.extracted_data["vital_signs"]["heart_rate"])
-        except (ValueError, TypeError):
-            pass
-
-    # Extract blood pressure
-    systolic_bp = None
-    diastolic_bp = None
-    if "systolic_bp" in patient_data.extracted_data:
-        try:
-            systolic_bp = float(patient_data.extracted_data["systolic_bp"])
-        except (ValueError, TypeError):
-            pass
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "systolic_bp" in patient_data.extracted_data["vital_signs"]
-    ):
-        try:
-            systolic_bp = float(
-                patient_data.extracted_data["vital_signs"]["systolic_bp"]
-            )
-        except (ValueError, TypeError):
-            pass
-
-    if "diastolic_bp" in patient_data.extracted_data:
-        try:
-            diastolic_bp = float(patient_data.extracted_data["diastolic_bp"])
-        except (ValueError, TypeError):
-            pass
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "diastolic_bp" in patient_data.extracted_data["vital_signs"]
-    ):
-        try:
-            diastolic_bp = float(
-                patient_data.extracted_data["vital_signs"]["diastolic_bp"]
-            )
-        except (ValueError, TypeError):
-            pass
-
-    # Extract oxygen saturation
-    oxygen_saturation = None
-    if "oxygen_saturation" in patient_data.extracted_data:
-        try:
-            oxygen_saturation = float(patient_data.extracted_data["oxygen_saturation"])
-        except (ValueError, TypeError):
-            pass
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "oxygen_saturation" in patient_data.extracted_data["vital_signs"]
-    ):
-        try:
-            oxygen_saturation = float(
-                patient_data.extracted_data["vital_signs"]["oxygen_saturation"]
-            )
-        except (ValueError, TypeError):
-            pass
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "spo2" in patient_data.extracted_data["vital_signs"]
-    ):
-        try:
-            oxygen_saturation = float(
-                patient_data.extracted_data["vital_signs"]["spo2"]
-            )
-        except (ValueError, TypeError):
-            pass
+    respiratory_rate = _coerce_float(
+        extracted_data.get("respiratory_rate"), vital_signs.get("respiratory_rate")
+    )
+    heart_rate = _coerce_float(
+        extracted_data.get("heart_rate"), vital_signs.get("heart_rate")
+    )
+    systolic_bp = _coerce_float(
+        extracted_data.get("systolic_bp"), vital_signs.get("systolic_bp")
+    )
+    diastolic_bp = _coerce_float(
+        extracted_data.get("diastolic_bp"), vital_signs.get("diastolic_bp")
+    )
+    oxygen_saturation = _coerce_float(
+        extracted_data.get("oxygen_saturation"),
+        vital_signs.get("oxygen_saturation"),
+        vital_signs.get("spo2"),
+    )
 
     # Extract respiratory effort, oxygen requirement from clinical text
-    respiratory_effort = None
-    oxygen_requirement = None
+    respiratory_effort: Optional[str] = None
+    oxygen_requirement: Optional[str] = None
 
     # Simple parsing of respiratory effort
-    resp_terms = ["respiratory effort", "work of breathing", "breathing effort"]
     # First check if it's explicitly mentioned in the clinical text
     if (
-        "respiratory effort is increased" in clinical_text.lower()
-        or "increased work of breathing" in clinical_text.lower()
+        "respiratory effort is increased" in keyword_hits
+        or "increased work of breathing" in keyword_hits
     ):
         respiratory_effort = "increased"
     else:
         # More generic search
-        for term in resp_terms:
-            if term in clinical_text.lower():
-                text_lower = clinical_text.lower()
-                idx = text_lower.find(term)
-                if idx >= 0:
-                    # Check for common descriptors near the term
-                    window_text = text_lower[max(0, idx - 30) : idx + 40]
-                    for desc in [
-                        "normal",
-                        "mild",
-                        "moderate",
-                        "severe",
-                        "increased",
-                        "labored",
-                    ]:
-                        if desc in window_text:
-                            respiratory_effort = desc
-                            break
+        for term in _RESP_TERMS:
+            idx = keyword_hits.get(term)
+            if idx is not None:
+                # Check for common descriptors near the term
+                window_text = text_lower[max(0, idx - 30) : idx + 40]
+                for desc in _RESP_DESCRIPTORS:
+                    if desc in window_text:
+                        respiratory_effort = desc
+                        break
 
     # Simple parsing of oxygen requirement
-    oxygen_terms = ["oxygen", "o2", "ventilat", "intubat", "nasal cannula", "high flow"]
-    for term in oxygen_terms:
-        if term in clinical_text.lower():
-            text_lower = clinical_text.lower()
-            if "nasal cannula" in text_lower or "low flow" in text_lower:
-                oxygen_requirement = "nasal cannula"
-            elif "high flow" in text_lower:
-                oxygen_requirement = "high flow"
-            elif "ventilat" in text_lower or "intubat" in text_lower:
-                oxygen_requirement = "ventilator"
-            elif "room air" in text_lower or "no oxygen" in text_lower:
-                oxygen_requirement = "none"
-            break
+    if any(term in keyword_hits for term in _OXYGEN_TERMS):
+        for keyword, requirement in _OXYGEN_RULES:
+            if keyword in keyword_hits:
+                oxygen_requirement = requirement
+                break
 
     # Extract neurological parameters
-    gcs = None
-    if "gcs" in patient_data.extracted_data:
-        try:
-            gcs = int(patient_data.extracted_data["gcs"])
-        except (ValueError, TypeError):
-            pass
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "gcs" in patient_data.extracted_data["vital_signs"]
-    ):
-        try:
-            gcs = int(patient_data.extracted_data["vital_signs"]["gcs"])
-        except (ValueError, TypeError):
-            pass
-    else:
+    gcs = _coerce_int(extracted_data.get("gcs"), vital_signs.get("gcs"))
+    if gcs is None:
         # Try to extract from clinical text
-        if "gcs" in clinical_text.lower():
-            text_lower = clinical_text.lower()
-            idx = text_lower.find("gcs")
-            if idx >= 0:
-                # Look for a number after "gcs"
-                for i in range(idx + 3, min(idx + 20, len(text_lower))):
-                    if text_lower[i].isdigit():
-                        j = i
-                        while j < len(text_lower) and text_lower[j].isdigit():
-                            j += 1
-                        try:
-                            gcs = int(text_lower[i:j])
-                            break
-                        except ValueError:
-                            pass
+        idx = keyword_hits.get("gcs")
+        if idx is not None:
+            # Look for a number after "gcs"
+            match = _GCS_VALUE_RE.match(text_lower, idx)
+            if match:
+                gcs = int(match.group(1))
 
     # Extract mental status
-    mental_status = None
-    if "mental_status" in patient_data.extracted_data:
-        mental_status = patient_data.extracted_data["mental_status"]
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "mental_status" in patient_data.extracted_data["vital_signs"]
-    ):
-        mental_status = patient_data.extracted_data["vital_signs"]["mental_status"]
-    else:
+    mental_status = extracted_data.get("mental_status")
+    if mental_status is None:
+        mental_status = vital_signs.get("mental_status")
+    if mental_status is None:
         # Try to extract from clinical text
-        status_terms = ["alert", "voice", "pain", "unresponsive", "avpu"]
-        for term in status_terms:
-            if term in clinical_text.lower():
-                text_lower = clinical_text.lower()
-                if "alert" in text_lower:
-                    mental_status = "alert"
-                elif "voice" in text_lower or "responds to voice" in text_lower:
-                    mental_status = "voice"
-                elif "pain" in text_lower or "responds to pain" in text_lower:
-                    mental_status = "pain"
-                elif "unresponsive" in text_lower or "unconscious" in text_lower:
-                    mental_status = "unresponsive"
-                break
+        if any(term in keyword_hits for term in _STATUS_TERMS):
+            if "alert" in keyword_hits:
+                mental_status = "alert"
+            elif "voice" in keyword_hits or "responds to voice" in keyword_hits:
+                mental_status = "voice"
+            elif "pain" in keyword_hits or "responds to pain" in keyword_hits:
+                mental_status = "pain"
+            elif "unresponsive" in keyword_hits or "unconscious" in keyword_hits:
+                mental_status = "unresponsive"
 
     # Extract capillary refill
-    capillary_refill = None
-    if "capillary_refill" in patient_data.extracted_data:
-        try:
-            capillary_refill = float(patient_data.extracted_data["capillary_refill"])
-        except (ValueError, TypeError):
-            pass
-    elif (
-        "vital_signs" in patient_data.extracted_data
-        and "capillary_refill" in patient_data.extracted_data["vital_signs"]
-    ):
-        try:
-            capillary_refill = float(
-                patient_data.extracted_data["vital_signs"]["capillary_refill"]
-            )
-        except (ValueError, TypeError):
-            pass
-    else:
+    capillary_refill = _coerce_float(
+        extracted_data.get("capillary_refill"), vital_signs.get("capillary_refill")
+    )
+    if capillary_refill is None:
         # Try to extract from clinical text
-        if "capillary refill" in clinical_text.lower():
-            text_lower = clinical_text.lower()
-            idx = text_lower.find("capillary refill")
-            if idx >= 0:
-                # Look for a number after "capillary refill"
-                for i in range(idx + 15, min(idx + 30, len(text_lower))):
-                    if text_lower[i].isdigit() or text_lower[i] == ".":
-                        j = i
-                        while j < len(text_lower) and (
-                            text_lower[j].isdigit() or text_lower[j] == "."
-                        ):
-                            j += 1
-                        try:
-                            capillary_refill = float(text_lower[i:j])
-                            break
-                        except ValueError:
-                            pass
+        idx = keyword_hits.get("capillary refill")
+        if idx is not None:
+            # Look for a number after "capillary refill"
+            match = _CAPILLARY_REFILL_VALUE_RE.match(text_lower, idx)
+            if match:
+                capillary_refill = float(match.group(1))
 
     # Build and return the vitals dictionary
-    weight_kg = None
-    if "weight_kg" in patient_data.extracted_data:
-        try:
-            weight_kg = float(patient_data.extracted_data["weight_kg"])
-        except (ValueError, TypeError):
-            pass
+    weight_kg = _coerce_float(extracted_data.get("weight_kg"))
 
     vitals = {
         "age_months": age_months,
@@ -328,75 +377,86 @@ def extract_vital_signs(patient_data: PatientData) -> Dict[str, Any]:
         "weight_kg": weight_kg,
     }
 
-    return vitals
+    # Check for trauma keywords
+    is_trauma = any(keyword in keyword_hits for keyword in _TRAUMA_KEYWORDS)
+
+    return vitals, is_trauma
 
 
-def determine_trauma_status(patient_data: PatientData) -> bool:
+def extract_vital_signs(
+    patient_data: PatientData, clinical_text: Optional[str] = None
+) -> Dict[str, Any]:
     """
-    Determine if the patient is a trauma case based on clinical text.
+    Extract vital signs from patient data in a structured format suitable for scoring functions.
 
     Args:
         patient_data: The patient data object
+        clinical_text: Clinical text already resolved with get_clinical_text
 
     Returns:
-        True if trauma is detected, False otherwise
+        Dictionary containing vital sign parameters
     """
-    clinical_text = patient_data.clinical_text or ""
-    if not clinical_text and "clinical_notes" in patient_data.extracted_data:
-        clinical_text = patient_data.extracted_data.get("clinical_notes", "")
+    return scan_patient(patient_data, clinical_text)[0]
 
-    if not clinical_text:
-        return False
 
-    # Keywords that suggest trauma
-    trauma_keywords = [
-        "trauma",
-        "accident",
-        "injury",
-        "fracture",
-        "collision",
-        "fall",
-        "mvc",
-        "motor vehicle",
-        "crash",
-        "assault",
-        "burn",
-        "blast",
-        "gunshot",
-        "stab",
-        "penetrating",
-        "blunt",
-        "wound",
-    ]
-
-    text_lower = clinical_text.lower()
+def determine_trauma_status(
+    patient_data: PatientData, clinical_text: Optional[str] = None
+) -> bool:
+    """
+    Determine if the patient is a trauma case based on clinical text.
 
-    # Check for trauma keywords
-    for keyword in trauma_keywords:
-        if keyword in text_lower:
-            return True
+    Args:
+        patient_data: The patient data object
+        clinical_text: Clinical text already resolved with get_clinical_text
 
-    return False
+    Returns:
+        True if trauma is detected, False otherwise
+    """
+    return scan_patient(patient_data, clinical_text)[1]
 
 
-def calculate_all_scores(patient_data: PatientData) -> Dict[str, Any]:
+def calculate_all_scores(
+    patient_data: PatientData, clinical_text: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Calculate all applicable pediatric severity scores for a patient.
 
     Args:
         patient_data: The patient data object
+        clinical_text: Clinical text already resolved with get_clinical_text
 
     Returns:
         Dictionary containing all calculated scores and their details
     """
-    # Extract structured vital signs
-    vitals = extract_vital_signs(patient_data)
+    # Extract structured vital signs and determine if trauma case
+    vitals, is_trauma = scan_patient(patient_data, clinical_text)
+
+    # Scores depend only on the vitals and trauma status, so repeat calls with
+    # unchanged vitals are served from the cache. Callers get their own copy.
+    vitals_key = tuple(vitals[key] for key in _VITAL_KEYS)
+    try:
+        hash(vitals_key)
+    except TypeError:
+        # Unhashable structured values (e.g. a list for mental_status)
+        return _calculate_scores(vitals_key, is_trauma)
+    return _copy_scores(_calculate_scores_cached(vitals_key, is_trauma))
+
+
+def _calculate_scores(vitals_key: Tuple[Any, ...], is_trauma: bool) -> Dict[str, Any]:
+    """
+    Calculate all pediatric severity scores from a vitals fingerprint.
+
+    Args:
+        vitals_key: Vital sign values in _VITAL_KEYS order
+        is_trauma: Whether the patient is a trauma case
 
-    # Determine if trauma case
-    is_trauma = determine_trauma_status(patient_data)
+    Returns:
+        Dictionary containing all calculated scores and their details
+    """
+    vitals = dict(zip(_VITAL_KEYS, vitals_key))
 
     # Initialize results
-    scores = {}
+    scores: Dict[str, Any] = {}
 
     # Calculate PEWS score
     pews_result = calculate_pews(
@@ -469,13 +529,9 @@ def calculate_all_scores(patient_data: PatientData) -> Dict[str, Any]:
         )
         scores["queensland_non_trauma"] = qld_result
 
-    # Extract labs if available for PRISM III
+    # Labs for PRISM III would need more sophisticated parsing of the clinical
+    # text in a real implementation; for demonstration, we'll leave them empty
     labs = {}
-    clinical_text = patient_data.clinical_text or ""
-    if clinical_text:
-        # This would need more sophisticated parsing in a real implementation
-        # For demonstration, we'll leave labs empty
-        pass
 
     # Determine ventilation status
     ventilated = False
@@ -502,6 +558,50 @@ def calculate_all_scores(patient_data: PatientData) -> Dict[str, Any]:
     return scores
 
 
+_calculate_scores_cached = functools.lru_cache(maxsize=4096)(_calculate_scores)
+
+
+def _copy_scores(value: Any) -> Any:
+    """Copy the nested dicts and lists of a cached score result."""
+    if type(value) is dict:
+        return {key: _copy_scores(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_scores(item) for item in value]
+    return value
+
+
+def _grade_score(
+    scores: Dict[str, Any],
+    name: str,
+    care_levels: List[str],
+    justifications: List[str],
+) -> bool:
+    """
+    Add the care level and justification for a score from _CARE_LEVEL_GRADES.
+
+    Args:
+        scores: Dictionary of calculated severity scores
+        name: Key of the score to grade
+        care_levels: Care levels to append to
+        justifications: Justifications to append to
+
+    Returns:
+        True if the score was available to grade, False otherwise
+    """
+    result = scores.get(name)
+    if not isinstance(result, dict) or not isinstance(result.get("score"), int):
+        return False
+
+    score = result["score"]
+    label, thresholds, grades = _CARE_LEVEL_GRADES[name]
+    index = bisect_right(thresholds, score)
+    if index:
+        care_level, risk = grades[index - 1]
+        care_levels.append(care_level)
+        justifications.append(f"{label} score {score} ({risk})")
+    return True
+
+
 def determine_care_level(scores: Dict[str, Any]) -> Tuple[List[str], List[str]]:
     """
     Determine appropriate care level based on severity scores.
@@ -512,78 +612,32 @@ def determine_care_level(scores: Dict[str, Any]) -> Tuple[List[str], List[str]]:
     Returns:
         Tuple of (care_levels, justifications)
     """
-    care_levels = []
-    justifications = []
+    care_levels: List[str] = []
+    justifications: List[str] = []
 
     # Check PEWS score
-    if scores["pews"] != "N/A" and isinstance(scores["pews"]["score"], int):
-        pews_score = scores["pews"]["score"]
-        if pews_score >= 7:
-            care_levels.append("PICU")
-            justifications.append(f"PEWS score {pews_score} (Critical Risk)")
-        elif pews_score >= 5:
-            care_levels.append("PICU")
-            justifications.append(f"PEWS score {pews_score} (High Risk)")
-        elif pews_score >= 3:
-            care_levels.append("Intermediate")
-            justifications.append(f"PEWS score {pews_score} (Medium Risk)")
+    _grade_score(scores, "pews", care_levels, justifications)
 
     # Check TRAP score for transport considerations
-    if scores["trap"] != "N/A" and isinstance(scores["trap"]["score"], int):
-        trap_score = scores["trap"]["score"]
+    trap_score = scores["trap"]["score"]
+    if trap_score is not NA and isinstance(trap_score, int):
         trap_risk = scores["trap"]["risk_level"]
         if "Critical" in trap_risk or "High" in trap_risk:
             care_levels.append("PICU")
             justifications.append(f"TRAP score {trap_score} ({trap_risk})")
 
-    # Check CHEWS score
-    if scores["chews"] != "N/A" and isinstance(scores["chews"]["score"], int):
-        chews_score = scores["chews"]["score"]
-        if chews_score >= 7:
-            care_levels.append("PICU")
-            justifications.append(f"CHEWS score {chews_score} (Critical Alert Level)")
-        elif chews_score >= 5:
-            care_levels.append("PICU")
-            justifications.append(f"CHEWS score {chews_score} (High Alert Level)")
-        elif chews_score >= 3:
-            care_levels.append("Intermediate")
-            justifications.append(f"CHEWS score {chews_score} (Medium Alert Level)")
-
-    # Check PRISM III score
-    if scores["prism3"] != "N/A" and isinstance(scores["prism3"]["score"], int):
-        prism_score = scores["prism3"]["score"]
-        if prism_score >= 10:
-            care_levels.append("PICU")
-            justifications.append(
-                f"PRISM III score {prism_score} (High mortality risk)"
-            )
+    # Check CHEWS and PRISM III scores
+    _grade_score(scores, "chews", care_levels, justifications)
+    _grade_score(scores, "prism3", care_levels, justifications)
 
     # Check Queensland score
-    if (
-        "queensland_trauma" in scores
-        and scores["queensland_trauma"] != "N/A"
-        and isinstance(scores["queensland_trauma"]["score"], int)
-    ):
-        qld_score = scores["queensland_trauma"]["score"]
-        if qld_score >= 9:
-            care_levels.append("PICU")
-            justifications.append(
-                f"Queensland Trauma score {qld_score} (High/Critical Risk)"
-            )
-    elif (
-        "queensland_non_trauma" in scores
-        and scores["queensland_non_trauma"] != "N/A"
-        and isinstance(scores["queensland_non_trauma"]["score"], int)
-    ):
-        qld_score = scores["queensland_non_trauma"]["score"]
-        if qld_score >= 7:
-            care_levels.append("PICU")
-            justifications.append(
-                f"Queensland Non-Trauma score {qld_score} (High/Critical Risk)"
-            )
+    if not _grade_score(scores, "queensland_trauma", care_levels, justifications):
+        _grade_score(scores, "queensland_non_trauma", care_levels, justifications)
 
     # Determine NICU need based on age and scores
-    if scores["pews"] != "N/A" and "age_months" in scores["pews"].get("vitals", {}):
+    if scores["pews"]["score"] is not NA and "age_months" in scores["pews"].get(
+        "vitals", {}
+    ):
         age_months = scores["pews"]["vitals"]["age_months"]
         if age_months is not None and age_months < 1:  # Neonate
             care_levels.append("NICU")
@@ -593,11 +647,8 @@ def determine_care_level(scores: Dict[str, Any]) -> Tuple[List[str], List[str]]:
     if not care_levels:
         # Default to general care but check for any elevated scores
         any_elevated = False
-        if (
-            scores["pews"] != "N/A"
-            and isinstance(scores["pews"]["score"], int)
-            and scores["pews"]["score"] >= 2
-        ):
+        pews_score = scores["pews"]["score"]
+        if pews_score is not NA and isinstance(pews_score, int) and pews_score >= 2:
             any_elevated = True
 
         if any_elevated:
@@ -608,10 +659,7 @@ def determine_care_level(scores: Dict[str, Any]) -> Tuple[List[str], List[str]]:
             justifications.append("Low severity scores across all measures")
 
     # Remove duplicates while preserving order
-    unique_care_levels = []
-    for level in care_levels:
-        if level not in unique_care_levels:
-            unique_care_levels.append(level)
+    unique_care_levels = list(dict.fromkeys(care_levels))
 
     return unique_care_levels, justifications
 
@@ -627,7 +675,7 @@ def process_patient_scores(patient_data: PatientData) -> Dict[str, Any]:
         Dictionary with scores, care level recommendations, and justifications
     """
     # Calculate all applicable scores
-    scores = calculate_all_scores(patient_data)
+    scores = calculate_all_scores(patient_data, get_clinical_text(patient_data))
 
     # Determine care level based on scores
     care_levels, justifications = determine_care_level(scores)
@@ -640,3 +688,30 @@ def process_patient_scores(patient_data: PatientData) -> Dict[str, Any]:
     }
 
     return result
+
+
+def process_batch(
+    patients: List[PatientData],
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+) -> List[Dict[str, Any]]:
+    """
+    Process scores for many patients in parallel worker processes.
+
+    Patients are independent, so they are sent to a process pool in chunks.
+    Batches that fit in a single chunk, or a single worker, run in-process
+    to avoid the cost of starting the pool.
+
+    Args:
+        patients: The patient data objects
+        workers: Number of worker processes (defaults to the CPU count)
+        chunksize: Number of patients sent to a worker at a time
+
+    Returns:
+        List of process_patient_scores results, in patient order
+    """
+    if workers == 1 or len(patients) <= chunksize:
+        return [process_patient_scores(patient) for patient in patients]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(process_patient_scores, patients, chunksize=chunksize))
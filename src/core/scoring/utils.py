@@ -8,6 +8,8 @@ Utility functions and common code patterns used by pediatric severity scoring sy
 """
 
 import logging
+import sys
+from bisect import bisect_right
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
@@ -101,6 +103,52 @@ HEMODYNAMIC_MAP = {
 }
 
 
+class _NotAvailable(str):
+    """Type of NA, the marker for scores and fields that cannot be calculated
+
+    NA is a str equal to "N/A", so results compare, print and serialize exactly
+    as before, while checks inside the package can use the identity test
+    ``value is NA``.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        # Unpickle (e.g. from process_batch workers) to the same singleton
+        return "NA"
+
+
+NA = _NotAvailable("N/A")
+
+
+def intern_keys(mapping):
+    """Return a copy of a mapping dictionary with interned string keys
+
+    Lookups made with interned keys (see normalize_map_key) match on identity
+    before falling back to a full string comparison.
+
+    Args:
+        mapping: Dictionary mapping descriptors to scores
+
+    Returns:
+        Dictionary with the same items and interned keys
+    """
+    return {sys.intern(key): value for key, value in mapping.items()}
+
+
+RESPIRATORY_EFFORT_MAP = intern_keys(RESPIRATORY_EFFORT_MAP)
+OXYGEN_THERAPY_MAP = intern_keys(OXYGEN_THERAPY_MAP)
+MENTAL_STATUS_MAP = intern_keys(MENTAL_STATUS_MAP)
+BEHAVIOR_MAP = intern_keys(BEHAVIOR_MAP)
+HEMODYNAMIC_MAP = intern_keys(HEMODYNAMIC_MAP)
+
+
+# Sorted upper age bounds and matching ranges for bisect lookups. The bands in
+# AGE_BASED_RANGES are contiguous from 0 months.
+_AGE_BOUNDS = sorted(max_age for (_, max_age) in AGE_BASED_RANGES)
+_AGE_VALUES = [AGE_BASED_RANGES[band] for band in sorted(AGE_BASED_RANGES)]
+
+
 def get_age_based_ranges(age_months):
     """Get age-appropriate vital sign ranges
 
@@ -113,20 +161,45 @@ def get_age_based_ranges(age_months):
     if age_months is None:
         age_months = 60  # Default to 5 years if not specified
 
-    for (min_age, max_age), (
-        hr_min,
-        hr_max,
-        rr_min,
-        rr_max,
-    ) in AGE_BASED_RANGES.items():
-        if min_age <= age_months < max_age:
-            return {
-                "heart_rate": (hr_min, hr_max),
-                "respiratory_rate": (rr_min, rr_max),
-            }
+    index = bisect_right(_AGE_BOUNDS, age_months)
+    if age_months < 0 or index >= len(_AGE_VALUES):
+        # Default to adolescent values if age is outside ranges
+        return {"heart_rate": (60, 90), "respiratory_rate": (15, 20)}
+
+    hr_min, hr_max, rr_min, rr_max = _AGE_VALUES[index]
+    return {
+        "heart_rate": (hr_min, hr_max),
+        "respiratory_rate": (rr_min, rr_max),
+    }
+
+
+# Cache of raw descriptor -> normalized map key. Descriptors come from a small
+# clinical vocabulary, so this stays small; it is cleared at the cap so free
+# text cannot grow it without bound.
+_NORMALIZED_KEYS: Dict[str, str] = {}
+_NORMALIZED_KEYS_MAX_SIZE = 4096
 
-    # Default to adolescent values if age is outside ranges
-    return {"heart_rate": (60, 90), "respiratory_rate": (15, 20)}
+
+def normalize_map_key(value):
+    """Normalize a descriptor to the lower-cased, interned form used as map keys
+
+    This is the single normalization point for descriptor lookups. Repeated
+    descriptors are served from a cache instead of being lower-cased again.
+
+    Args:
+        value: Descriptor to normalize (non-string values are stringified)
+
+    Returns:
+        Interned lower-case string
+    """
+    key = value if type(value) is str else str(value)
+    normalized = _NORMALIZED_KEYS.get(key)
+    if normalized is None:
+        normalized = sys.intern(key.lower())
+        if len(_NORMALIZED_KEYS) >= _NORMALIZED_KEYS_MAX_SIZE:
+            _NORMALIZED_KEYS.clear()
+        _NORMALIZED_KEYS[key] = normalized
+    return normalized
 
 
 def safe_get_from_map(value, mapping, default=0):
@@ -142,7 +215,7 @@ def safe_get_from_map(value, mapping, default=0):
     """
     if value is None:
         return default
-    return mapping.get(str(value).lower(), default)
+    return mapping.get(normalize_map_key(value), default)
 
 
 def check_missing_params(required_params, critical_params=None):
@@ -191,7 +264,7 @@ def create_na_response(
         Dictionary with standardized N/A response
     """
     response = {
-        "score": "N/A",
+        "score": NA,
         "missing_parameters": missing_params,
     }
 
@@ -201,9 +274,9 @@ def create_na_response(
         )
 
     if include_action:
-        response["action"] = "N/A"
+        response["action"] = NA
 
-    response["subscores"] = {key: "N/A" for key in subscore_keys}
+    response["subscores"] = {key: NA for key in subscore_keys}
 
     return response
 
@@ -252,4 +325,4 @@ def parse_numeric_or_map(value, mapping, default=0, max_value=3):
         return min(max_value, max(0, int(numeric_value)))
     except (ValueError, TypeError):
         # Use the mapping
-        return mapping.get(str(value).lower(), default)
+        return mapping.get(normalize_map_key(value), default)
@@ -4,17 +4,184 @@ Hospital search functionality for the Transfer Center GUI.
 This module provides geolocation and hospital search capabilities.
 """
 
+import functools
+import hashlib
 import json
 import logging
+import os
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
-from geopy.geocoders import Nominatim
+from geopy.extra.rate_limiter import RateLimiter
+from geopy.geocoders import Nominatim, Photon
+from geopy.location import Location
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Minimum time, in seconds, between geocoding requests made while loading
+# hospitals from a public server. The public Nominatim usage policy allows at
+# most one request per second
+PUBLIC_GEOCODE_DELAY = 1.0
+
+# Concurrent geocoding requests when using a self-hosted geocoder, which has
+# no rate limit
+SELF_HOSTED_GEOCODE_WORKERS = 8
+
+GEOCODER_USER_AGENT = "transfer_center_app"
+
+# Coordinates of geocoded hospitals, kept between runs so startup does not
+# geocode the same addresses again
+GEOCODE_CACHE_PATH = Path("data/.hospital_geocode_cache.json")
+
+# Length of the substrings indexed for hospital search
+SEARCH_NGRAM_SIZE = 3
+
+# Number of geocoded search queries kept in memory
+GEOCODE_QUERY_CACHE_SIZE = 512
+
+
+def _geocode_key(hospital: Dict[str, str]) -> str:
+    """
+    Build the geocode cache key for a hospital.
+
+    The key covers both name and address, so changing a hospital's address
+    geocodes it again.
+
+    Args:
+        hospital: Hospital with "name" and "address" keys
+
+    Returns:
+        Stable hex digest of the hospital's name and address
+    """
+    text = f"{hospital['name']}\n{hospital['address']}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _iter_hospital_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the hospital records in a JSON array file.
+
+    With ijson installed, records are parsed one at a time, so a large
+    campus file (with its exclusion criteria) is never held in memory all
+    at once. Otherwise the whole file is loaded with json.
+
+    Args:
+        path: Path to a JSON file containing an array of hospital records
+
+    Yields:
+        Hospital records, in file order
+    """
+    with open(path, "rb") as f:
+        if ijson is not None:
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            yield from json.load(f)
+
+
+@functools.lru_cache(maxsize=GEOCODE_QUERY_CACHE_SIZE)
+def _geocode_query(geolocator: Any, query: str) -> Optional[Location]:
+    """
+    Geocode a search query, remembering the result.
+
+    Repeating a search (e.g. pressing Search again for the same text) is
+    answered without another network request. Errors are not cached, so a
+    query that timed out is tried again next time.
+
+    Args:
+        geolocator: Geocoder to use
+        query: Address or place to geocode
+
+    Returns:
+        The geocoded location, or None if nothing was found
+
+    Raises:
+        GeocoderTimedOut, GeocoderUnavailable: If the geocoder did not answer
+    """
+    return geolocator.geocode(query, timeout=5)
+
+
+def _build_geocoder() -> Tuple[Any, bool]:
+    """
+    Create the geocoder selected by the environment.
+
+    GEOCODER=photon uses Photon (PHOTON_URL, default photon.komoot.io).
+    Otherwise Nominatim is used, pointed at NOMINATIM_URL when set (e.g. a
+    local mediagis/nominatim container) instead of the public server.
+    NOMINATIM_SCHEME sets the scheme for NOMINATIM_URL (default "http").
+
+    Returns:
+        Tuple of (geocoder, whether it is self-hosted rather than a public
+        server)
+    """
+    if os.environ.get("GEOCODER", "nominatim").lower() == "photon":
+        domain = os.environ.get("PHOTON_URL")
+        geocoder = Photon(
+            user_agent=GEOCODER_USER_AGENT, domain=domain or "photon.komoot.io"
+        )
+        return geocoder, domain is not None
+
+    domain = os.environ.get("NOMINATIM_URL")
+    if domain:
+        geocoder = Nominatim(
+            user_agent=GEOCODER_USER_AGENT,
+            domain=domain,
+            scheme=os.environ.get("NOMINATIM_SCHEME", "http"),
+        )
+        return geocoder, True
+
+    return Nominatim(user_agent=GEOCODER_USER_AGENT), False
+
+
+class _HospitalCache(dict):
+    """
+    Hospital details keyed by name that records when it is changed.
+
+    HospitalSearch rebuilds its search index when `changed` is set, so every
+    way of adding, replacing or removing a hospital invalidates the index.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed = True
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.changed = True
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.changed = True
+
+    def clear(self):
+        super().clear()
+        self.changed = True
+
+    def pop(self, *args):
+        self.changed = True
+        return super().pop(*args)
+
+    def popitem(self):
+        self.changed = True
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self.changed = True
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.changed = True
+
 
 class HospitalSearch:
     """
@@ -23,9 +190,95 @@ class HospitalSearch:
 
     def __init__(self):
         """Initialize the hospital search module."""
-        self.geolocator = Nominatim(user_agent="transfer_center_app")
+        self.geolocator, self_hosted = _build_geocoder()
+        if self_hosted:
+            self._geocode = self.geolocator.geocode
+            self._geocode_workers = SELF_HOSTED_GEOCODE_WORKERS
+        else:
+            # Public servers are rate limited, so hospitals are geocoded one
+            # at a time with requests spaced out. Failures are not retried
+            # and reach _geocode_hospital, which skips the hospital
+            self._geocode = RateLimiter(
+                self.geolocator.geocode,
+                min_delay_seconds=PUBLIC_GEOCODE_DELAY,
+                max_retries=0,
+                swallow_exceptions=False,
+            )
+            self._geocode_workers = 1
         self.hospitals_cache = {}
+        self._cache_path = GEOCODE_CACHE_PATH
         self.load_hospitals()
+        self._build_search_index()
+
+    @property
+    def hospitals_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Cached hospital details keyed by hospital name."""
+        return self._hospitals_cache
+
+    @hospitals_cache.setter
+    def hospitals_cache(self, hospitals: Dict[str, Dict[str, Any]]) -> None:
+        self._hospitals_cache = _HospitalCache(hospitals)
+
+    def _build_search_index(self) -> None:
+        """
+        Index the cached hospitals for search_hospitals.
+
+        Lowercases each name and address once and maps every
+        SEARCH_NGRAM_SIZE-character substring to the hospitals containing it,
+        so a search only checks hospitals that share all of the query's
+        substrings instead of scanning the whole cache.
+        """
+        self._position: Dict[str, int] = {}
+        self._name_lower: Dict[str, str] = {}
+        self._addr_lower: Dict[str, str] = {}
+        self._token_index: Dict[str, Set[str]] = defaultdict(set)
+        self._hospitals_cache.changed = False
+
+        for position, (name, details) in enumerate(self.hospitals_cache.items()):
+            name_lower = name.lower()
+            addr_lower = (details.get("address", "") or "").lower()
+            self._position[name] = position
+            self._name_lower[name] = name_lower
+            self._addr_lower[name] = addr_lower
+            for text in (name_lower, addr_lower):
+                for i in range(len(text) - SEARCH_NGRAM_SIZE + 1):
+                    self._token_index[text[i : i + SEARCH_NGRAM_SIZE]].add(name)
+
+    def _find_cached_hospitals(self, query: str) -> List[str]:
+        """
+        Find cached hospitals whose name or address contains the query.
+
+        Args:
+            query: Lowercase text to search for
+
+        Returns:
+            Matching hospital names, in cache order
+        """
+        # Rebuild if hospitals were added, replaced or removed after indexing
+        if self._hospitals_cache.changed:
+            self._build_search_index()
+
+        if len(query) < SEARCH_NGRAM_SIZE:
+            # Too short to index: scan the precomputed lowercase text
+            candidates = self._position
+        else:
+            grams = {
+                query[i : i + SEARCH_NGRAM_SIZE]
+                for i in range(len(query) - SEARCH_NGRAM_SIZE + 1)
+            }
+            postings = sorted(
+                (self._token_index.get(gram, set()) for gram in grams), key=len
+            )
+            candidates = set.intersection(*postings)
+            if not candidates:
+                return []
+
+        matches = [
+            name
+            for name in candidates
+            if query in self._name_lower[name] or query in self._addr_lower[name]
+        ]
+        return sorted(matches, key=self._position.__getitem__)
 
     def load_hospitals(self) -> None:
         """Load hospital data from sample file and any additional sources."""
@@ -33,18 +286,14 @@ class HospitalSearch:
             # Load from sample hospital data
             hospital_path = Path("data/sample_hospital_campuses.json")
             if hospital_path.exists():
-                with open(hospital_path, "r") as f:
-                    hospitals_data = json.load(f)
-                    for hospital in hospitals_data:
-                        name = hospital.get("name", "Unknown")
-                        self.hospitals_cache[name] = {
-                            "latitude": hospital.get("location", {}).get("latitude", 0),
-                            "longitude": hospital.get("location", {}).get(
-                                "longitude", 0
-                            ),
-                            "address": hospital.get("address", ""),
-                            "campus_id": hospital.get("campus_id", ""),
-                        }
+                for hospital in _iter_hospital_records(hospital_path):
+                    name = hospital.get("name", "Unknown")
+                    self.hospitals_cache[name] = {
+                        "latitude": hospital.get("location", {}).get("latitude", 0),
+                        "longitude": hospital.get("location", {}).get("longitude", 0),
+                        "address": hospital.get("address", ""),
+                        "campus_id": hospital.get("campus_id", ""),
+                    }
 
             # Load additional common hospitals in Texas for the demo
             texas_hospitals = [
@@ -82,37 +331,113 @@ class HospitalSearch:
                 },
             ]
 
-            # Geocode these hospitals if not already in cache
+            # Geocode these hospitals if not already in cache, reusing
+            # coordinates saved by earlier runs
+            geocode_cache = self._load_geocode_cache()
+            to_geocode = []
             for hospital in texas_hospitals:
-                if hospital["name"] not in self.hospitals_cache:
-                    # Try to geocode the address
-                    try:
-                        location = self.geolocator.geocode(
-                            hospital["address"], timeout=5
-                        )
-                        if location:
-                            self.hospitals_cache[hospital["name"]] = {
-                                "latitude": location.latitude,
-                                "longitude": location.longitude,
-                                "address": hospital["address"],
-                                "campus_id": "",  # External hospital, no campus ID
-                            }
-                    except (GeocoderTimedOut, GeocoderUnavailable) as e:
-                        logger.warning(
-                            f"Could not geocode {hospital['name']}: {str(e)}"
-                        )
+                if hospital["name"] in self.hospitals_cache:
+                    continue
+                cached = geocode_cache.get(_geocode_key(hospital))
+                if cached:
+                    self.hospitals_cache[hospital["name"]] = {
+                        "latitude": cached["latitude"],
+                        "longitude": cached["longitude"],
+                        "address": hospital["address"],
+                        "campus_id": "",  # External hospital, no campus ID
+                    }
+                else:
+                    to_geocode.append(hospital)
+
+            # Each lookup is a network round-trip, so a self-hosted geocoder
+            # is sent several at once
+            if to_geocode:
+                with ThreadPoolExecutor(
+                    max_workers=min(self._geocode_workers, len(to_geocode))
+                ) as executor:
+                    locations = list(executor.map(self._geocode_hospital, to_geocode))
+                for hospital, location in zip(to_geocode, locations):
+                    if location:
+                        self.hospitals_cache[hospital["name"]] = {
+                            "latitude": location.latitude,
+                            "longitude": location.longitude,
+                            "address": hospital["address"],
+                            "campus_id": "",  # External hospital, no campus ID
+                        }
+                        geocode_cache[_geocode_key(hospital)] = {
+                            "latitude": location.latitude,
+                            "longitude": location.longitude,
+                        }
+                if any(locations):
+                    self._save_geocode_cache(geocode_cache)
 
             logger.info(f"Loaded {len(self.hospitals_cache)} hospitals")
 
         except Exception as e:
             logger.error(f"Error loading hospitals: {str(e)}")
 
-    def search_hospitals(self, query: str) -> List[Dict]:
+    def _load_geocode_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load saved hospital coordinates.
+
+        Returns:
+            Coordinates keyed by _geocode_key, or an empty dict if there are none
+        """
+        try:
+            with open(self._cache_path, "r") as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable geocode cache: {str(e)}")
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_geocode_cache(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Save hospital coordinates for later runs.
+
+        The file is written to a temporary file and then renamed, so a
+        crash mid-write never leaves a truncated cache behind.
+
+        Args:
+            cache: Coordinates keyed by _geocode_key
+        """
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self._cache_path.parent, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(cache, f, indent=2)
+            os.replace(f.name, self._cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save geocode cache: {str(e)}")
+
+    def _geocode_hospital(self, hospital: Dict[str, str]) -> Optional[Location]:
+        """
+        Geocode a hospital's address.
+
+        Args:
+            hospital: Hospital with "name" and "address" keys
+
+        Returns:
+            The geocoded location, or None if geocoding failed
+        """
+        try:
+            return self._geocode(hospital["address"], timeout=5)
+        except (GeocoderTimedOut, GeocoderUnavailable) as e:
+            logger.warning(f"Could not geocode {hospital['name']}: {str(e)}")
+            return None
+
+    def search_hospitals(self, query: str, geocode: bool = True) -> List[Dict]:
         """
         Search for hospitals by name or address.
 
         Args:
             query: Hospital name or address to search for
+            geocode: Whether to geocode the query as an address when no cached
+                hospital matches. Disable for search-as-you-type, which must
+                not send a geocoding request per keystroke
 
         Returns:
             List of matching hospitals with their details
@@ -121,24 +446,22 @@ class HospitalSearch:
         results = []
 
         # Search in cache first
-        for name, details in self.hospitals_cache.items():
-            if query in name.lower() or (
-                details.get("address", "") and query in details["address"].lower()
-            ):
-                results.append(
-                    {
-                        "name": name,
-                        "latitude": details["latitude"],
-                        "longitude": details["longitude"],
-                        "address": details.get("address", ""),
-                        "campus_id": details.get("campus_id", ""),
-                    }
-                )
+        for name in self._find_cached_hospitals(query):
+            details = self.hospitals_cache[name]
+            results.append(
+                {
+                    "name": name,
+                    "latitude": details["latitude"],
+                    "longitude": details["longitude"],
+                    "address": details.get("address", ""),
+                    "campus_id": details.get("campus_id", ""),
+                }
+            )
 
         # If no results and query is long enough, try geocoding as an address
-        if not results and len(query) > 5:
+        if geocode and not results and len(query) > 5:
             try:
-                location = self.geolocator.geocode(query, timeout=5)
+                location = _geocode_query(self.geolocator, query)
                 if location:
                     results.append(
                         {
@@ -165,7 +488,7 @@ class HospitalSearch:
             Tuple of (latitude, longitude) or (None, None) if geocoding failed
         """
         try:
-            location = self.geolocator.geocode(address, timeout=5)
+            location = _geocode_query(self.geolocator, address)
             if location:
                 return location.latitude, location.longitude
             return None, None
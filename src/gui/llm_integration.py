@@ -5,19 +5,455 @@ This module handles the integration with local LLM services through LM Studio's
 OpenAI-compatible API for text classification and information extraction.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
+import threading
+import time
 import traceback
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
 
+import httpx
 import openai
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.llm.classification import parse_patient_text
+from src.llm.utils import JsonStreamScanner, extract_json_text
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Connection pool for the LLM API. The chain sends several requests at once
+# and batch runs many more, so keep enough warm keep-alive sockets for all of
+# them instead of letting requests queue behind the pool
+HTTP_MAX_CONNECTIONS = 64
+HTTP_KEEPALIVE_EXPIRY = 30.0
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Retries of a request that was rate limited or could not connect. The OpenAI
+# client waits an exponentially growing, jittered delay between attempts
+HTTP_MAX_RETRIES = 3
+
+# Clients shared by every classifier, keyed by API URL and event loop, so a
+# classifier rebuilt on a settings change reuses the warm connection pool.
+# Pooled connections are bound to the loop they were opened on, so each loop
+# gets its own client and clients of closed loops are dropped
+_CLIENT_POOL: Dict[Tuple[str, asyncio.AbstractEventLoop], openai.AsyncOpenAI] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# The sync entry points of every classifier run on this loop, which is never
+# closed, so their clients keep their connections between calls
+_SYNC_LOOP = asyncio.new_event_loop()
+_SYNC_LOOP_LOCK = threading.Lock()
+
+# Exclusion criteria evaluated by the prompt chain. They are loaded once and
+# only reloaded when the file's modification time changes
+EXCLUSION_CRITERIA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "data",
+    "exclusion_criteria_clean.json",
+)
+
+# Seconds the model list from the API is reused before it is fetched again
+MODELS_CACHE_TTL = 30.0
+
+# Number of parsed LLM responses kept per classifier
+RESPONSE_CACHE_SIZE = 256
+
+# Token budget for one vignette's combined chain response
+COMBINED_MAX_TOKENS = 2400
+
+# Vignettes packed into each request by process_texts
+DEFAULT_ROWS_PER_CALL = 8
+
+# Requests process_texts keeps in flight at once, so a long worklist does not
+# overwhelm a local LLM server
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Instructions and response structure shared by the single-vignette and
+# batched combined chain prompts
+COMBINED_CHAIN_STEPS = """in four steps, thinking step-by-step, and only use information that is explicitly mentioned in the text:
+        1. Extract all relevant clinical information.
+        2. Assess what medical specialties might be needed, with a likelihood score (0-100) and supporting evidence.
+        3. Evaluate the numbered exclusion criteria for transfer, listing only those likely met or uncertain.
+        4. Synthesize steps 1-3 and recommend an appropriate care level.
+"""
+COMBINED_RESULT_FORMAT = """        {
+          "entities": {
+            "symptoms": [list of symptoms mentioned],
+            "medical_problems": [list of medical problems or conditions mentioned],
+            "medications": [list of medications mentioned],
+            "vital_signs": {dictionary of vital signs with values},
+            "demographics": {
+              "age": patient age if mentioned,
+              "weight": patient weight if mentioned (in kg),
+              "sex": patient sex if mentioned
+            },
+            "medical_history": relevant past medical history,
+            "clinical_context": additional clinical context like location, transport mode
+          },
+          "specs": [
+            {
+              "spec": "name of the specialty",
+              "score": numerical score from 0-100 indicating confidence,
+              "why": "brief evidence for why this specialty is needed"
+            },
+            {...}
+          ],
+          "excl": [
+            {
+              "id": "number of the exclusion rule",
+              "status": "one of: 'likely_met', 'uncertain'",
+              "score": numerical confidence score from 0-100,
+              "ev": "brief evidence for this status determination"
+            },
+            {...}
+          ],
+          "rec": {
+            "level": "one of: 'General', 'ICU', 'PICU', 'NICU'",
+            "score": numerical confidence score from 0-100,
+            "why": "brief explanation of the overall recommendation"
+          }
+        }
+        """
+
+# Decodes the JSON object at the start of a response without scanning past it
+_JSON_DECODER = json.JSONDecoder()
+
+# orjson is several times faster for the prompt inputs and cached responses.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so handlers are unchanged
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> str:
+    """
+    Serialize an object to compact JSON for a prompt.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        JSON text without whitespace between items
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+class _ResponseModel(BaseModel):
+    """Base for the JSON schemas the LLM's responses are constrained to."""
+
+    model_config = ConfigDict(
+        # Every field is listed as required in the schema sent to the server,
+        # so the model always writes it, while validation still accepts
+        # omissions
+        json_schema_serialization_defaults_required=True,
+        json_schema_extra={"additionalProperties": False},
+        # Long keys are sent to the server as short aliases, since every
+        # repeated key is a generated token. Results keep the descriptive
+        # field names
+        populate_by_name=True,
+        # Servers that ignore response_format write e.g. numeric ids, so
+        # numbers are accepted where the schema asks for text
+        coerce_numbers_to_str=True,
+    )
+
+
+class Demographics(_ResponseModel):
+    """Patient demographics mentioned in a vignette."""
+
+    age: Optional[Union[str, float]] = Field(None, description="Patient age")
+    weight: Optional[Union[str, float]] = Field(None, description="Weight in kg")
+    sex: Optional[str] = Field(None, description="Patient sex")
+
+
+class ClinicalEntities(_ResponseModel):
+    """Clinical information extracted from a vignette (step 1)."""
+
+    symptoms: List[str] = Field(default_factory=list)
+    medical_problems: List[str] = Field(default_factory=list)
+    medications: List[str] = Field(default_factory=list)
+    vital_signs: Dict[str, Any] = Field(default_factory=dict)
+    demographics: Demographics = Field(default_factory=Demographics)
+    medical_history: Optional[Union[str, List[str]]] = None
+    clinical_context: Optional[Union[str, List[str]]] = None
+
+
+class SpecialtyNeed(_ResponseModel):
+    """A specialty the patient may need."""
+
+    specialty_name: str = Field(..., alias="spec")
+    likelihood_score: float = Field(..., alias="score", ge=0, le=100)
+    supporting_evidence: str = Field("", alias="why")
+
+
+class SpecialtyAssessment(_ResponseModel):
+    """Specialty needs for the patient (step 2)."""
+
+    identified_specialties_needed: List[SpecialtyNeed] = Field(
+        default_factory=list, alias="specs"
+    )
+
+
+class ExclusionCheck(_ResponseModel):
+    """Evaluation of one exclusion criterion."""
+
+    # The rule text is filled in from the numbered list rather than generated
+    exclusion_rule_id: str = Field(..., alias="id")
+    status: Literal["likely_met", "likely_not_met", "uncertain"]
+    confidence_score: float = Field(..., alias="score", ge=0, le=100)
+    evidence_from_vignette: str = Field("", alias="ev")
+
+
+class ExclusionEvaluation(_ResponseModel):
+    """Exclusion criteria evaluation for the patient (step 3)."""
+
+    exclusion_criteria_evaluation: List[ExclusionCheck] = Field(
+        default_factory=list, alias="excl"
+    )
+
+
+class Recommendation(_ResponseModel):
+    """Final care level recommendation (step 4)."""
+
+    recommended_care_level: Literal["General", "ICU", "PICU", "NICU"] = Field(
+        ..., alias="level"
+    )
+    confidence: float = Field(50, alias="score", ge=0, le=100)
+    explanation: str = Field("", alias="why")
+
+
+class CombinedChainResult(_ResponseModel):
+    """Results of all four steps from a single combined chain call."""
+
+    extracted_clinical_entities: ClinicalEntities = Field(..., alias="entities")
+    identified_specialties_needed: List[SpecialtyNeed] = Field(..., alias="specs")
+    exclusion_criteria_evaluation: List[ExclusionCheck] = Field(..., alias="excl")
+    final_recommendation: Recommendation = Field(..., alias="rec")
+
+
+# Vital signs for the rule-based fallback. Each alternative is a lookahead,
+# so every position is tried against every vital in a single scan. The
+# vitals' labels start with different letters, so at most one can match at
+# a position and the first match of each is the same as a separate search
+_VITALS_RE = re.compile(
+    r"(?=(?:HR|heart rate|pulse)[:\s]*(?P<hr>[0-9]{2,3})\b"
+    r"|(?:BP|blood pressure)[:\s]*(?P<bp_systolic>[0-9]{2,3})[\s/]*"
+    r"(?P<bp_diastolic>[0-9]{2,3})\b"
+    r"|(?:RR|resp|respiratory rate)[:\s]*(?P<rr>[0-9]{1,2})\b"
+    r"|(?:O2|SpO2|oxygen|sat)[:\s]*(?P<o2>[0-9]{1,3})\s*%?\b"
+    r"|(?:T|temp|temperature)[:\s]*(?P<temp>[0-9]{2}(?:\.[0-9])?)\s*(?:C|F)?\b)",
+    re.IGNORECASE,
+)
+
+# Common pediatric conditions checked for by the rule-based fallback
+PEDIATRIC_KEYWORDS = (
+    "bronchiolitis",
+    "rsv",
+    "pneumonia",
+    "asthma",
+    "croup",
+    "febrile",
+    "sepsis",
+    "dehydration",
+    "seizure",
+    "trauma",
+    "fracture",
+    "respiratory distress",
+    "failure to thrive",
+    "intubation",
+    "ventilator",
+    "shock",
+    "meningitis",
+)
+
+# Single-pass automaton over the pediatric keywords, when pyahocorasick is
+# installed
+if ahocorasick is not None:
+    _PEDIATRIC_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in PEDIATRIC_KEYWORDS:
+        _PEDIATRIC_AUTOMATON.add_word(_keyword, _keyword)
+    _PEDIATRIC_AUTOMATON.make_automaton()
+else:
+    _PEDIATRIC_AUTOMATON = None
+
+
+def _scan_pediatric_keywords(text_lower: str) -> List[str]:
+    """
+    Find the pediatric keywords that occur in a text.
+
+    Uses a single Aho-Corasick pass over the text when pyahocorasick is
+    available, otherwise one substring search per keyword.
+
+    Args:
+        text_lower: Lower-cased clinical text
+
+    Returns:
+        The keywords found, in the order of PEDIATRIC_KEYWORDS
+    """
+    if _PEDIATRIC_AUTOMATON is None:
+        return [keyword for keyword in PEDIATRIC_KEYWORDS if keyword in text_lower]
+    found = {keyword for _, keyword in _PEDIATRIC_AUTOMATON.iter(text_lower)}
+    return [keyword for keyword in PEDIATRIC_KEYWORDS if keyword in found]
+
+
+# Keywords that suggest a care level in the rule-based fallback, in priority
+# order: any neonatal term beats PICU, which beats any ICU term
+CARE_LEVEL_KEYWORDS = (
+    ("nicu", "NICU"),
+    ("newborn", "NICU"),
+    ("neonate", "NICU"),
+    ("premature", "NICU"),
+    ("picu", "PICU"),
+    ("pediatric icu", "PICU"),
+    ("icu", "ICU"),
+    ("intensive care", "ICU"),
+    ("respiratory distress", "ICU"),
+    ("intubated", "ICU"),
+    ("ventilator", "ICU"),
+    ("shock", "ICU"),
+    ("sepsis", "ICU"),
+)
+_CARE_LEVEL_PRIORITY = {"General": 0, "ICU": 1, "PICU": 2, "NICU": 3}
+
+# Single-pass automaton over the care level keywords, when pyahocorasick is
+# installed
+if ahocorasick is not None:
+    _CARE_LEVEL_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _care_level in CARE_LEVEL_KEYWORDS:
+        _CARE_LEVEL_AUTOMATON.add_word(
+            _keyword, (_CARE_LEVEL_PRIORITY[_care_level], _care_level)
+        )
+    _CARE_LEVEL_AUTOMATON.make_automaton()
+else:
+    _CARE_LEVEL_AUTOMATON = None
+
+
+def _scan_care_level(text_lower: str) -> str:
+    """
+    Find the highest care level suggested by keywords in a text.
+
+    Uses a single Aho-Corasick pass over the text when pyahocorasick is
+    available, otherwise one substring search per keyword in priority order.
+    Either way the search stops as soon as a NICU keyword is found.
+
+    Args:
+        text_lower: Lower-cased clinical text
+
+    Returns:
+        The care level of the highest priority keyword found, or "General"
+    """
+    if _CARE_LEVEL_AUTOMATON is None:
+        # A stdlib alternation regex over the keywords tries every alternative
+        # at every position and is slower than these C substring searches,
+        # which also stop at the first (highest priority) hit
+        for keyword, care_level in CARE_LEVEL_KEYWORDS:
+            if keyword in text_lower:
+                return care_level
+        return "General"
+    priority, care_level = 0, "General"
+    for _, (match_priority, match_level) in _CARE_LEVEL_AUTOMATON.iter(text_lower):
+        if match_priority > priority:
+            priority, care_level = match_priority, match_level
+            # Nothing outranks a neonatal term, so stop scanning
+            if priority == _CARE_LEVEL_PRIORITY["NICU"]:
+                break
+    return care_level
+
+
+# Care levels a human suggestion can set on a result, highest priority first
+_SUGGESTED_CARE_LEVELS = ("NICU", "PICU", "ICU")
+
+
+def _highest_suggested_care_level(care_levels: List[str]) -> Optional[str]:
+    """
+    Pick the highest priority care level from a human suggestion.
+
+    Args:
+        care_levels: Care levels suggested by the user
+
+    Returns:
+        "NICU", "PICU" or "ICU", or None if none of them was suggested
+    """
+    suggested = set(care_levels)
+    return next((level for level in _SUGGESTED_CARE_LEVELS if level in suggested), None)
+
+
+def _parse_vital(value: Optional[str]) -> Optional[int]:
+    """
+    Parse an integer vital sign such as "150" or "92%".
+
+    Args:
+        value: The vital sign as extracted from the text
+
+    Returns:
+        The value as an int, or None if it is missing or not an integer
+    """
+    try:
+        return int(value.rstrip("%"))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _vitals_critical(vital_signs: Dict[str, str]) -> bool:
+    """
+    Check extracted vital signs for an extreme heart rate or low saturation.
+
+    Args:
+        vital_signs: Vital signs as extracted by the rule-based fallback
+
+    Returns:
+        True if the heart rate is outside 60-180 or the oxygen saturation
+        is below 90%
+    """
+    hr = _parse_vital(vital_signs.get("hr"))
+    o2 = _parse_vital(vital_signs.get("o2"))
+    return (hr is not None and not 60 <= hr <= 180) or (o2 is not None and o2 < 90)
+
+
+def _extract_json(response_content: str) -> Optional[Tuple[Any, str]]:
+    """
+    Parse the first JSON object in an LLM response.
+
+    Decodes directly from the first '{', stopping where the object ends, so
+    surrounding prose and code fences are never scanned by a regex.
+
+    Args:
+        response_content: Text of the LLM response
+
+    Returns:
+        Tuple of (parsed object, its JSON text), or None if the response
+        contains no object
+
+    Raises:
+        ValueError: If the object is not valid JSON
+    """
+    start = response_content.find("{")
+    if start == -1:
+        return None
+    try:
+        result, end = _JSON_DECODER.raw_decode(response_content, start)
+        return result, response_content[start:end]
+    except ValueError:
+        # Output cut off by the token limit; close the open strings and brackets
+        json_str = extract_json_text(response_content)
+        return _json_loads(json_str), json_str
+
 
 class LLMClassifier:
     """
@@ -28,6 +464,44 @@ class LLMClassifier:
     is compatible with the OpenAI API format.
     """
 
+    # Keywords suggesting each specialty may be needed
+    SPECIALTY_INDICATORS = {
+        "cardiology": ["heart", "cardiac", "chest pain", "arrhythmia", "murmur"],
+        "neurology": ["seizure", "stroke", "headache", "neurological", "brain"],
+        "pulmonology": ["respiratory", "breathing", "asthma", "pneumonia", "lungs"],
+        "neonatology": ["newborn", "premature", "neonate", "NICU"],
+        "orthopedics": ["fracture", "bone", "joint", "sprain", "musculoskeletal"],
+        "gastroenterology": [
+            "abdominal pain",
+            "vomiting",
+            "diarrhea",
+            "GI bleed",
+            "liver",
+        ],
+        "endocrinology": ["diabetes", "thyroid", "hormone", "glucose"],
+        "infectious disease": ["infection", "sepsis", "meningitis", "cellulitis"],
+        "hematology/oncology": [
+            "cancer",
+            "leukemia",
+            "anemia",
+            "bleeding",
+            "oncology",
+        ],
+        "psychiatry": [
+            "psychiatric",
+            "depression",
+            "anxiety",
+            "mental health",
+            "suicide",
+        ],
+    }
+
+    # Specialty indicators as formatted for the specialty assessment prompt
+    _SPECIALTY_INDICATORS_TEXT = "\n".join(
+        f"- {specialty}: {', '.join(indicators)}"
+        for specialty, indicators in SPECIALTY_INDICATORS.items()
+    )
+
     def __init__(self, api_url: str = "http://localhost:1234/v1", model: str = None):
         """
         Initialize the LLM classifier.
@@ -38,8 +512,19 @@ class LLMClassifier:
         """
         self.api_url = api_url
         self.available_models = []
+        self._models_refreshed_at = 0.0
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
         self.client = self._setup_client()
 
+        # Exclusion criteria rarely change, so load and format them once
+        self._formatted_exclusions: Tuple[Optional[Dict[str, Any]], List[str], str] = (
+            None,
+            [],
+            "",
+        )
+        self._exclusion_criteria_mtime: Optional[float] = None
+        self.exclusion_criteria = self._load_exclusion_criteria()
+
         # Try to get available models
         self.refresh_models()
 
@@ -53,30 +538,104 @@ class LLMClassifier:
                 "fallback_model"  # This will likely fail but provides a default
             )
 
-    def _setup_client(self) -> openai.OpenAI:
-        """Set up the OpenAI client with the LM Studio API URL."""
-        return openai.OpenAI(
-            base_url=self.api_url,
-            api_key="not-needed",  # LM Studio doesn't require an API key
-        )
+    def _setup_client(
+        self, loop: asyncio.AbstractEventLoop = _SYNC_LOOP
+    ) -> openai.AsyncOpenAI:
+        """
+        Get the shared async OpenAI client for the LM Studio API URL.
+
+        Args:
+            loop: Event loop the client will be used on (default: the loop
+                the sync entry points run on)
+
+        Returns:
+            The pooled client for the API URL and loop
+        """
+        with _CLIENT_LOCK:
+            for key in [key for key in _CLIENT_POOL if key[1].is_closed()]:
+                del _CLIENT_POOL[key]
+
+            client = _CLIENT_POOL.get((self.api_url, loop))
+            if client is None or client.is_closed():
+                http_client = httpx.AsyncClient(
+                    # The OpenAI client already retries failed requests
+                    transport=httpx.AsyncHTTPTransport(retries=0),
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                    ),
+                    timeout=HTTP_TIMEOUT,
+                )
+                client = openai.AsyncOpenAI(
+                    base_url=self.api_url,
+                    api_key="not-needed",  # LM Studio doesn't require an API key
+                    http_client=http_client,
+                    max_retries=HTTP_MAX_RETRIES,
+                )
+                _CLIENT_POOL[(self.api_url, loop)] = client
+            return client
+
+    def _loop_client(self) -> openai.AsyncOpenAI:
+        """Get the client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is _SYNC_LOOP:
+            return self.client
+        return self._setup_client(loop)
+
+    def _run_sync(self, coro):
+        """
+        Run a coroutine to completion on the shared sync event loop.
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        with _SYNC_LOOP_LOCK:
+            return _SYNC_LOOP.run_until_complete(coro)
 
     def set_api_url(self, api_url: str):
-        """Update the API URL and reinitialize the client."""
-        self.api_url = api_url
-        self.client = self._setup_client()
+        """Update the API URL, switching to that URL's shared client if it changed."""
+        # The previous client stays open in the pool for other classifiers
+        # and for switching back
+        if api_url != self.api_url:
+            self.api_url = api_url
+            self.client = self._setup_client()
+            self._models_refreshed_at = 0.0
         self.refresh_models()
 
     def set_model(self, model: str):
         """Update the model name."""
         self.model = model
 
-    def refresh_models(self) -> List[str]:
-        """Query the API for available models and update the available_models list."""
+    def refresh_models(self, force: bool = False) -> List[str]:
+        """
+        Query the API for available models and update the available_models list.
+
+        The list rarely changes during a session, so a non-empty list fetched
+        in the last MODELS_CACHE_TTL seconds is returned without a request.
+
+        Args:
+            force: Query the API even if the cached list is still fresh
+
+        Returns:
+            List of available model names
+        """
+        if (
+            not force
+            and self.available_models
+            and time.monotonic() - self._models_refreshed_at < MODELS_CACHE_TTL
+        ):
+            return self.available_models
+
         self.available_models = []
         try:
-            response = self.client.models.list()
+            response = self._run_sync(self.client.models.list())
             for model in response.data:
                 self.available_models.append(model.id)
+            self._models_refreshed_at = time.monotonic()
             logger.info(
                 f"Found {len(self.available_models)} available models: {self.available_models}"
             )
@@ -125,7 +684,7 @@ class LLMClassifier:
             logger.info(f"Checking API connection to {self.api_url}")
 
             # We already know models are available since we fetched them earlier
-            if self.model in self.available_models:
+            if self.model in set(self.available_models):
                 # Simple success if model is in the available models list
                 logger.info(f"Connection verified: model {self.model} is available")
                 return True, "Connection successful"
@@ -134,9 +693,8 @@ class LLMClassifier:
                 logger.warning(f"Model {self.model} not found in available models")
                 return (
                     False,
-                    f"Model {
-                        self.model} not found in available models: {
-                        self.available_models}",
+                    f"Model {self.model} not found in available models: "
+                    f"{self.available_models}",
                 )
         except Exception as e:
             error_msg = str(e)
@@ -159,13 +717,141 @@ class LLMClassifier:
             elif "not found" in error_msg.lower() and self.model in error_msg:
                 return (
                     False,
-                    f"Model '{
-                        self.model}' was not found. Check if it's loaded in LM Studio.",
+                    f"Model '{self.model}' was not found. "
+                    "Check if it's loaded in LM Studio.",
                 )
             else:
                 return False, f"Error: {error_msg}"
 
-    def _run_entity_extraction(self, text: str) -> Dict[str, Any]:
+    async def _stream_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        opener: str = "{",
+        response_model: Optional[Type[BaseModel]] = None,
+    ) -> JsonStreamScanner:
+        """
+        Stream a response from the LLM until its JSON value is complete.
+
+        The stream is closed as soon as the first JSON object (or array) has
+        been received, so the server stops generating any trailing prose.
+
+        Args:
+            system_prompt: Instructions and response format for the step
+            user_prompt: The step's input
+            max_tokens: Maximum number of tokens to generate
+            opener: Bracket that starts the expected JSON value
+            response_model: Optional model whose JSON schema constrains decoding
+
+        Returns:
+            Scanner holding the response text received and where the JSON
+            value starts and ends in it
+        """
+        scanner = JsonStreamScanner(opener)
+        extra_args = {}
+        if response_model is not None:
+            # Grammar-constrained decoding keeps the model from writing prose
+            # or malformed JSON
+            extra_args["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": response_model.__name__,
+                    "schema": response_model.model_json_schema(mode="serialization"),
+                    "strict": True,
+                },
+            }
+
+        # Make the API call - LM Studio doesn't support 'system' role, so combine
+        # into user message
+        stream = await self._loop_client().chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}],
+            temperature=0.1,  # Low temperature for more deterministic results
+            max_tokens=max_tokens,
+            stream=True,
+            # Let llama.cpp-based servers such as LM Studio keep the KV cache
+            # for the shared prompt prefix between requests
+            extra_body={"cache_prompt": True},
+            **extra_args,
+        )
+        try:
+            async for chunk in stream:
+                content = chunk.choices[0].delta.content if chunk.choices else None
+                if content and scanner.feed(content):
+                    break
+        finally:
+            await stream.close()
+        return scanner
+
+    async def _request_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        step: str,
+        response_model: Type[BaseModel],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a prompt to the LLM and validate the JSON object in its response.
+
+        Responses are cached by a hash of the model and prompt, so re-running
+        a vignette, or a later step with the same extracted entities, does not
+        call the LLM again.
+
+        Args:
+            system_prompt: Instructions and response format for the step
+            user_prompt: The step's input
+            max_tokens: Maximum number of tokens to generate
+            step: Name of the step, used in log messages
+            response_model: Model the response is constrained to and validated
+                against
+
+        Returns:
+            The validated response, or None if the response contained no
+            object or did not match the model
+
+        Raises:
+            Exception: If the API call fails or the JSON is invalid
+        """
+        cache_key = hashlib.blake2b(
+            f"{self.model}\0{max_tokens}\0{system_prompt}\0{user_prompt}".encode()
+        ).hexdigest()
+        json_str = self._response_cache.get(cache_key)
+        if json_str is not None:
+            self._response_cache.move_to_end(cache_key)
+            return _json_loads(json_str)
+
+        scanner = await self._stream_completion(
+            system_prompt, user_prompt, max_tokens, response_model=response_model
+        )
+        response_content = scanner.buffer
+        logger.debug(f"{step} response: {response_content}")
+
+        # Try to parse the JSON response. The stream scanner has already found
+        # where a complete object ends; only a truncated response is rescanned
+        if scanner.end >= 0:
+            parsed = _json_loads(scanner.buffer[scanner.start : scanner.end])
+        else:
+            extracted = _extract_json(response_content)
+            if extracted is None:
+                logger.warning(f"Failed to parse JSON from {step.lower()} response")
+                return None
+            parsed = extracted[0]
+        try:
+            validated = response_model.model_validate(parsed)
+        except ValidationError as e:
+            logger.warning(f"Invalid {step.lower()} response: {e}")
+            return None
+
+        # The cache holds JSON text so callers never share a mutable result
+        json_str = validated.model_dump_json(exclude_unset=True)
+        self._response_cache[cache_key] = json_str
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return _json_loads(json_str)
+
+    async def _run_entity_extraction(self, text: str) -> Dict[str, Any]:
         """
         Step 1: Extract clinical entities from the text.
 
@@ -202,179 +888,152 @@ class LLMClassifier:
         )
 
         try:
-            # Make the API call
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}
-                ],
-                temperature=0.1,  # Low temperature for more deterministic results
-                max_tokens=1000,
+            result = await self._request_json(
+                system_prompt, user_prompt, 400, "Entity extraction", ClinicalEntities
             )
-
-            # Extract the response content
-            response_content = response.choices[0].message.content
-            logger.debug(f"Entity extraction response: {response_content}")
-
-            # Try to parse the JSON response
-            match = re.search(r"\{.*\}", response_content, re.DOTALL)
-            if match:
-                json_str = match.group(0)
-                result = json.loads(json_str)
-                return result
-            else:
-                logger.warning("Failed to parse JSON from entity extraction response")
-                return {}
+            return result if result is not None else {}
         except Exception as e:
             logger.error(f"Error in entity extraction: {str(e)}")
             return {}
 
-    def _run_specialty_assessment(
-        self, extracted_entities: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    async def _run_specialty_assessment(self, entities_text: str) -> Dict[str, Any]:
         """
         Step 2: Assess specialty needs based on extracted entities.
 
         Args:
-            extracted_entities: Dictionary of extracted clinical entities
+            entities_text: The extracted clinical entities as JSON text
 
         Returns:
             Dictionary with specialty need assessment
         """
-        # Define specialty indicators
-        specialty_indicators = {
-            "cardiology": ["heart", "cardiac", "chest pain", "arrhythmia", "murmur"],
-            "neurology": ["seizure", "stroke", "headache", "neurological", "brain"],
-            "pulmonology": ["respiratory", "breathing", "asthma", "pneumonia", "lungs"],
-            "neonatology": ["newborn", "premature", "neonate", "NICU"],
-            "orthopedics": ["fracture", "bone", "joint", "sprain", "musculoskeletal"],
-            "gastroenterology": [
-                "abdominal pain",
-                "vomiting",
-                "diarrhea",
-                "GI bleed",
-                "liver",
-            ],
-            "endocrinology": ["diabetes", "thyroid", "hormone", "glucose"],
-            "infectious disease": ["infection", "sepsis", "meningitis", "cellulitis"],
-            "hematology/oncology": [
-                "cancer",
-                "leukemia",
-                "anemia",
-                "bleeding",
-                "oncology",
-            ],
-            "psychiatry": [
-                "psychiatric",
-                "depression",
-                "anxiety",
-                "mental health",
-                "suicide",
-            ],
-        }
-
-        # Format extracted entities as text for the prompt
-        entities_text = json.dumps(extracted_entities, indent=2)
-
-        # Format specialty indicators for the prompt
-        indicators_text = "\n".join(
-            [
-                f"- {specialty}: {', '.join(indicators)}"
-                for specialty, indicators in specialty_indicators.items()
-            ]
-        )
-
         # Create the system prompt for specialty assessment
         system_prompt = """You are an expert triage physician. Your task is to assess what medical specialties might be needed
         based on the clinical information provided. Think step-by-step about each potential specialty need.
 
         Format your response as a JSON object with the following structure:
         {
-          "identified_specialties_needed": [
+          "specs": [
             {
-              "specialty_name": "name of the specialty",
-              "likelihood_score": numerical score from 0-100 indicating confidence,
-              "supporting_evidence": "text explaining why this specialty is needed"
+              "spec": "name of the specialty",
+              "score": numerical score from 0-100 indicating confidence,
+              "why": "brief evidence for why this specialty is needed"
             },
             {...}
           ]
         }
         """
 
-        # Create the user prompt
-        user_prompt = f"""Based on these extracted clinical entities:
+        # Create the user prompt; the static indicators and instructions come
+        # first so the server can reuse the cached prompt prefix
+        user_prompt = f"""Given these specialty need indicators:
+        {self._SPECIALTY_INDICATORS_TEXT}
 
-        {entities_text}
+        Identify which specialties might be needed for this patient. For each specialty, provide a likelihood score (0-100) and supporting evidence from the clinical information.
 
-        And these specialty need indicators:
-        {indicators_text}
+        Extracted clinical entities:
 
-        Identify which specialties might be needed for this patient. For each specialty, provide a likelihood score (0-100) and supporting evidence from the clinical information.
+        {entities_text}
         """
 
         try:
-            # Make the API call - LM Studio doesn't support 'system' role, so combine
-            # into user message
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}
-                ],
-                temperature=0.1,  # Low temperature for more deterministic results
-                max_tokens=1000,
+            result = await self._request_json(
+                system_prompt,
+                user_prompt,
+                600,
+                "Specialty assessment",
+                SpecialtyAssessment,
             )
-
-            # Extract the response content
-            response_content = response.choices[0].message.content
-            logger.debug(f"Specialty assessment response: {response_content}")
-
-            # Try to parse the JSON response
-            match = re.search(r"\{.*\}", response_content, re.DOTALL)
-            if match:
-                json_str = match.group(0)
-                result = json.loads(json_str)
-                return result
-            else:
-                logger.warning(
-                    "Failed to parse JSON from specialty assessment response"
-                )
+            if result is None:
                 return {"identified_specialties_needed": []}
+            return result
         except Exception as e:
             logger.error(f"Error in specialty assessment: {str(e)}")
             return {"identified_specialties_needed": []}
 
-    def _run_exclusion_evaluation(
-        self, extracted_entities: Dict[str, Any], exclusion_criteria: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _prepare_exclusions(
+        self, exclusion_criteria: Dict[str, Any]
+    ) -> Tuple[List[str], str]:
         """
-        Step 3: Evaluate exclusion criteria based on extracted entities.
+        List the exclusion rules and format them as a numbered list for a prompt.
 
         Args:
-            extracted_entities: Dictionary of extracted clinical entities
             exclusion_criteria: Dictionary of exclusion criteria
 
         Returns:
-            Dictionary with exclusion criteria evaluation
+            Tuple of (rule texts, one numbered line per rule)
         """
-        # Format extracted entities as text for the prompt
-        entities_text = json.dumps(extracted_entities, indent=2)
+        # Reuse the result from the last call for the same criteria, which is
+        # normally the classifier's own exclusion_criteria
+        cached_criteria, cached_rules, cached_text = self._formatted_exclusions
+        if exclusion_criteria is cached_criteria:
+            return cached_rules, cached_text
 
-        # Format exclusion criteria for the prompt
-        exclusions_text = ""
-        exclusion_id = 1
+        rules = []
 
         # For simplicity, we'll focus on community campus exclusions
         for campus_key, campus_data in exclusion_criteria.get("campuses", {}).items():
             # General exclusions
             for exclusion in campus_data.get("general_exclusions", []):
-                exclusions_text += f"#{exclusion_id}. GENERAL: {exclusion}\n"
-                exclusion_id += 1
+                rules.append(f"GENERAL: {exclusion}")
 
             # Department-specific exclusions
             for dept, dept_data in campus_data.get("departments", {}).items():
                 for exclusion in dept_data.get("exclusions", []):
-                    exclusions_text += f"#{exclusion_id}. {dept.upper()}: {exclusion}\n"
-                    exclusion_id += 1
+                    rules.append(f"{dept.upper()}: {exclusion}")
+
+        exclusions_text = "".join(
+            f"#{exclusion_id}. {rule}\n" for exclusion_id, rule in enumerate(rules, 1)
+        )
+        self._formatted_exclusions = (exclusion_criteria, rules, exclusions_text)
+        return rules, exclusions_text
+
+    def _format_exclusions(self, exclusion_criteria: Dict[str, Any]) -> str:
+        """
+        Format exclusion criteria as a numbered list for a prompt.
+
+        Args:
+            exclusion_criteria: Dictionary of exclusion criteria
+
+        Returns:
+            One numbered line per exclusion
+        """
+        return self._prepare_exclusions(exclusion_criteria)[1]
+
+    def _add_rule_text(
+        self, evaluations: List[Dict[str, Any]], exclusion_criteria: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fill in each evaluation's rule_text from its exclusion rule number.
+
+        Args:
+            evaluations: Exclusion criteria evaluations from the LLM
+            exclusion_criteria: Dictionary of exclusion criteria that was evaluated
+
+        Returns:
+            The same evaluations, with rule_text set where the number is known
+        """
+        rules = self._prepare_exclusions(exclusion_criteria)[0]
+        for evaluation in evaluations:
+            number = re.sub(r"\D", "", str(evaluation.get("exclusion_rule_id", "")))
+            if number and 1 <= int(number) <= len(rules):
+                evaluation.setdefault("rule_text", rules[int(number) - 1])
+        return evaluations
+
+    async def _run_exclusion_evaluation(
+        self, entities_text: str, exclusion_criteria: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Step 3: Evaluate exclusion criteria based on extracted entities.
+
+        Args:
+            entities_text: The extracted clinical entities as JSON text
+            exclusion_criteria: Dictionary of exclusion criteria
+
+        Returns:
+            Dictionary with exclusion criteria evaluation
+        """
+        # Format exclusion criteria for the prompt
+        exclusions_text = self._format_exclusions(exclusion_criteria)
 
         # Create the system prompt for exclusion evaluation
         system_prompt = """You are an expert transfer center physician. Your task is to evaluate whether this patient meets any
@@ -382,66 +1041,53 @@ class LLMClassifier:
 
         Format your response as a JSON object with the following structure:
         {
-          "exclusion_criteria_evaluation": [
+          "excl": [
             {
-              "exclusion_rule_id": "identifier of the exclusion rule",
-              "rule_text": "full text of the exclusion rule",
-              "status": "one of: 'likely_met', 'likely_not_met', 'uncertain'",
-              "confidence_score": numerical score from 0-100,
-              "evidence_from_vignette": "text explaining the evidence for this status determination"
+              "id": "number of the exclusion rule",
+              "status": "one of: 'likely_met', 'uncertain'",
+              "score": numerical confidence score from 0-100,
+              "ev": "brief evidence for this status determination"
             },
             {...}
           ]
         }
         """
 
-        # Create the user prompt
-        user_prompt = f"""Based on these extracted clinical entities:
+        # Create the user prompt; the static criteria and instructions come
+        # first so the server can reuse the cached prompt prefix
+        user_prompt = f"""Evaluate whether the patient meets any of the following exclusion criteria:
 
-        {entities_text}
+        {exclusions_text}
 
-        Evaluate whether the patient meets any of the following exclusion criteria:
+        List only the numbered exclusion criteria that are 'likely_met' or 'uncertain' based on the clinical information, omitting those likely not met.
+        Provide a confidence score (0-100) for each determination and cite specific evidence from the clinical information.
 
-        {exclusions_text}
+        Extracted clinical entities:
 
-        For each numbered exclusion criterion, determine if it is 'likely_met', 'likely_not_met', or 'uncertain' based on the clinical information.
-        Provide a confidence score (0-100) for your determination and cite specific evidence from the clinical information.
+        {entities_text}
         """
 
         try:
-            # Make the API call - LM Studio doesn't support 'system' role, so combine
-            # into user message
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}
-                ],
-                temperature=0.1,  # Low temperature for more deterministic results
-                max_tokens=1500,
+            result = await self._request_json(
+                system_prompt,
+                user_prompt,
+                900,
+                "Exclusion evaluation",
+                ExclusionEvaluation,
             )
-
-            # Extract the response content
-            response_content = response.choices[0].message.content
-            logger.debug(f"Exclusion evaluation response: {response_content}")
-
-            # Try to parse the JSON response
-            match = re.search(r"\{.*\}", response_content, re.DOTALL)
-            if match:
-                json_str = match.group(0)
-                result = json.loads(json_str)
-                return result
-            else:
-                logger.warning(
-                    "Failed to parse JSON from exclusion evaluation response"
-                )
+            if result is None:
                 return {"exclusion_criteria_evaluation": []}
+            self._add_rule_text(
+                result.get("exclusion_criteria_evaluation", []), exclusion_criteria
+            )
+            return result
         except Exception as e:
             logger.error(f"Error in exclusion evaluation: {str(e)}")
             return {"exclusion_criteria_evaluation": []}
 
-    def _run_final_recommendation(
+    async def _run_final_recommendation(
         self,
-        extracted_entities: Dict[str, Any],
+        entities_text: str,
         specialty_assessment: Dict[str, Any],
         exclusion_evaluation: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
@@ -449,27 +1095,26 @@ class LLMClassifier:
         Step 4: Generate final recommendation based on previous steps.
 
         Args:
-            extracted_entities: Dictionary of extracted clinical entities
+            entities_text: The extracted clinical entities as JSON text
             specialty_assessment: Dictionary with specialty need assessment
             exclusion_evaluation: Dictionary with exclusion criteria evaluation
 
         Returns:
             Dictionary with final recommendation
         """
-        # Combine all previous outputs for the prompt
-        combined_data = {
-            "extracted_clinical_entities": extracted_entities,
-            "identified_specialties_needed": specialty_assessment.get(
-                "identified_specialties_needed", []
-            ),
-            "exclusion_criteria_evaluation": (
-                exclusion_evaluation.get("exclusion_criteria_evaluation", [])
-                if exclusion_evaluation
-                else []
-            ),
-        }
-
-        combined_text = json.dumps(combined_data, indent=2)
+        # Combine all previous outputs for the prompt, reusing the entities
+        # text already sent to steps 2 and 3
+        specialties = specialty_assessment.get("identified_specialties_needed", [])
+        exclusions = (
+            exclusion_evaluation.get("exclusion_criteria_evaluation", [])
+            if exclusion_evaluation
+            else []
+        )
+        combined_text = (
+            f'{{"extracted_clinical_entities":{entities_text},'
+            f'"identified_specialties_needed":{_json_dumps(specialties)},'
+            f'"exclusion_criteria_evaluation":{_json_dumps(exclusions)}}}'
+        )
 
         # Create the system prompt for final recommendation
         system_prompt = """You are an expert transfer center physician making a final recommendation for patient transfer.
@@ -477,52 +1122,33 @@ class LLMClassifier:
 
         Format your response as a JSON object with the following structure:
         {
-          "recommended_care_level": "one of: 'General', 'ICU', 'PICU', 'NICU'",
-          "confidence": numerical score from 0-100,
-          "explanation": "text explaining the overall recommendation"
+          "level": "one of: 'General', 'ICU', 'PICU', 'NICU'",
+          "score": numerical confidence score from 0-100,
+          "why": "brief explanation of the overall recommendation"
         }
         """
 
-        # Create the user prompt
-        user_prompt = f"""Based on the combined analysis:
+        # Create the user prompt; the static instructions come first so the
+        # server can reuse the cached prompt prefix
+        user_prompt = f"""Determine the most appropriate care level for this patient. Consider the clinical entities, specialty needs, and exclusion criteria evaluations.
+        Provide a confidence score (0-100) for your recommendation and briefly explain your reasoning.
 
-        {combined_text}
+        Combined analysis:
 
-        Determine the most appropriate care level for this patient. Consider the clinical entities, specialty needs, and exclusion criteria evaluations.
-        Provide a confidence score (0-100) for your recommendation and explain your reasoning in detail.
+        {combined_text}
         """
 
         try:
-            # Make the API call - LM Studio doesn't support 'system' role, so combine
-            # into user message
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}
-                ],
-                temperature=0.1,  # Low temperature for more deterministic results
-                max_tokens=1000,
+            result = await self._request_json(
+                system_prompt, user_prompt, 500, "Final recommendation", Recommendation
             )
-
-            # Extract the response content
-            response_content = response.choices[0].message.content
-            logger.debug(f"Final recommendation response: {response_content}")
-
-            # Try to parse the JSON response
-            match = re.search(r"\{.*\}", response_content, re.DOTALL)
-            if match:
-                json_str = match.group(0)
-                result = json.loads(json_str)
-                return result
-            else:
-                logger.warning(
-                    "Failed to parse JSON from final recommendation response"
-                )
+            if result is None:
                 return {
                     "recommended_care_level": "General",
                     "confidence": 50,
                     "explanation": "Unable to determine a specific recommendation.",
                 }
+            return result
         except Exception as e:
             logger.error(f"Error in final recommendation: {str(e)}")
             return {
@@ -531,12 +1157,410 @@ class LLMClassifier:
                 "explanation": f"Error generating recommendation: {str(e)}",
             }
 
-    def process_text(
+    async def _run_combined_chain(
+        self, text: str, exclusion_criteria: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run all four steps of the prompt chain in a single LLM call.
+
+        Args:
+            text: The clinical text to process
+            exclusion_criteria: Dictionary of exclusion criteria
+
+        Returns:
+            Dictionary with the results of every step, or None if the response
+            could not be parsed into the expected structure
+        """
+        exclusions_text = self._format_exclusions(exclusion_criteria)
+
+        # Create the system prompt covering every step of the chain
+        system_prompt = f"""You are an expert transfer center physician. Analyze the following patient vignette
+        {COMBINED_CHAIN_STEPS}
+        Format your response as a single JSON object with the following structure:
+{COMBINED_RESULT_FORMAT}"""
+
+        # Create the user prompt; the static criteria come first so the
+        # server can reuse the cached prompt prefix
+        user_prompt = f"""Exclusion criteria:
+
+        {exclusions_text}
+
+        Patient vignette:
+
+        {text}
+        """
+
+        try:
+            result = await self._request_json(
+                system_prompt,
+                user_prompt,
+                COMBINED_MAX_TOKENS,
+                "Combined chain",
+                CombinedChainResult,
+            )
+        except Exception as e:
+            logger.error(f"Error in combined chain: {str(e)}")
+            return None
+
+        # A response without every step present is None, and is retried with
+        # the step-by-step chain
+        return result
+
+    async def _run_batch_chain(
+        self, texts: List[str], exclusion_criteria: Dict[str, Any]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run the combined prompt chain for several vignettes in a single LLM call.
+
+        Args:
+            texts: The clinical texts to process
+            exclusion_criteria: Dictionary of exclusion criteria
+
+        Returns:
+            One combined chain result per text, in order, with None for any
+            vignette whose result could not be parsed
+        """
+        exclusions_text = self._format_exclusions(exclusion_criteria)
+        vignettes_text = "\n\n".join(
+            f"Vignette {number}:\n{text}" for number, text in enumerate(texts, 1)
+        )
+
+        # Create the system prompt covering every step of the chain
+        system_prompt = f"""You are an expert transfer center physician. You will receive {len(texts)} numbered patient
+        vignettes. Analyze each vignette independently
+        {COMBINED_CHAIN_STEPS}
+        Format your response as a JSON array of length {len(texts)}, where element i is the analysis of
+        vignette i as a JSON object with the following structure:
+{COMBINED_RESULT_FORMAT}"""
+
+        # Create the user prompt; the static criteria come first so the
+        # server can reuse the cached prompt prefix
+        user_prompt = f"""Exclusion criteria:
+
+        {exclusions_text}
+
+        Patient vignettes:
+
+        {vignettes_text}
+        """
+
+        results = [None] * len(texts)
+        try:
+            scanner = await self._stream_completion(
+                system_prompt, user_prompt, COMBINED_MAX_TOKENS * len(texts), "["
+            )
+            logger.debug(f"Batch chain response: {scanner.buffer}")
+
+            # Try to parse the JSON response
+            if scanner.end < 0:
+                logger.warning("Failed to parse JSON from batch chain response")
+                return results
+            parsed = _json_loads(scanner.buffer[scanner.start : scanner.end])
+        except Exception as e:
+            logger.error(f"Error in batch chain: {str(e)}")
+            return results
+
+        if not isinstance(parsed, list) or len(parsed) != len(texts):
+            logger.warning("Batch chain response has the wrong number of results")
+            return results
+        return [self._validate_chain_result(result) for result in parsed]
+
+    def _validate_chain_result(self, result: Any) -> Optional[Dict[str, Any]]:
+        """
+        Validate one vignette's combined chain result from a batched response.
+
+        Args:
+            result: Parsed combined chain result
+
+        Returns:
+            The validated result, or None if it does not have every step
+        """
+        try:
+            return CombinedChainResult.model_validate(result).model_dump(
+                exclude_unset=True
+            )
+        except ValidationError as e:
+            logger.warning(f"Invalid batch chain result: {e}")
+            return None
+
+    def _split_combined_result(self, combined_result: Dict[str, Any]) -> tuple:
+        """
+        Split a combined chain result into the outputs of each step.
+
+        Args:
+            combined_result: Complete combined chain result
+
+        Returns:
+            Tuple in the same form as returned by _run_prompt_chain
+        """
+        return (
+            combined_result["extracted_clinical_entities"],
+            {
+                "identified_specialties_needed": combined_result[
+                    "identified_specialties_needed"
+                ]
+            },
+            {
+                "exclusion_criteria_evaluation": self._add_rule_text(
+                    combined_result["exclusion_criteria_evaluation"],
+                    self.exclusion_criteria,
+                )
+            },
+            combined_result["final_recommendation"],
+        )
+
+    async def _run_prompt_chain(
+        self, text: str, exclusion_criteria: Dict[str, Any]
+    ) -> tuple:
+        """
+        Run the prompt chain one step per LLM call.
+
+        Args:
+            text: The clinical text to process
+            exclusion_criteria: Dictionary of exclusion criteria
+
+        Returns:
+            Tuple of (entities, specialty assessment, exclusion evaluation or
+            None, final recommendation)
+
+        Raises:
+            ValueError: If entity extraction fails
+        """
+        # Step 1: Entity Extraction
+        entity_result = await self._run_entity_extraction(text)
+        if not entity_result:
+            raise ValueError("Entity extraction failed")
+
+        # The entities are serialized once for all of the later steps
+        entities_text = _json_dumps(entity_result)
+
+        # Steps 2 and 3: Specialty Need Assessment and Exclusion Criteria
+        # Evaluation run concurrently. Only run exclusion evaluation if we
+        # have criteria
+        if exclusion_criteria:
+            specialty_result, exclusion_result = await asyncio.gather(
+                self._run_specialty_assessment(entities_text),
+                self._run_exclusion_evaluation(entities_text, exclusion_criteria),
+            )
+        else:
+            specialty_result = await self._run_specialty_assessment(entities_text)
+            exclusion_result = None
+
+        # Step 4: Final Recommendation
+        recommendation_result = await self._run_final_recommendation(
+            entities_text, specialty_result, exclusion_result
+        )
+        return entity_result, specialty_result, exclusion_result, recommendation_result
+
+    def _load_exclusion_criteria(self) -> Dict[str, Any]:
+        """
+        Load the exclusion criteria used by the prompt chain.
+
+        Returns:
+            Dictionary of exclusion criteria, empty if they could not be loaded
+        """
+        exclusion_criteria = {}
+        try:
+            # Record the time before reading, so a write during the read
+            # triggers another reload
+            self._exclusion_criteria_mtime = os.stat(EXCLUSION_CRITERIA_PATH).st_mtime
+            with open(EXCLUSION_CRITERIA_PATH, "rb") as f:
+                exclusion_criteria = _json_loads(f.read())
+        except Exception as e:
+            logger.error(f"Error loading exclusion criteria: {str(e)}")
+            # Continue without exclusion criteria
+        return exclusion_criteria
+
+    def _get_exclusion_criteria(self) -> Dict[str, Any]:
+        """
+        Get the exclusion criteria, reloading them if the file has changed.
+
+        Returns:
+            Dictionary of exclusion criteria
+        """
+        try:
+            mtime = os.stat(EXCLUSION_CRITERIA_PATH).st_mtime
+        except OSError:
+            return self.exclusion_criteria
+        if mtime != self._exclusion_criteria_mtime:
+            logger.info("Exclusion criteria file changed, reloading")
+            self.exclusion_criteria = self._load_exclusion_criteria()
+        return self.exclusion_criteria
+
+    def _build_result(
+        self,
+        text: str,
+        chain_results: tuple,
+        human_suggestions: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """
+        Combine the outputs of the prompt chain into the application's format.
+
+        Args:
+            text: The clinical text that was processed
+            chain_results: Tuple in the same form as returned by _run_prompt_chain
+            human_suggestions: Optional dictionary of human suggestions to consider
+
+        Returns:
+            Dictionary of extracted information, as returned by process_text
+        """
+        entity_result, specialty_result, exclusion_result, recommendation_result = (
+            chain_results
+        )
+
+        # Combine results into the expected format for the application
+        result = {
+            "chief_complaint": (
+                entity_result.get("medical_problems", ["Unknown"])[0]
+                if entity_result.get("medical_problems")
+                else (
+                    entity_result.get("symptoms", ["Unknown"])[0]
+                    if entity_result.get("symptoms")
+                    else "Unknown"
+                )
+            ),
+            "clinical_history": entity_result.get(
+                "medical_history", text[:200] + "..."
+            ),
+            "vital_signs": entity_result.get("vital_signs", {}),
+            "age": entity_result.get("demographics", {}).get("age"),
+            "weight_kg": entity_result.get("demographics", {}).get("weight"),
+            "sex": entity_result.get("demographics", {}).get("sex"),
+            "keywords": entity_result.get("symptoms", [])
+            + entity_result.get("medical_problems", []),
+            "suggested_care_level": recommendation_result.get(
+                "recommended_care_level", "General"
+            ),
+            "note": f"Generated by {self.model} using multi-step prompting",
+            # New fields from the prompt chain
+            "specialty_needs": specialty_result.get(
+                "identified_specialties_needed", []
+            ),
+            "exclusion_matches": (
+                exclusion_result.get("exclusion_criteria_evaluation", [])
+                if exclusion_result
+                else []
+            ),
+            "explainability": {
+                "reasoning": recommendation_result.get("explanation", ""),
+                "confidence": recommendation_result.get("confidence", 0),
+            },
+        }
+
+        # Consider human suggestions
+        if human_suggestions and "care_level" in human_suggestions:
+            # If human suggestions include NICU, PICU, or ICU, consider those
+            care_level = _highest_suggested_care_level(human_suggestions["care_level"])
+            if care_level:
+                result["suggested_care_level"] = care_level
+        return result
+
+    def process_text_sync(
+        self, text: str, human_suggestions: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Blocking wrapper around process_text for synchronous callers.
+
+        Args:
+            text: The clinical text to process
+            human_suggestions: Optional dictionary of human suggestions to consider
+
+        Returns:
+            Dictionary of extracted information, as returned by process_text
+        """
+        return self._run_sync(self.process_text(text, human_suggestions))
+
+    def process_texts_sync(
+        self,
+        texts: List[str],
+        rows_per_call: int = DEFAULT_ROWS_PER_CALL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Blocking wrapper around process_texts for synchronous callers.
+
+        Args:
+            texts: The clinical texts to process
+            rows_per_call: Maximum number of vignettes sent in each request
+            max_concurrency: Maximum number of batches or retries in flight
+
+        Returns:
+            List of extracted information dictionaries, as returned by process_texts
+        """
+        return self._run_sync(self.process_texts(texts, rows_per_call, max_concurrency))
+
+    async def process_texts(
+        self,
+        texts: List[str],
+        rows_per_call: int = DEFAULT_ROWS_PER_CALL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Process a worklist of clinical texts, packing several into each request.
+
+        Sending up to rows_per_call vignettes per request shares one round-trip
+        and one copy of the exclusion criteria between them. Up to
+        max_concurrency batches are sent at once; flooding the server with
+        more only gets them rate limited. Any vignette whose batched result
+        cannot be used is processed on its own with process_text.
+
+        Args:
+            texts: The clinical texts to process
+            rows_per_call: Maximum number of vignettes sent in each request
+            max_concurrency: Maximum number of batches or retries in flight
+
+        Returns:
+            List of extracted information dictionaries, in the order of texts
+        """
+        exclusion_criteria = self._get_exclusion_criteria()
+        rows_per_call = max(rows_per_call, 1)
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        batches = [
+            texts[start : start + rows_per_call]
+            for start in range(0, len(texts), rows_per_call)
+        ]
+        batch_results = await asyncio.gather(
+            *(
+                bounded(self._run_batch_chain(batch, exclusion_criteria))
+                for batch in batches
+            )
+        )
+        combined_results = [result for batch in batch_results for result in batch]
+
+        results = [
+            (
+                self._build_result(text, self._split_combined_result(combined_result))
+                if combined_result
+                else None
+            )
+            for text, combined_result in zip(texts, combined_results)
+        ]
+
+        # Retry vignettes the batch could not answer one at a time
+        retry_indexes = [index for index, result in enumerate(results) if not result]
+        retried = await asyncio.gather(
+            *(bounded(self.process_text(texts[index])) for index in retry_indexes)
+        )
+        for index, result in zip(retry_indexes, retried):
+            results[index] = result
+        return results
+
+    async def process_text(
         self, text: str, human_suggestions: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """
         Process clinical text to extract structured information using a multi-step prompting approach.
 
+        All four steps are first requested in a single LLM call. If that
+        response cannot be used, the steps are run one by one; specialty
+        assessment and exclusion evaluation depend only on the extracted
+        entities, so they are sent to the LLM concurrently.
+
         Args:
             text: The clinical text to process
             human_suggestions: Optional dictionary of human suggestions to consider
@@ -559,96 +1583,19 @@ class LLMClassifier:
         # rule-based processing
         try:
             logger.info(
-                f"Processing text with {
-                    self.model} on {
-                    self.api_url} using multi-step prompting"
-            )
-
-            # Step 1: Entity Extraction
-            entity_result = self._run_entity_extraction(text)
-            if not entity_result:
-                raise ValueError("Entity extraction failed")
-
-            # Step 2: Specialty Need Assessment
-            specialty_result = self._run_specialty_assessment(entity_result)
-
-            # Step 3: Exclusion Criteria Evaluation
-            # Load exclusion criteria - assuming it's in the standard location
-            exclusion_criteria_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "data",
-                "exclusion_criteria_clean.json",
-            )
-            exclusion_criteria = {}
-            try:
-                with open(exclusion_criteria_path, "r") as f:
-                    exclusion_criteria = json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading exclusion criteria: {str(e)}")
-                # Continue without exclusion criteria
-
-            # Only run exclusion evaluation if we have criteria
-            exclusion_result = None
-            if exclusion_criteria:
-                exclusion_result = self._run_exclusion_evaluation(
-                    entity_result, exclusion_criteria
-                )
-
-            # Step 4: Final Recommendation
-            recommendation_result = self._run_final_recommendation(
-                entity_result, specialty_result, exclusion_result
+                f"Processing text with {self.model} on {self.api_url} "
+                "using multi-step prompting"
             )
 
-            # Combine results into the expected format for the application
-            result = {
-                "chief_complaint": (
-                    entity_result.get("medical_problems", ["Unknown"])[0]
-                    if entity_result.get("medical_problems")
-                    else (
-                        entity_result.get("symptoms", ["Unknown"])[0]
-                        if entity_result.get("symptoms")
-                        else "Unknown"
-                    )
-                ),
-                "clinical_history": entity_result.get(
-                    "medical_history", text[:200] + "..."
-                ),
-                "vital_signs": entity_result.get("vital_signs", {}),
-                "age": entity_result.get("demographics", {}).get("age"),
-                "weight_kg": entity_result.get("demographics", {}).get("weight"),
-                "sex": entity_result.get("demographics", {}).get("sex"),
-                "keywords": entity_result.get("symptoms", [])
-                + entity_result.get("medical_problems", []),
-                "suggested_care_level": recommendation_result.get(
-                    "recommended_care_level", "General"
-                ),
-                "note": f"Generated by {self.model} using multi-step prompting",
-                # New fields from the prompt chain
-                "specialty_needs": specialty_result.get(
-                    "identified_specialties_needed", []
-                ),
-                "exclusion_matches": (
-                    exclusion_result.get("exclusion_criteria_evaluation", [])
-                    if exclusion_result
-                    else []
-                ),
-                "explainability": {
-                    "reasoning": recommendation_result.get("explanation", ""),
-                    "confidence": recommendation_result.get("confidence", 0),
-                },
-            }
+            exclusion_criteria = self._get_exclusion_criteria()
 
-            # Consider human suggestions
-            if human_suggestions and "care_level" in human_suggestions:
-                # If human suggestions include NICU, PICU, or ICU, consider those
-                care_levels = human_suggestions["care_level"]
-                if "NICU" in care_levels:
-                    result["suggested_care_level"] = "NICU"
-                elif "PICU" in care_levels:
-                    result["suggested_care_level"] = "PICU"
-                elif "ICU" in care_levels:
-                    result["suggested_care_level"] = "ICU"
+            combined_result = await self._run_combined_chain(text, exclusion_criteria)
+            if combined_result:
+                chain_results = self._split_combined_result(combined_result)
+            else:
+                chain_results = await self._run_prompt_chain(text, exclusion_criteria)
 
+            result = self._build_result(text, chain_results, human_suggestions)
             logger.info("Successfully processed text with LLM prompt chain")
             return result
 
@@ -671,10 +1618,11 @@ class LLMClassifier:
         Returns:
             Dictionary with basic extracted information
         """
-        from src.llm.classification import parse_patient_text
+        # Lower-case the text once for the parser and the keyword scans below
+        text_lower = text.lower()
 
         # Use the built-in parser function from the project
-        parsed_info = parse_patient_text(text)
+        parsed_info = parse_patient_text(text, text_lower)
 
         # Extract relevant pieces
         potential_conditions = parsed_info.get("potential_conditions", [])
@@ -682,131 +1630,63 @@ class LLMClassifier:
         vital_signs = parsed_info.get("extracted_vital_signs", {})
         summary = parsed_info.get("raw_text_summary", "")
 
-        # Enhanced vital signs extraction with regex
+        # Enhanced vital signs extraction with regex, in one pass over the text
         if not vital_signs:
-            # Try additional regex patterns for vital signs
-            hr_match = re.search(
-                r"(?:HR|heart rate|pulse)[:\s]*([0-9]{2,3})\b", text, re.IGNORECASE
-            )
-            if hr_match:
-                vital_signs["hr"] = hr_match.group(1)
-
-            bp_match = re.search(
-                r"(?:BP|blood pressure)[:\s]*([0-9]{2,3})[\s/]*([0-9]{2,3})\b",
-                text,
-                re.IGNORECASE,
-            )
-            if bp_match:
-                vital_signs["bp"] = f"{bp_match.group(1)}/{bp_match.group(2)}"
-
-            rr_match = re.search(
-                r"(?:RR|resp|respiratory rate)[:\s]*([0-9]{1,2})\b", text, re.IGNORECASE
-            )
-            if rr_match:
-                vital_signs["rr"] = rr_match.group(1)
-
-            o2_match = re.search(
-                r"(?:O2|SpO2|oxygen|sat)[:\s]*([0-9]{1,3})\s*%?\b", text, re.IGNORECASE
-            )
-            if o2_match:
-                vital_signs["o2"] = o2_match.group(1) + "%"
-
-            temp_match = re.search(
-                r"(?:T|temp|temperature)[:\s]*([0-9]{2}(?:\.[0-9])?)\s*(?:C|F)?\b",
-                text,
-                re.IGNORECASE,
-            )
-            if temp_match:
-                vital_signs["temp"] = temp_match.group(1) + "°C"
+            found = {}
+            for match in _VITALS_RE.finditer(text):
+                for name, value in match.groupdict().items():
+                    if value is not None and name not in found:
+                        found[name] = value
+                if len(found) == len(_VITALS_RE.groupindex):
+                    break
+            if "hr" in found:
+                vital_signs["hr"] = found["hr"]
+            if "bp_systolic" in found:
+                vital_signs["bp"] = f"{found['bp_systolic']}/{found['bp_diastolic']}"
+            if "rr" in found:
+                vital_signs["rr"] = found["rr"]
+            if "o2" in found:
+                vital_signs["o2"] = found["o2"] + "%"
+            if "temp" in found:
+                vital_signs["temp"] = found["temp"] + "°C"
 
         # Enhanced keyword extraction
         if not keywords and not potential_conditions:
-            # Common pediatric conditions to check for
-            pediatric_keywords = [
-                "bronchiolitis",
-                "rsv",
-                "pneumonia",
-                "asthma",
-                "croup",
-                "febrile",
-                "sepsis",
-                "dehydration",
-                "seizure",
-                "trauma",
-                "fracture",
-                "respiratory distress",
-                "failure to thrive",
-                "intubation",
-                "ventilator",
-                "shock",
-                "meningitis",
-            ]
-
-            for keyword in pediatric_keywords:
-                if keyword in text.lower():
-                    keywords.append(keyword)
+            keywords.extend(_scan_pediatric_keywords(text_lower))
 
         # Determine a chief complaint (first sentence or summary)
-        sentences = text.split(".")
-        chief_complaint = sentences[0] if sentences else "Unknown"
+        chief_complaint = text.partition(".")[0]
         if len(chief_complaint) > 100:
             chief_complaint = chief_complaint[:100] + "..."
 
         # Consider human suggestions for care level
-        suggested_care_level = "General"
         if human_suggestions and "care_level" in human_suggestions:
-            care_levels = human_suggestions["care_level"]
-            if "NICU" in care_levels:
-                suggested_care_level = "NICU"
-            elif "PICU" in care_levels:
-                suggested_care_level = "PICU"
-            elif "ICU" in care_levels:
-                suggested_care_level = "ICU"
+            suggested_care_level = (
+                _highest_suggested_care_level(human_suggestions["care_level"])
+                or "General"
+            )
+        elif _vitals_critical(vital_signs):
+            # Critical vital signs mean ICU whatever the text says, so the
+            # keyword scan is skipped
+            suggested_care_level = "ICU"
         else:
-            # Try to determine care level from text and vital signs
-            text_lower = text.lower()
-            if (
-                "nicu" in text_lower
-                or "newborn" in text_lower
-                or "neonate" in text_lower
-                or "premature" in text_lower
-            ):
-                suggested_care_level = "NICU"
-            elif "picu" in text_lower or "pediatric icu" in text_lower:
-                suggested_care_level = "PICU"
-            elif "icu" in text_lower or "intensive care" in text_lower:
-                suggested_care_level = "ICU"
-            elif (
-                "respiratory distress" in text_lower
-                or "intubated" in text_lower
-                or "ventilator" in text_lower
-                or "shock" in text_lower
-                or "sepsis" in text_lower
-            ):
-                suggested_care_level = "ICU"
-
-            # Check vital signs for critical values
-            if vital_signs:
-                hr = vital_signs.get("hr", "")
-                if hr and hr.isdigit() and (int(hr) > 180 or int(hr) < 60):
-                    suggested_care_level = "ICU"  # Extreme heart rate
-
-                o2 = vital_signs.get("o2", "")
-                if o2 and o2.strip("%").isdigit() and int(o2.strip("%")) < 90:
-                    suggested_care_level = "ICU"  # Low oxygen saturation
+            # Try to determine care level from the text
+            suggested_care_level = _scan_care_level(text_lower)
 
+        # The keyword list is this call's own copy from the parser
+        keywords.extend(potential_conditions)
         return {
             "chief_complaint": chief_complaint,
             "clinical_history": summary if summary else text[:200] + "...",
             "vital_signs": vital_signs,
-            "keywords": keywords + potential_conditions,
+            "keywords": keywords,
             "suggested_care_level": suggested_care_level,
             "note": "Generated by rule-based system",
         }
 
 
-# Example usage in simulation mode (when run directly)
-if __name__ == "__main__":
+def main():
+    """Run the classifier on an example vignette (when run directly)."""
     # Setup basic logging
     logging.basicConfig(level=logging.INFO)
 
@@ -836,7 +1716,7 @@ if __name__ == "__main__":
             print(f"Connection test: {'Success' if success else 'Failed'} - {message}")
 
         # Process text
-        results = classifier.process_text(example_text)
+        results = classifier.process_text_sync(example_text)
         print("\nResults:")
         print(json.dumps(results, indent=2))
     except Exception as e:
@@ -846,3 +1726,8 @@ if __name__ == "__main__":
         print("\nTrying fallback processing:")
         results = classifier._fallback_process_text(example_text, None)
         print(json.dumps(results, indent=2))
+
+
+# Example usage in simulation mode (when run directly)
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,21 @@ import logging
 import os
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
-
-from PyQt5.QtCore import QSettings, QSize, QStringListModel, Qt, QTime, pyqtSlot
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
+from PyQt5.QtCore import (
+    QObject,
+    QSettings,
+    QSize,
+    QStringListModel,
+    Qt,
+    QThread,
+    QTime,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
 from PyQt5.QtGui import QColor, QFont, QIcon, QPixmap, QTextCursor
 from PyQt5.QtWidgets import (
     QAction,
@@ -56,55 +68,208 @@ from src.core.models import (
     TransportMode,
     WeatherData,
 )
-from src.gui.hospital_search import HospitalSearch
-from src.llm.llm_classifier_refactored import LLMClassifier
 from src.utils.census_updater import update_census
-from src.utils.transport.estimator import TransportTimeEstimator
 
 logger = logging.getLogger(__name__)
 
+# Project data directory (census, hospital and weather files)
+_DATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+)
+
+# Pause in typing, in milliseconds, before the sending facility is searched
+SEARCH_DEBOUNCE_MS = 300
+
+# Parsed hospital files keyed by path, with the modification time they were
+# read at. A census update that changes bed counts rewrites the file, which
+# invalidates its entry
+_HOSPITAL_CACHE: Dict[str, Tuple[float, List[HospitalCampus]]] = {}
+
+# Parses and validates a whole hospital file in one call. pydantic-core's
+# JSON parser measured faster than json.load plus HospitalCampus(**h) per
+# record, and than orjson plus validate_python
+_HOSPITALS_ADAPTER = TypeAdapter(List[HospitalCampus])
+
+
+def _load_hospitals(path: str) -> List[HospitalCampus]:
+    """
+    Load hospital campuses from a JSON file.
+
+    The parsed campuses are reused until the file's modification time
+    changes, which skips JSON decoding and model validation on reloads of an
+    unchanged file.
+
+    Args:
+        path: Path to a JSON file containing an array of hospital campuses
+
+    Returns:
+        List of hospital campuses
+    """
+    # Record the time before reading, so a write during the read triggers
+    # another reload
+    mtime = os.stat(path).st_mtime
+    cached = _HOSPITAL_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+
+    with open(path, "rb") as f:
+        hospitals = _HOSPITALS_ADAPTER.validate_json(f.read())
+    _HOSPITAL_CACHE[path] = (mtime, hospitals)
+    return list(hospitals)
+
+
+class CensusLoader(QObject):
+    """Updates the census and loads hospital campuses off the GUI thread."""
+
+    # Loaded hospitals, the census update time ("" if the update failed) and
+    # the hospital search (None unless build_search was set)
+    finished = pyqtSignal(list, str, object)
+
+    def __init__(
+        self, census_file_path: str, hospital_file_path: str, build_search: bool
+    ):
+        super().__init__()
+        self.census_file_path = census_file_path
+        self.hospital_file_path = hospital_file_path
+        self.build_search = build_search
+
+    @pyqtSlot()
+    def run(self):
+        """Update the hospital file from the census and load the hospitals."""
+        timestamp = ""
+        hospitals = []
+
+        # Attempt to update census data
+        try:
+            # Check if census file exists and log detailed information
+            if os.path.exists(self.census_file_path):
+                logger.info(f"Census file found at {self.census_file_path}")
+
+                # Force update of census data
+                update_success = update_census(
+                    self.census_file_path, self.hospital_file_path
+                )
+
+                if update_success:
+                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    logger.info(f"Census data updated: {timestamp}")
+                else:
+                    logger.warning("Census update failed")
+            else:
+                logger.warning(f"Census file NOT found at {self.census_file_path}")
+        except Exception as e:
+            logger.error(f"Error updating census: {str(e)}")
+
+        # Load hospital data AFTER census update
+        try:
+            logger.info(f"Loading hospital data from {self.hospital_file_path}")
+            hospitals = _load_hospitals(self.hospital_file_path)
+
+            # Log the Austin campus to verify census data was applied. The scan
+            # is skipped unless debug logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                for hospital in hospitals:
+                    if hospital.campus_id == "TCH_NORTH_AUSTIN":
+                        logger.debug(
+                            "Austin hospital loaded: %s with %s general beds, "
+                            "%s ICU beds",
+                            hospital.name,
+                            hospital.bed_census.available_beds,
+                            hospital.bed_census.icu_beds_available,
+                        )
+        except Exception as e:
+            logger.error(f"Error loading hospital data: {str(e)}")
+            hospitals = []
+
+        # HospitalSearch reads the hospital file and geocodes hospitals
+        # missing from the geocode cache, so it is built here after the
+        # census update rather than on the GUI thread
+        search = None
+        if self.build_search:
+            try:
+                from src.gui.hospital_search import HospitalSearch
+
+                search = HospitalSearch()
+            except Exception as e:
+                logger.error(f"Error building hospital search: {str(e)}")
+
+        self.finished.emit(hospitals, timestamp, search)
+
 
 class TransferCenterMainWindow(QMainWindow):
     """Main window for the Transfer Center GUI application."""
 
+    # Indices of the results tabs
+    (
+        _RECOMMENDATION_TAB,
+        _EXPLANATION_TAB,
+        _LLM_TAB,
+        _CENSUS_TAB,
+        _TRANSPORT_TAB,
+    ) = range(5)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.setWindowTitle("Texas Children's Hospital - Transfer Center")
         self.setMinimumSize(1200, 800)  # Back to normal size
 
-        # Use a more compact app-wide font
-        app_font = QFont()
-        app_font.setPointSize(9)  # Smaller text throughout the application
-        QApplication.setFont(app_font)
-
         # State variables
         self.hospitals: List[HospitalCampus] = []
         self.weather_data: Optional[WeatherData] = None
-        self.llm_classifier = LLMClassifier()
-        self.transport_estimator = TransportTimeEstimator()
-        self.hospital_search = HospitalSearch()
+        # Created on first use (see the properties below) so the window can be
+        # shown before the classifier, estimator and geocoder are set up
+        self._llm_classifier = None
+        self._transport_estimator = None
+        self._hospital_search = None
         self.settings = QSettings("TCH", "TransferCenter")
 
         # Census update tracking
         self.last_census_update = self.settings.value(
             "census/last_update", "Never", str
         )
-        self.census_file_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "data",
-            "current_census.csv",
-        )
+        self.census_file_path = os.path.join(_DATA_DIR, "current_census.csv")
         self.hospital_file_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "data",
-            "sample_hospital_campuses.json",
+            _DATA_DIR, "sample_hospital_campuses.json"
         )
 
+        # Background census update, see _start_census_load
+        self._census_thread: Optional[QThread] = None
+        self._census_loader: Optional[CensusLoader] = None
+        self._census_interactive = False
+
         # Initialize UI
         self._init_ui()
         self._load_config()
 
+    @property
+    def llm_classifier(self):
+        """LLM classifier, created on first use."""
+        if self._llm_classifier is None:
+            from src.llm.llm_classifier_refactored import LLMClassifier
+
+            self._llm_classifier = LLMClassifier()
+        return self._llm_classifier
+
+    @property
+    def transport_estimator(self):
+        """Transport time estimator, created on first use."""
+        if self._transport_estimator is None:
+            from src.utils.transport.estimator import TransportTimeEstimator
+
+            self._transport_estimator = TransportTimeEstimator()
+        return self._transport_estimator
+
+    @property
+    def hospital_search(self):
+        """Hospital search, built by CensusLoader or else on first use."""
+        if self._hospital_search is None:
+            from src.gui.hospital_search import HospitalSearch
+
+            self._hospital_search = HospitalSearch()
+        return self._hospital_search
+
     def _init_ui(self):
         """Initialize the user interface."""
         # Central widget and main layout
@@ -269,6 +434,15 @@ class TransferCenterMainWindow(QMainWindow):
         self.search_btn.setFixedWidth(80)  # Prevents the button from changing width
         self.search_btn.clicked.connect(self._search_hospital)
 
+        # Search cached hospitals once typing pauses, instead of per keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._search_hospital_as_typed)
+        self.sending_facility.textEdited.connect(
+            lambda _text: self._search_timer.start()
+        )
+
         search_input_layout.addWidget(
             self.sending_facility, 4
         )  # Give more space to the input field
@@ -334,39 +508,94 @@ class TransferCenterMainWindow(QMainWindow):
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
 
-        # Results Tab Widget
-        results_tabs = QTabWidget()
+        # Results Tab Widget. Only the Recommendation tab is visible at
+        # startup, so the contents of each tab are built on first use.
+        self.results_tabs = QTabWidget()
+        self._tab_builders = {
+            self._RECOMMENDATION_TAB: self._build_recommendation_tab,
+            self._EXPLANATION_TAB: self._build_explanation_tab,
+            self._LLM_TAB: self._build_llm_tab,
+            self._CENSUS_TAB: self._build_census_tab,
+            self._TRANSPORT_TAB: self._build_transport_tab,
+        }
+        self._tabs_built = set()
+        for title in (
+            "Recommendation",
+            "Explanation",
+            "LLM Classification",
+            "Hospital Census",
+            "Transport Analysis",
+        ):
+            tab = QWidget()
+            QVBoxLayout(tab)
+            self.results_tabs.addTab(tab, title)
+        self.results_tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.results_tabs.currentIndex())
 
-        # Recommendation tab
-        recommendation_tab = QWidget()
-        recommendation_layout = QVBoxLayout(recommendation_tab)
+        # Add components to right layout
+        right_layout.addWidget(self.results_tabs)
+
+        # Add panels to splitter
+        splitter.addWidget(left_panel)
+        splitter.addWidget(right_panel)
+        splitter.setSizes([400, 800])
+
+        # Add splitter to main layout
+        main_layout.addWidget(splitter)
+
+        # Set central widget
+        self.setCentralWidget(central_widget)
+
+        # Status bar with census information
+        self.statusBar = QStatusBar()
+        self.setStatusBar(self.statusBar)
+        self.census_status = QLabel(f"Census last updated: {self.last_census_update}")
+        self.statusBar.addPermanentWidget(self.census_status)
+
+        # Menu bar
+        menubar = self.menuBar()
+        file_menu = menubar.addMenu("File")
+        tools_menu = menubar.addMenu("Tools")
+
+        # File menu actions
+        exit_action = QAction("Exit", self)
+        exit_action.triggered.connect(self.close)
+        file_menu.addAction(exit_action)
+
+        # Tools menu actions
+        update_census_action = QAction("Update Census Data", self)
+        update_census_action.triggered.connect(self._update_census_data)
+        tools_menu.addAction(update_census_action)
+
+    def _ensure_tab_built(self, index):
+        """Build the contents of a results tab if it has not been built yet."""
+        if index in self._tabs_built or index not in self._tab_builders:
+            return
+        self._tab_builders[index](self.results_tabs.widget(index).layout())
+        self._tabs_built.add(index)
 
+    def _build_recommendation_tab(self, layout):
+        """Build the Recommendation tab."""
         self.recommendation_output = QTextEdit()
         self.recommendation_output.setReadOnly(True)
         self.recommendation_output.setStyleSheet(
             "background-color: #f5f5f5; color: #333333; font-size: 10pt;"
         )
 
-        recommendation_layout.addWidget(self.recommendation_output)
-        results_tabs.addTab(recommendation_tab, "Recommendation")
-
-        # Explanation tab
-        explanation_tab = QWidget()
-        explanation_layout = QVBoxLayout(explanation_tab)
+        layout.addWidget(self.recommendation_output)
 
+    def _build_explanation_tab(self, layout):
+        """Build the Explanation tab."""
         self.explanation_output = QTextEdit()
         self.explanation_output.setReadOnly(True)
         self.explanation_output.setStyleSheet(
             "background-color: #f5f5f5; color: #333333; font-size: 10pt;"
         )
 
-        explanation_layout.addWidget(self.explanation_output)
-        results_tabs.addTab(explanation_tab, "Explanation")
-
-        # LLM Classification tab
-        llm_tab = QWidget()
-        llm_layout = QVBoxLayout(llm_tab)
+        layout.addWidget(self.explanation_output)
 
+    def _build_llm_tab(self, layout):
+        """Build the LLM Classification tab."""
         self.llm_output = QTextEdit()
         self.llm_output.setReadOnly(True)
         self.llm_output.setStyleSheet(
@@ -399,16 +628,12 @@ class TransferCenterMainWindow(QMainWindow):
         llm_config_layout.addRow("", refresh_button_layout)
         llm_config_box.setLayout(llm_config_layout)
 
-        llm_layout.addWidget(llm_config_box)
-        llm_layout.addWidget(QLabel("Classification Results:"))
-        llm_layout.addWidget(self.llm_output)
-
-        results_tabs.addTab(llm_tab, "LLM Classification")
-
-        # Hospital Census tab
-        census_tab = QWidget()
-        census_layout = QVBoxLayout(census_tab)
+        layout.addWidget(llm_config_box)
+        layout.addWidget(QLabel("Classification Results:"))
+        layout.addWidget(self.llm_output)
 
+    def _build_census_tab(self, layout):
+        """Build the Hospital Census tab."""
         census_box = QGroupBox("Hospital Census Management")
         census_form_layout = QFormLayout()
 
@@ -440,57 +665,17 @@ class TransferCenterMainWindow(QMainWindow):
         census_form_layout.addRow("Available Beds Summary:", self.census_summary)
 
         census_box.setLayout(census_form_layout)
-        census_layout.addWidget(census_box)
-
-        results_tabs.addTab(census_tab, "Hospital Census")
-
-        # Transport Analysis tab
-        transport_tab = QWidget()
-        transport_layout = QVBoxLayout(transport_tab)
+        layout.addWidget(census_box)
 
+    def _build_transport_tab(self, layout):
+        """Build the Transport Analysis tab."""
         self.transport_output = QTextEdit()
         self.transport_output.setReadOnly(True)
         self.transport_output.setStyleSheet(
             "background-color: #f5f5f5; color: #333333; font-size: 10pt;"
         )
 
-        transport_layout.addWidget(self.transport_output)
-        results_tabs.addTab(transport_tab, "Transport Analysis")
-
-        # Add components to right layout
-        right_layout.addWidget(results_tabs)
-
-        # Add panels to splitter
-        splitter.addWidget(left_panel)
-        splitter.addWidget(right_panel)
-        splitter.setSizes([400, 800])
-
-        # Add splitter to main layout
-        main_layout.addWidget(splitter)
-
-        # Set central widget
-        self.setCentralWidget(central_widget)
-
-        # Status bar with census information
-        self.statusBar = QStatusBar()
-        self.setStatusBar(self.statusBar)
-        self.census_status = QLabel(f"Census last updated: {self.last_census_update}")
-        self.statusBar.addPermanentWidget(self.census_status)
-
-        # Menu bar
-        menubar = self.menuBar()
-        file_menu = menubar.addMenu("File")
-        tools_menu = menubar.addMenu("Tools")
-
-        # File menu actions
-        exit_action = QAction("Exit", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Tools menu actions
-        update_census_action = QAction("Update Census Data", self)
-        update_census_action.triggered.connect(self._update_census_data)
-        tools_menu.addAction(update_census_action)
+        layout.addWidget(self.transport_output)
 
     def _update_transport_ui(self, index):
         """Update transport UI elements based on selected transport type."""
@@ -510,11 +695,55 @@ class TransferCenterMainWindow(QMainWindow):
             )
             return
 
-        # Clear previous results
-        self.hospital_results.clear()
+        # An explicit search replaces any pending search-as-you-type
+        self._search_timer.stop()
+
+        # The hospital search is being built by the running census update
+        if self._hospital_search is None and self._census_thread is not None:
+            QMessageBox.information(
+                self,
+                "Hospital Data Loading",
+                "Hospital data is still loading. Please try again in a moment.",
+            )
+            return
 
         # Perform search
         results = self.hospital_search.search_hospitals(query)
+        self._show_search_results(query, results)
+
+    @pyqtSlot()
+    def _search_hospital_as_typed(self):
+        """Search cached hospitals for the sending facility typed so far."""
+        query = self.sending_facility.text().strip()
+
+        # Geocoding is left to the Search button, and nothing is searched
+        # until CensusLoader has built the hospital search, so typing never
+        # waits on the network
+        search = self._hospital_search
+        results = (
+            search.search_hospitals(query, geocode=False) if query and search else []
+        )
+        if not results:
+            self.hospital_results.setVisible(False)
+            return
+        self._show_search_results(query, results)
+
+    def _show_search_results(self, query: str, results: List[Dict]):
+        """Replace the hospital results list with the given search results."""
+        # Repaint the list once, after all results are in
+        self.hospital_results.setUpdatesEnabled(False)
+        try:
+            self._fill_search_results(query, results)
+        finally:
+            self.hospital_results.setUpdatesEnabled(True)
+
+        # Show results
+        self.hospital_results.setVisible(True)
+
+    def _fill_search_results(self, query: str, results: List[Dict]):
+        """Add search results to the list, geocoding the query if there are none."""
+        # Clear previous results
+        self.hospital_results.clear()
 
         if not results:
             # Try geocoding as a fallback
@@ -543,9 +772,6 @@ class TransferCenterMainWindow(QMainWindow):
                 item.setData(Qt.UserRole, hospital)
                 self.hospital_results.addItem(item)
 
-        # Show results
-        self.hospital_results.setVisible(True)
-
     @pyqtSlot(QListWidgetItem)
     def _select_hospital(self, item):
         """Handle hospital selection from search results."""
@@ -578,56 +804,94 @@ class TransferCenterMainWindow(QMainWindow):
 
     def _update_census_data(self):
         """Update hospital campuses with current census data."""
-        try:
-            # Ensure census file exists
-            if not os.path.exists(self.census_file_path):
-                QMessageBox.warning(
-                    self,
-                    "Census File Missing",
-                    f"Census file not found at: {self.census_file_path}\n\n"
-                    "Please ensure the file exists or select a new file.",
-                )
-                return
+        self._ensure_tab_built(self._CENSUS_TAB)
 
-            # Update hospital campuses with current census data
-            update_success = update_census(
-                self.census_file_path, self.hospital_file_path
+        # Ensure census file exists
+        if not os.path.exists(self.census_file_path):
+            QMessageBox.warning(
+                self,
+                "Census File Missing",
+                f"Census file not found at: {self.census_file_path}\n\n"
+                "Please ensure the file exists or select a new file.",
             )
+            return
 
-            if update_success:
-                # Reload hospital data
-                with open(self.hospital_file_path, "r") as f:
-                    hospitals_data = json.load(f)
-                    self.hospitals = [HospitalCampus(**h) for h in hospitals_data]
-
-                # Update last update time
-                self.last_census_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.settings.setValue("census/last_update", self.last_census_update)
-                self.census_last_updated_label.setText(
-                    f"Last updated: {self.last_census_update}"
-                )
+        self._start_census_load(interactive=True)
 
-                # Display census summary
-                self._display_census_summary()
+    def _start_census_load(self, interactive: bool):
+        """
+        Update the census and reload hospitals on a background thread.
 
-                QMessageBox.information(
-                    self,
-                    "Census Update",
-                    "Hospital campus data successfully updated with current census.",
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Census Update Failed",
-                    "Failed to update hospital campus data. Check the log for details.",
-                )
-        except Exception as e:
-            logger.error(f"Error updating census data: {str(e)}")
-            QMessageBox.critical(
+        Args:
+            interactive: Whether the user asked for the update, in which case
+                the outcome is reported in a message box
+        """
+        if self._census_thread is not None:
+            # An update is already running; report its outcome instead of
+            # starting another
+            self._census_interactive = self._census_interactive or interactive
+            return
+
+        self._census_interactive = interactive
+        self._census_thread = QThread(self)
+        self._census_loader = CensusLoader(
+            self.census_file_path,
+            self.hospital_file_path,
+            build_search=self._hospital_search is None,
+        )
+        self._census_loader.moveToThread(self._census_thread)
+        self._census_thread.started.connect(self._census_loader.run)
+        self._census_loader.finished.connect(self._on_census_loaded)
+        self._census_loader.finished.connect(self._census_thread.quit)
+        self._census_thread.finished.connect(self._census_thread.deleteLater)
+        self._census_thread.finished.connect(self._on_census_thread_finished)
+        self._census_thread.start()
+
+    @pyqtSlot(list, str, object)
+    def _on_census_loaded(self, hospitals, timestamp, search):
+        """Apply hospitals and the hospital search loaded by CensusLoader."""
+        self.hospitals = hospitals
+        if search is not None and self._hospital_search is None:
+            self._hospital_search = search
+
+        if timestamp:
+            self.last_census_update = timestamp
+            self.settings.setValue("census/last_update", timestamp)
+            self.census_status.setText(f"Census last updated: {timestamp}")
+            if self._CENSUS_TAB in self._tabs_built:
+                self.census_last_updated_label.setText(f"Last updated: {timestamp}")
+
+        if not self._census_interactive:
+            return
+
+        if timestamp:
+            # Display census summary
+            self._display_census_summary()
+
+            QMessageBox.information(
                 self,
-                "Census Update Error",
-                f"An error occurred while updating census data: {str(e)}",
+                "Census Update",
+                "Hospital campus data successfully updated with current census.",
             )
+        else:
+            QMessageBox.warning(
+                self,
+                "Census Update Failed",
+                "Failed to update hospital campus data. Check the log for details.",
+            )
+
+    @pyqtSlot()
+    def _on_census_thread_finished(self):
+        """Release the census thread so another update can start."""
+        self._census_thread = None
+        self._census_loader = None
+
+    def closeEvent(self, event):
+        """Wait for a running census update before the window closes."""
+        if self._census_thread is not None:
+            self._census_thread.quit()
+            self._census_thread.wait()
+        super().closeEvent(event)
 
     def _display_census_summary(self):
         """Display a summary of available beds from hospital campuses."""
@@ -635,7 +899,8 @@ class TransferCenterMainWindow(QMainWindow):
             self.census_summary.setPlainText("No hospital data loaded.")
             return
 
-        summary_text = """<h3>Hospital Bed Availability Summary</h3>
+        # Built as a list and joined once rather than concatenated per row
+        rows = ["""<h3>Hospital Bed Availability Summary</h3>
 <table border='1' cellpadding='4'>
 <tr>
   <th>Campus</th>
@@ -643,7 +908,7 @@ class TransferCenterMainWindow(QMainWindow):
   <th>ICU Beds</th>
   <th>NICU Beds</th>
   <th>Specialized Units</th>
-</tr>"""
+</tr>"""]
 
         for hospital in self.hospitals:
             specializations = (
@@ -651,90 +916,32 @@ class TransferCenterMainWindow(QMainWindow):
                 if hospital.specializations
                 else "None"
             )
-            summary_text += f"""
+            rows.append(f"""
 <tr>
   <td>{hospital.name}</td>
   <td>{hospital.available_beds.general if hospital.available_beds and hospital.available_beds.general is not None else 'N/A'}</td>
   <td>{hospital.available_beds.icu if hospital.available_beds and hospital.available_beds.icu is not None else 'N/A'}</td>
   <td>{hospital.available_beds.nicu if hospital.available_beds and hospital.available_beds.nicu is not None else 'N/A'}</td>
   <td>{specializations}</td>
-</tr>"""
+</tr>""")
 
-        summary_text += "</table>"
+        rows.append("</table>")
 
-        # Display the formatted HTML table
-        self.census_summary.setHtml(summary_text)
+        # Display the formatted HTML table, repainting once it is all set
+        self.census_summary.setUpdatesEnabled(False)
+        try:
+            self.census_summary.setHtml("".join(rows))
+        finally:
+            self.census_summary.setUpdatesEnabled(True)
         logger.info("Census summary updated in UI")
 
     def _load_config(self):
         """Load hospital and configuration data."""
-        # Attempt to update census data on startup
-        try:
-            # Check if census file exists and log detailed information
-            if os.path.exists(self.census_file_path):
-                logger.info(f"Census file found at {self.census_file_path}")
-                print(f"DEBUG: Census file found at {self.census_file_path}")
-
-                # Force update of census data on startup
-                update_success = update_census(
-                    self.census_file_path, self.hospital_file_path
-                )
-
-                if update_success:
-                    self.last_census_update = datetime.now().strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    self.settings.setValue(
-                        "census/last_update", self.last_census_update
-                    )
-                    logger.info(
-                        f"Census data updated on startup: {self.last_census_update}"
-                    )
-                    print(f"DEBUG: Census data successfully updated on startup")
-                else:
-                    logger.warning("Census update failed during startup")
-                    print("DEBUG: Census update failed during startup")
-            else:
-                logger.warning(f"Census file NOT found at {self.census_file_path}")
-                print(f"DEBUG: Census file NOT found at {self.census_file_path}")
-        except Exception as e:
-            logger.error(f"Error updating census on startup: {str(e)}")
-            print(f"DEBUG: Error updating census on startup: {str(e)}")
-
-        # Load hospital data AFTER census update
-        try:
-            logger.info(f"Loading hospital data from {self.hospital_file_path}")
-            print(f"DEBUG: Loading hospital data from {self.hospital_file_path}")
-
-            with open(self.hospital_file_path, "r") as f:
-                hospitals_data = json.load(f)
-                self.hospitals = [HospitalCampus(**h) for h in hospitals_data]
-
-            # Log some info about the loaded hospitals to verify census data was applied
-            for hospital in self.hospitals:
-                if hospital.campus_id == "TCH_NORTH_AUSTIN":
-                    logger.info(
-                        f"Austin hospital loaded: {
-                            hospital.name} with {
-                            hospital.bed_census.available_beds} general beds, {
-                            hospital.bed_census.icu_beds_available} ICU beds"
-                    )
-                    print(
-                        f"DEBUG: Austin hospital has {
-                            hospital.bed_census.available_beds} general beds, {
-                            hospital.bed_census.icu_beds_available} ICU beds"
-                    )
-        except Exception as e:
-            logger.error(f"Error loading hospital data: {str(e)}")
-            print(f"DEBUG: Error loading hospital data: {str(e)}")
-            self.hospitals = []
+        # Update the census and load hospitals without blocking the window
+        self._start_census_load(interactive=False)
 
         # Load weather data
-        weather_file = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "data",
-            "sample_weather_conditions.json",
-        )
+        weather_file = os.path.join(_DATA_DIR, "sample_weather_conditions.json")
         try:
             with open(weather_file, "r") as f:
                 weather_data = json.load(f)
@@ -744,6 +951,7 @@ class TransferCenterMainWindow(QMainWindow):
             self.weather_data = None
 
             # Load saved settings
+            self._ensure_tab_built(self._LLM_TAB)
             api_url = self.settings.value("llm/api_url", "http://localhost:1234/v1")
             model_name = self.settings.value("llm/model_name", "")
 
@@ -905,6 +1113,15 @@ class TransferCenterMainWindow(QMainWindow):
     @pyqtSlot()
     def _on_submit(self):
         """Process the form submission and generate recommendations."""
+        # The hospitals are replaced when the running census update finishes
+        if self._census_thread is not None:
+            QMessageBox.information(
+                self,
+                "Hospital Data Loading",
+                "Hospital data is still loading. Please try again in a moment.",
+            )
+            return
+
         # Validate inputs
         if not self.patient_id_input.text().strip():
             QMessageBox.warning(self, "Input Error", "Please enter a patient ID")
@@ -920,6 +1137,10 @@ class TransferCenterMainWindow(QMainWindow):
             )
             return
 
+        # The LLM settings and the output tabs are read and written below
+        for index in self._tab_builders:
+            self._ensure_tab_built(index)
+
         # Check if we have a valid model selected
         current_model = self.llm_model_combo.currentText()
         if current_model in [
@@ -1288,6 +1509,11 @@ def main():
     # Set application style
     app.setStyle("Fusion")
 
+    # Use a more compact app-wide font, set before any widget exists
+    app_font = QFont()
+    app_font.setPointSize(9)  # Smaller text throughout the application
+    app.setFont(app_font)
+
     # Create and show the main window
     main_window = TransferCenterMainWindow()
     main_window.show()
@@ -65,10 +65,6 @@ class TransferCenterMainWindow(QMainWindow):
         self.setWindowTitle("Texas Children's Hospital - Transfer Center")
         self.setMinimumSize(1200, 800)
 
-        app_font = QFont()
-        app_font.setPointSize(9)
-        QApplication.setFont(app_font)
-
         self.hospitals: List[HospitalCampus] = []
         self.weather_data: Optional[WeatherData] = None
         self.llm_classifier = LLMClassifier()
@@ -931,6 +927,9 @@ class TransferCenterMainWindow(QMainWindow):
 def main():
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app_font = QFont()
+    app_font.setPointSize(9)
+    app.setFont(app_font)
     main_window = TransferCenterMainWindow()
     main_window.show()
     sys.exit(app.exec_())
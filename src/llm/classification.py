@@ -8,7 +8,7 @@ more sophisticated NLP/LLM capabilities.
 """
 
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # (Keep PREDEFINED_KEYWORDS_TO_CONDITIONS from previous version)
 PREDEFINED_KEYWORDS_TO_CONDITIONS: Dict[str, List[str]] = {
@@ -88,7 +88,7 @@ LOCATION_CUE_PATTERNS = [
 ]
 
 
-def parse_patient_text(text: str) -> Dict:
+def parse_patient_text(text: str, text_lower: Optional[str] = None) -> Dict:
     """
     Parses raw patient text to extract keywords, potential conditions,
     simulated vital signs, location cues, and a raw summary.
@@ -99,6 +99,7 @@ def parse_patient_text(text: str) -> Dict:
 
     Args:
         text: The raw unstructured patient text (e.g., from clinical notes).
+        text_lower: The text already lower-cased by the caller, if available.
 
     Returns:
         A dictionary containing the extracted information:
@@ -119,7 +120,8 @@ def parse_patient_text(text: str) -> Dict:
             "raw_text_summary": "",
         }
 
-    text_lower = text.lower()  # Used for keyword matching
+    if text_lower is None:
+        text_lower = text.lower()  # Used for keyword matching
 
     # 1. Keyword-based condition identification (from previous version)
     identified_keywords: List[str] = []
@@ -66,27 +66,27 @@ class ExclusionEvaluator:
             logger.debug(f"Exclusion evaluation raw response: {content}")
 
             # Parse JSON from response
-            try:
-                # Find JSON content between triple backticks
-                if "```json" in content and "```" in content.split("```json", 1)[1]:
-                    json_content = content.split("```json", 1)[1].split("```", 1)[0]
-                    evaluation = json.loads(json_content)
-                elif "```" in content and "```" in content.split("```", 1)[1]:
-                    json_content = content.split("```", 1)[1].split("```", 1)[0]
-                    evaluation = json.loads(json_content)
-                else:
-                    # Try direct JSON parsing
-                    evaluation = json.loads(content)
-
-                logger.info("Exclusion evaluation successful")
-                return evaluation
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing JSON from LLM response: {e}")
-                # Fallback to simple evaluation
-                return self._fallback_evaluation(extracted_entities, exclusion_criteria)
-
+            # Find JSON content between triple backticks
+            if "```json" in content and "```" in content.split("```json", 1)[1]:
+                json_content = content.split("```json", 1)[1].split("```", 1)[0]
+                evaluation = json.loads(json_content)
+            elif "```" in content and "```" in content.split("```", 1)[1]:
+                json_content = content.split("```", 1)[1].split("```", 1)[0]
+                evaluation = json.loads(json_content)
+            else:
+                # Try direct JSON parsing
+                evaluation = json.loads(content)
+
+            logger.info("Exclusion evaluation successful")
+            return evaluation
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing JSON from LLM response: {e}")
+            # Fallback to simple evaluation
+            return self._fallback_evaluation(extracted_entities, exclusion_criteria)
         except Exception as e:
             logger.error(f"Error during exclusion evaluation: {e}")
+            # Fallback to simple evaluation
             return self._fallback_evaluation(extracted_entities, exclusion_criteria)
 
     def _build_evaluation_prompt(
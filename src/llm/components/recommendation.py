@@ -15,10 +15,98 @@ from src.llm.llm_logging import get_llm_logger
 
 from src.core.models import Recommendation
 from src.core.decision.confidence_estimator import calculate_recommendation_confidence
-from src.llm.utils import robust_json_parser
+from src.llm.utils import first_present, robust_json_parser
 
 logger = logging.getLogger(__name__)
 
+# Prompt sections that do not depend on the patient, built once at import
+_PROMPT_TEMPLATE = """
+# Transfer Recommendation Request
+
+## Patient Information
+{patient_info}
+
+## Specialty Assessment
+{specialty_info}
+
+## Exclusion Criteria
+{exclusion_info}"""
+
+_RECOMMENDATION_TASK = """
+## Recommendation Task
+Based on the above information, provide a hospital transfer recommendation. Consider:
+1. The patient's care needs and suggested care level
+2. Any excluded campuses or specialties
+3. Proximity to the patient's location
+4. Availability of required services
+5. Current bed availability
+"""
+
+_SCORING_GUIDANCE = """
+6. Pediatric severity scores should heavily influence your recommendation, especially:
+   - Use PEWS, TRAP scores to determine transport requirements
+   - Use PRISM III scores to assess mortality risk
+   - Use CAMEO II scores to determine nursing care needs
+   - Explicitly reference the scores in your reasoning
+"""
+
+_JSON_INSTRUCTIONS = """
+Use the above information to provide a hospital transfer recommendation in the following JSON format:
+```json
+{
+  "recommended_campus": string,       // The recommended campus or hospital name
+  "care_level": string,               // Recommended care level (general_floor, intermediate_care, intensive_care, etc.)
+  "confidence_score": number,         // Confidence score (0-100) for this recommendation
+  "clinical_reasoning": string,       // Clinical justification for the recommendation
+  "campus_scores": {                  // Detailed scoring for each considered campus
+    "primary": {
+      "location": number,             // Score for location proximity (1-5)
+      "specific_resources": number    // Score for specific resources needed (1-5)
+    },
+    "backup": {                       // Optional backup recommendation
+      "location": number,
+      "specific_resources": number
+    }
+  },
+  "bed_availability": {
+    "confirmed": boolean,             // Whether bed availability was confirmed
+    "availability_notes": string      // Notes on bed availability status
+  },
+  "traffic_report": {
+    "estimated_transport_time": string,  // Estimated transport time to facility
+    "traffic_conditions": string,        // Current traffic conditions (normal, heavy, etc.)
+    "route_notes": string                // Any notes about the transport route
+  }
+}
+```
+
+Do not include any text before or after the JSON. Only return a valid JSON object.
+"""
+
+# Alternative keys for the same field, in order of preference
+_ALL_DATA_KEYS = ("all_data", "original_response")
+_TRANSPORT_KEYS = ("transport_report", "traffic_report")
+_CLINICAL_INFO_KEYS = ("clinical_information", "clinical_info")
+
+# Most list entries (e.g. exclusion reasons) included in a prompt section
+_MAX_PROMPT_ITEMS = 10
+
+
+def _limit_prompt_items(items: List[str], limit: int = _MAX_PROMPT_ITEMS) -> List[str]:
+    """
+    Cap a list of prompt entries, noting how many were left out.
+
+    Args:
+        items: Entries to include in the prompt
+        limit: Maximum number of entries to keep
+
+    Returns:
+        At most limit entries, plus an "... and N more" entry if any were dropped
+    """
+    if len(items) <= limit:
+        return items
+    return items[:limit] + [f"... and {len(items) - limit} more"]
+
 
 class RecommendationGenerator:
     """Handles generation of final recommendations based on all previous assessments."""
@@ -187,48 +275,18 @@ class RecommendationGenerator:
                 census_data
             )
             
-            # Add JSON instructions
-            json_instructions = """
-Use the above information to provide a hospital transfer recommendation in the following JSON format:
-```json
-{
-  "recommended_campus": string,       // The recommended campus or hospital name
-  "care_level": string,               // Recommended care level (general_floor, intermediate_care, intensive_care, etc.)
-  "confidence_score": number,         // Confidence score (0-100) for this recommendation
-  "clinical_reasoning": string,       // Clinical justification for the recommendation
-  "campus_scores": {                  // Detailed scoring for each considered campus
-    "primary": {
-      "location": number,             // Score for location proximity (1-5)
-      "specific_resources": number    // Score for specific resources needed (1-5)
-    },
-    "backup": {                       // Optional backup recommendation
-      "location": number,
-      "specific_resources": number
-    }
-  },
-  "bed_availability": {
-    "confirmed": boolean,             // Whether bed availability was confirmed
-    "availability_notes": string      // Notes on bed availability status
-  },
-  "traffic_report": {
-    "estimated_transport_time": string,  // Estimated transport time to facility
-    "traffic_conditions": string,        // Current traffic conditions (normal, heavy, etc.)
-    "route_notes": string                // Any notes about the transport route
-  }
-}
-```
-
-Do not include any text before or after the JSON. Only return a valid JSON object.
-"""
+            # Build the full prompt once for logging and the API call
+            full_prompt = prompt + _JSON_INSTRUCTIONS
             
             # Call the LLM with extensive logging
             logger.info(f"========== SENDING RECOMMENDATION PROMPT TO {self.model} ===========")
-            logger.debug(f"FULL RECOMMENDATION PROMPT:\n{prompt + json_instructions}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"FULL RECOMMENDATION PROMPT:\n{full_prompt}")
             
             # Print to console for debugging
             print(f"===== SENDING RECOMMENDATION PROMPT =====")
-            print(f"Prompt length: {len(prompt + json_instructions)} characters")
-            print(f"JSON schema included: {len(json_instructions)} characters")
+            print(f"Prompt length: {len(full_prompt)} characters")
+            print(f"JSON schema included: {len(_JSON_INSTRUCTIONS)} characters")
             
             # Get the LLM logger
             llm_logger = get_llm_logger()
@@ -239,14 +297,14 @@ Do not include any text before or after the JSON. Only return a valid JSON objec
                     "role": "system",
                     "content": "You are a hospital transfer coordinator. Respond ONLY with valid JSON.",
                 },
-                {"role": "user", "content": prompt + json_instructions},
+                {"role": "user", "content": full_prompt},
             ]
             
             # Log the prompt BEFORE sending it (pre-call logging)
             llm_logger.log_prompt(
                 component="RecommendationGenerator",
                 method="_try_llm_recommendation",
-                prompt=prompt + json_instructions,
+                prompt=full_prompt,
                 model=self.model,
                 messages=messages,
                 metadata={
@@ -287,7 +345,7 @@ Do not include any text before or after the JSON. Only return a valid JSON objec
                 method="_try_llm_recommendation",
                 input_data={
                     "prompt": prompt,
-                    "json_instructions": json_instructions,
+                    "json_instructions": _JSON_INSTRUCTIONS,
                     "messages": messages
                 },
                 output_data=content,
@@ -732,7 +790,7 @@ Do not include any text before or after the JSON. Only return a valid JSON objec
                 confidence = 70.0
                 
             # Calculate legitimate confidence score based on available data
-            all_data = standardized.get("all_data", standardized.get("original_response", {}))
+            all_data = first_present(standardized, _ALL_DATA_KEYS, {})
             specialty_data = standardized.get("specialty_data", {})
             exclusion_data = standardized.get("exclusion_data", {})
             recommendation_data = {
@@ -822,7 +880,7 @@ Do not include any text before or after the JSON. Only return a valid JSON objec
                 )
 
             # Extract transport details from standardized data or create defaults
-            transport_details = standardized.get('transport_report', standardized.get('traffic_report', {}))
+            transport_details = first_present(standardized, _TRANSPORT_KEYS, {})
             if not transport_details or not isinstance(transport_details, dict):
                 transport_details = {
                     'mode': 'Unknown',
@@ -926,7 +984,7 @@ Do not include any text before or after the JSON. Only return a valid JSON objec
         # Format available hospitals if provided
         hospitals_info = ""
         if available_hospitals and isinstance(available_hospitals, list) and len(available_hospitals) > 0:
-            hospitals_info = "Available hospitals/campuses:\n"
+            hospital_entries = []
             for i, hospital in enumerate(available_hospitals):
                 name = hospital.get('name', 'Unknown Hospital')
                 campus_id = hospital.get('campus_id', 'unknown')
@@ -947,81 +1005,57 @@ Do not include any text before or after the JSON. Only return a valid JSON objec
                     if lat is not None and lng is not None:
                         location_info = f"Location coordinates: {lat}, {lng}\n"
                 
-                hospitals_info += f"{i+1}. {name} (ID: {campus_id})\n"
-                hospitals_info += f"   Care Levels: {care_levels_str}\n"
-                hospitals_info += f"   Specialties: {specialties_str}\n"
-                hospitals_info += f"   {location_info}"
-                
-                # Add separator between hospitals
-                if i < len(available_hospitals) - 1:
-                    hospitals_info += "\n"
+                hospital_entries.append(
+                    f"{i+1}. {name} (ID: {campus_id})\n"
+                    f"   Care Levels: {care_levels_str}\n"
+                    f"   Specialties: {specialties_str}\n"
+                    f"   {location_info}"
+                )
+            
+            # Blank line between hospitals
+            hospitals_info = "Available hospitals/campuses:\n" + "\n".join(hospital_entries)
         
         # Format census data if available
         census_info = ""
         if census_data and isinstance(census_data, dict):
-            census_info = "Current Hospital Census:\n"
+            census_lines = ["Current Hospital Census:\n"]
             for campus_id, data in census_data.items():
                 if isinstance(data, dict):
-                    census_info += f"- {campus_id}: "
-                    for unit, beds in data.items():
-                        available = beds.get('available', 'Unknown')
-                        total = beds.get('total', 'Unknown')
-                        census_info += f"{unit}: {available}/{total} beds available, "
-                    census_info = census_info.rstrip(", ") + "\n"
+                    units = "".join(
+                        f"{unit}: {beds.get('available', 'Unknown')}/{beds.get('total', 'Unknown')} beds available, "
+                        for unit, beds in data.items()
+                    )
+                    census_lines.append(f"- {campus_id}: {units}".rstrip(", ") + "\n")
+            census_info = "".join(census_lines)
         
-        # Build final prompt
-        prompt = f"""
-# Transfer Recommendation Request
-
-## Patient Information
-{patient_info}
-
-## Specialty Assessment
-{specialty_info}
-
-## Exclusion Criteria
-{exclusion_info}"""
+        # Build final prompt from its sections in one join
+        sections = [
+            _PROMPT_TEMPLATE.format(
+                patient_info=patient_info,
+                specialty_info=specialty_info,
+                exclusion_info=exclusion_info,
+            )
+        ]
 
         # Add available hospitals section if we have hospital data
         if hospitals_info:
-            prompt += f"""
+            sections.append(f"\n\n## Available Hospitals\n{hospitals_info}")
 
-## Available Hospitals
-{hospitals_info}"""
-            
         # Add census data if available
         if census_info:
-            prompt += f"""
-
-## Bed Census
-{census_info}"""
+            sections.append(f"\n\n## Bed Census\n{census_info}")
 
         # Add scoring data if available
         if has_scores:
-            prompt += f"""
-## Pediatric Scoring Data
-{scoring_info}
-"""
+            sections.append(f"\n## Pediatric Scoring Data\n{scoring_info}\n")
 
-        prompt += """
-## Recommendation Task
-Based on the above information, provide a hospital transfer recommendation. Consider:
-1. The patient's care needs and suggested care level
-2. Any excluded campuses or specialties
-3. Proximity to the patient's location
-4. Availability of required services
-5. Current bed availability
-"""
+        sections.append(_RECOMMENDATION_TASK)
 
         # Add explanation of how to use scoring data if available
         if has_scores:
-            prompt += """
-6. Pediatric severity scores should heavily influence your recommendation, especially:
-   - Use PEWS, TRAP scores to determine transport requirements
-   - Use PRISM III scores to assess mortality risk
-   - Use CAMEO II scores to determine nursing care needs
-   - Explicitly reference the scores in your reasoning
-"""
+            sections.append(_SCORING_GUIDANCE)
+
+        prompt = "".join(sections)
 
         # Log the prompt size
         logger.debug(f"Recommendation prompt size: {len(prompt)} characters")
@@ -1053,7 +1087,7 @@ Based on the above information, provide a hospital transfer recommendation. Cons
                 vitals_text.append(f"- {display_name}: {vital_signs[vital_key]}")
 
         # Extract clinical information
-        clinical_info = entities.get("clinical_information", entities.get("clinical_info", {}))
+        clinical_info = first_present(entities, _CLINICAL_INFO_KEYS, {})
         chief_complaint = clinical_info.get("chief_complaint", "Unknown")
         clinical_history = clinical_info.get("clinical_history", "No history provided")
 
@@ -1124,7 +1158,8 @@ Based on the above information, provide a hospital transfer recommendation. Cons
         if "excluded_campuses" in exclusion and exclusion["excluded_campuses"]:
             excluded = exclusion["excluded_campuses"]
             if isinstance(excluded, list):
-                output.append(f"- Excluded Campuses: {', '.join(excluded)}")
+                campus_names = _limit_prompt_items(list(dict.fromkeys(str(campus) for campus in excluded)))
+                output.append(f"- Excluded Campuses: {', '.join(campus_names)}")
             else:
                 output.append(f"- Excluded Campuses: {excluded}")
 
@@ -1132,9 +1167,16 @@ Based on the above information, provide a hospital transfer recommendation. Cons
         if "exclusion_reasons" in exclusion and exclusion["exclusion_reasons"]:
             reasons = exclusion["exclusion_reasons"]
             if isinstance(reasons, dict):
-                reason_texts = []
+                # Campuses excluded for the same reason share one line
+                campuses_by_reason = {}
                 for campus, reason in reasons.items():
-                    reason_texts.append(f"{campus}: {reason}")
+                    campuses_by_reason.setdefault(str(reason), []).append(str(campus))
+                reason_texts = _limit_prompt_items(
+                    [f"{', '.join(campuses)}: {reason}" for reason, campuses in campuses_by_reason.items()]
+                )
+                output.append("- Exclusion Reasons:\n  - " + "\n  - ".join(reason_texts))
+            elif isinstance(reasons, list):
+                reason_texts = _limit_prompt_items(list(dict.fromkeys(str(reason) for reason in reasons)))
                 output.append("- Exclusion Reasons:\n  - " + "\n  - ".join(reason_texts))
             else:
                 output.append(f"- Exclusion Reasons: {reasons}")
@@ -1162,7 +1204,8 @@ Based on the above information, provide a hospital transfer recommendation. Cons
         if not scoring_results or not isinstance(scoring_results, dict):
             return "No pediatric scoring data available."
             
-        formatted_text = ""
+        # Collect the sections and join once at the end
+        parts = []
         
         # Process each score type
         if "scores" in scoring_results and scoring_results["scores"]:
@@ -1171,121 +1214,121 @@ Based on the above information, provide a hospital transfer recommendation. Cons
             # PEWS (Pediatric Early Warning Score)
             if "pews" in scores:
                 pews = scores["pews"]
-                formatted_text += "### PEWS (Pediatric Early Warning Score)\n"
-                formatted_text += f"- Total Score: {pews.get('total_score', 'N/A')}\n"
-                formatted_text += f"- Interpretation: {pews.get('interpretation', 'N/A')}\n"
+                parts.append("### PEWS (Pediatric Early Warning Score)\n")
+                parts.append(f"- Total Score: {pews.get('total_score', 'N/A')}\n")
+                parts.append(f"- Interpretation: {pews.get('interpretation', 'N/A')}\n")
                 
                 # Add subscores if available
                 if "subscores" in pews:
                     subscores = pews["subscores"]
-                    formatted_text += "- Subscores:\n"
+                    parts.append("- Subscores:\n")
                     for subscore_name, value in subscores.items():
-                        formatted_text += f"  - {subscore_name}: {value}\n"
+                        parts.append(f"  - {subscore_name}: {value}\n")
                 
                 # Add recommended actions
                 if "recommended_actions" in pews:
                     actions = pews["recommended_actions"]
-                    formatted_text += "- Recommended Actions:\n"
+                    parts.append("- Recommended Actions:\n")
                     if isinstance(actions, list):
                         for action in actions:
-                            formatted_text += f"  - {action}\n"
+                            parts.append(f"  - {action}\n")
                     else:
-                        formatted_text += f"  - {actions}\n"
+                        parts.append(f"  - {actions}\n")
                 
-                formatted_text += "\n"
+                parts.append("\n")
             
             # TRAP (Transport Risk Assessment in Pediatrics)
             if "trap" in scores:
                 trap = scores["trap"]
-                formatted_text += "### TRAP (Transport Risk Assessment in Pediatrics)\n"
-                formatted_text += f"- Total Score: {trap.get('total_score', 'N/A')}\n"
-                formatted_text += f"- Risk Level: {trap.get('risk_level', 'N/A')}\n"
+                parts.append("### TRAP (Transport Risk Assessment in Pediatrics)\n")
+                parts.append(f"- Total Score: {trap.get('total_score', 'N/A')}\n")
+                parts.append(f"- Risk Level: {trap.get('risk_level', 'N/A')}\n")
                 
                 # Add subscores
                 if "subscores" in trap:
                     subscores = trap["subscores"]
-                    formatted_text += "- System Assessments:\n"
+                    parts.append("- System Assessments:\n")
                     for system, value in subscores.items():
-                        formatted_text += f"  - {system}: {value}\n"
+                        parts.append(f"  - {system}: {value}\n")
                 
                 # Add transport team recommendation
                 if "transport_team_recommendation" in trap:
-                    formatted_text += f"- Transport Team: {trap['transport_team_recommendation']}\n"
+                    parts.append(f"- Transport Team: {trap['transport_team_recommendation']}\n")
                 
-                formatted_text += "\n"
+                parts.append("\n")
             
             # PRISM III
             if "prism_iii" in scores:
                 prism = scores["prism_iii"]
-                formatted_text += "### PRISM III (Pediatric Risk of Mortality)\n"
-                formatted_text += f"- Total Score: {prism.get('total_score', 'N/A')}\n"
-                formatted_text += f"- Mortality Risk: {prism.get('mortality_risk', 'N/A')}\n"
+                parts.append("### PRISM III (Pediatric Risk of Mortality)\n")
+                parts.append(f"- Total Score: {prism.get('total_score', 'N/A')}\n")
+                parts.append(f"- Mortality Risk: {prism.get('mortality_risk', 'N/A')}\n")
                 
                 # Add variable scores
                 if "variable_scores" in prism:
                     variables = prism["variable_scores"]
-                    formatted_text += "- Physiologic Variables:\n"
+                    parts.append("- Physiologic Variables:\n")
                     for variable, value in variables.items():
-                        formatted_text += f"  - {variable}: {value}\n"
+                        parts.append(f"  - {variable}: {value}\n")
                 
-                formatted_text += "\n"
+                parts.append("\n")
             
             # CAMEO II
             if "cameo_ii" in scores:
                 cameo = scores["cameo_ii"]
-                formatted_text += "### CAMEO II (Complexity Assessment and Monitoring)\n"
-                formatted_text += f"- Total Score: {cameo.get('total_score', 'N/A')}\n"
-                formatted_text += f"- Acuity Level: {cameo.get('acuity_level', 'N/A')}\n"
+                parts.append("### CAMEO II (Complexity Assessment and Monitoring)\n")
+                parts.append(f"- Total Score: {cameo.get('total_score', 'N/A')}\n")
+                parts.append(f"- Acuity Level: {cameo.get('acuity_level', 'N/A')}\n")
                 
                 # Add domain scores
                 if "domain_scores" in cameo:
                     domains = cameo["domain_scores"]
-                    formatted_text += "- Domain Scores:\n"
+                    parts.append("- Domain Scores:\n")
                     for domain, value in domains.items():
-                        formatted_text += f"  - {domain}: {value}\n"
+                        parts.append(f"  - {domain}: {value}\n")
                 
                 # Add staffing recommendation
                 if "recommended_nurse_ratio" in cameo:
-                    formatted_text += f"- Recommended Nurse Ratio: {cameo['recommended_nurse_ratio']}\n"
+                    parts.append(f"- Recommended Nurse Ratio: {cameo['recommended_nurse_ratio']}\n")
                 
-                formatted_text += "\n"
+                parts.append("\n")
                 
         # Add recommended care level information
         if "recommended_care_levels" in scoring_results:
             care_levels = scoring_results["recommended_care_levels"]
-            formatted_text += "### Care Level Recommendations Based on Scores\n"
+            parts.append("### Care Level Recommendations Based on Scores\n")
             
             # Handle both list and dictionary formats
             if isinstance(care_levels, dict):
                 # Dictionary format with score_name: level pairs
                 for score_name, level in care_levels.items():
-                    formatted_text += f"- {score_name}: {level}\n"
+                    parts.append(f"- {score_name}: {level}\n")
             elif isinstance(care_levels, list):
                 # List format with just the levels
                 for level in care_levels:
-                    formatted_text += f"- Recommended: {level}\n"
+                    parts.append(f"- Recommended: {level}\n")
             else:
                 # Single string format
-                formatted_text += f"- Recommended: {care_levels}\n"
+                parts.append(f"- Recommended: {care_levels}\n")
             
-            formatted_text += "\n"
+            parts.append("\n")
             
         # Add justifications for score-based recommendations
         if "justifications" in scoring_results:
             justifications = scoring_results["justifications"]
-            formatted_text += "### Score-Based Justifications\n"
+            parts.append("### Score-Based Justifications\n")
             
             # Handle both list and dictionary formats for justifications
             if isinstance(justifications, dict):
                 # Dictionary format with score_name: justification pairs
                 for score_name, justification in justifications.items():
-                    formatted_text += f"- {score_name}: {justification}\n"
+                    parts.append(f"- {score_name}: {justification}\n")
             elif isinstance(justifications, list):
                 # List format with just the justifications
                 for i, justification in enumerate(justifications):
-                    formatted_text += f"- Justification {i+1}: {justification}\n"
+                    parts.append(f"- Justification {i+1}: {justification}\n")
             else:
                 # Single string format
-                formatted_text += f"- Justification: {justifications}\n"
+                parts.append(f"- Justification: {justifications}\n")
                 
-        return formatted_text
+        return "".join(parts)
@@ -17,9 +17,8 @@ from src.llm.classification import determine_care_level, parse_patient_text
 from src.llm.llm_client import get_llm_client
 from src.llm.prompt_chain import analyze_clinical_vignette
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class LLMInterface:
@@ -5,16 +5,25 @@ This module provides a client interface for making calls to the LLM API.
 It handles authentication, request formatting, and error handling.
 """
 
+import functools
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Default number of deterministic (temperature 0) responses kept per client
+RESPONSE_CACHE_SIZE = 2048
+
+# Default number of concurrent API calls made by generate_batch
+DEFAULT_BATCH_WORKERS = 4
 
 
 class LLMClient:
@@ -23,15 +32,28 @@ class LLMClient:
     Supports multiple providers with fallback mechanisms.
     """
 
-    def __init__(self, provider: str = "openai", api_key: Optional[str] = None):
+    def __init__(
+        self,
+        provider: str = "openai",
+        api_key: Optional[str] = None,
+        cache_size: int = RESPONSE_CACHE_SIZE,
+    ):
         """
         Initialize the LLM client.
 
         Args:
             provider: The LLM provider to use (default: "openai")
             api_key: API key for the provider (default: None, will try to get from environment)
+            cache_size: Maximum number of temperature 0 responses to cache (0 disables)
         """
         self.provider = provider
+        self.cache_size = cache_size
+        self._response_cache: "OrderedDict[Tuple[str, str, str, int], str]" = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
+        # Reuse HTTP connections across calls instead of reconnecting each time
+        self._session = requests.Session()
         self.api_key = api_key or os.environ.get(f"{provider.upper()}_API_KEY")
 
         if not self.api_key:
@@ -86,6 +108,144 @@ class LLMClient:
             max_tokens: Maximum number of tokens to generate
             temperature: Temperature for response generation (0.0 = deterministic)
 
+        Returns:
+            LLM response as a string
+        """
+        # Deterministic calls with an identical prompt (e.g. re-explaining the
+        # same recommendation) are served from an LRU cache instead of the API
+        if temperature != 0.0 or self.cache_size <= 0:
+            return self._generate_uncached(prompt, max_tokens, temperature)
+
+        cache_key = (self.provider, self.config["model"], prompt, max_tokens)
+        with self._cache_lock:
+            response = self._response_cache.get(cache_key)
+            if response is not None:
+                self._response_cache.move_to_end(cache_key)
+                return response
+
+        response = self._generate_uncached(prompt, max_tokens, temperature)
+
+        # Error responses are not cached so the next call retries the API
+        if not response.startswith("ERROR:"):
+            with self._cache_lock:
+                self._response_cache[cache_key] = response
+                if len(self._response_cache) > self.cache_size:
+                    self._response_cache.popitem(last=False)
+        return response
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        max_tokens: int = 2000,
+        temperature: float = 0.0,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+    ) -> List[str]:
+        """
+        Generate responses for several prompts concurrently.
+
+        Each call spends almost all of its time waiting on the API, so the
+        prompts are sent from a small thread pool. Identical prompts are sent
+        once.
+
+        Args:
+            prompts: The prompts to send to the LLM
+            max_tokens: Maximum number of tokens to generate per prompt
+            temperature: Temperature for response generation
+            max_workers: Maximum number of concurrent API calls
+
+        Returns:
+            LLM responses as strings, in prompt order
+        """
+        unique_prompts = list(dict.fromkeys(prompts))
+        if len(unique_prompts) <= 1 or max_workers <= 1:
+            responses = [
+                self.generate(prompt, max_tokens, temperature)
+                for prompt in unique_prompts
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(unique_prompts))
+            ) as executor:
+                responses = list(
+                    executor.map(
+                        lambda prompt: self.generate(prompt, max_tokens, temperature),
+                        unique_prompts,
+                    )
+                )
+
+        response_by_prompt = dict(zip(unique_prompts, responses))
+        return [response_by_prompt[prompt] for prompt in prompts]
+
+    def generate_stream(
+        self, prompt: str, max_tokens: int = 2000, temperature: float = 0.0
+    ) -> Iterator[str]:
+        """
+        Generate a response from the LLM, yielding text as it arrives.
+
+        Lets callers show or parse the start of a long response before the
+        rest is generated. Streamed responses are not cached and do not fall
+        back to another provider.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            max_tokens: Maximum number of tokens to generate
+            temperature: Temperature for response generation
+
+        Yields:
+            Chunks of the response text, in order
+
+        Raises:
+            Exception: If the API returns an error status
+        """
+        is_anthropic = self.provider == "anthropic"
+        path = "messages" if is_anthropic else "chat/completions"
+        payload = {
+            "model": self.config["model"],
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }
+
+        with self._session.post(
+            f"{self.config['base_url']}/{path}",
+            headers=self.config["headers"],
+            json=payload,
+            stream=True,
+        ) as response:
+            if response.status_code != 200:
+                logger.error(
+                    f"Streaming API error: {response.status_code} - {response.text}"
+                )
+                raise Exception(f"Streaming API error: {response.status_code}")
+
+            # Both providers send server-sent events, one JSON object per line
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:") :].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                if is_anthropic:
+                    text = event.get("delta", {}).get("text")
+                else:
+                    choices = event.get("choices") or [{}]
+                    text = choices[0].get("delta", {}).get("content")
+                if text:
+                    yield text
+
+    def _generate_uncached(
+        self, prompt: str, max_tokens: int = 2000, temperature: float = 0.0
+    ) -> str:
+        """
+        Generate a response from the LLM, with provider fallback.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            max_tokens: Maximum number of tokens to generate
+            temperature: Temperature for response generation
+
         Returns:
             LLM response as a string
         """
@@ -104,27 +264,29 @@ class LLMClient:
             # Attempt fallback to an alternative provider
             if self.provider != "openai":
                 logger.info("Attempting fallback to OpenAI")
-                old_provider = self.provider
-                self.provider = "openai"
-                self.config = self._get_provider_config("openai")
+                # Pass the fallback config explicitly rather than switching
+                # self.provider, so concurrent generate_batch calls are unaffected
                 try:
-                    response = self._generate_openai(prompt, max_tokens, temperature)
+                    response = self._generate_openai(
+                        prompt,
+                        max_tokens,
+                        temperature,
+                        config=self._get_provider_config("openai"),
+                    )
                     logger.info(f"Fallback to OpenAI successful")
-                    # Reset to original provider for next call
-                    self.provider = old_provider
-                    self.config = self._get_provider_config(old_provider)
                     return response
                 except Exception as fallback_e:
                     logger.error(f"Fallback to OpenAI also failed: {fallback_e}")
-                    # Reset to original provider for next call
-                    self.provider = old_provider
-                    self.config = self._get_provider_config(old_provider)
 
             # If all attempts fail, return an error message
             return "ERROR: Unable to generate LLM response due to API issues."
 
     def _generate_openai(
-        self, prompt: str, max_tokens: int = 2000, temperature: float = 0.0
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        temperature: float = 0.0,
+        config: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Generate a response using the OpenAI API.
@@ -133,20 +295,22 @@ class LLMClient:
             prompt: The prompt to send to the LLM
             max_tokens: Maximum number of tokens to generate
             temperature: Temperature for response generation
+            config: Provider configuration (default: this client's configuration)
 
         Returns:
             LLM response as a string
         """
-        url = f"{self.config['base_url']}/chat/completions"
+        config = config or self.config
+        url = f"{config['base_url']}/chat/completions"
 
         payload = {
-            "model": self.config["model"],
+            "model": config["model"],
             "messages": [{"role": "user", "content": prompt}],
             "max_tokens": max_tokens,
             "temperature": temperature,
         }
 
-        response = requests.post(url, headers=self.config["headers"], json=payload)
+        response = self._session.post(url, headers=config["headers"], json=payload)
 
         if response.status_code == 200:
             return response.json()["choices"][0]["message"]["content"]
@@ -177,7 +341,7 @@ class LLMClient:
             "temperature": temperature,
         }
 
-        response = requests.post(url, headers=self.config["headers"], json=payload)
+        response = self._session.post(url, headers=self.config["headers"], json=payload)
 
         if response.status_code == 200:
             return response.json()["content"][0]["text"]
@@ -188,10 +352,31 @@ class LLMClient:
             raise Exception(f"Anthropic API error: {response.status_code}")
 
 
+# Guards creation of the shared per-provider clients
+_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_client(provider: str) -> LLMClient:
+    """
+    Create the shared LLM client for a provider.
+
+    Args:
+        provider: LLM provider name
+
+    Returns:
+        LLMClient instance
+    """
+    return LLMClient(provider)
+
+
 def get_llm_client(provider: str = None) -> LLMClient:
     """
     Factory function to get an LLM client instance.
 
+    One client is shared per provider, so callers reuse its HTTP connections
+    and response cache. The API key is read when the client is first created.
+
     Args:
         provider: LLM provider to use (default: from environment or "openai")
 
@@ -202,4 +387,5 @@ def get_llm_client(provider: str = None) -> LLMClient:
     if not provider:
         provider = os.environ.get("LLM_PROVIDER", "openai")
 
-    return LLMClient(provider)
+    with _client_lock:
+        return _get_cached_client(provider)
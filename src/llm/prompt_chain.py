@@ -13,9 +13,8 @@ from typing import Any, Dict, List, Optional, Union
 from src.core.models import PatientData
 from src.llm.classification import parse_patient_text  # Import existing LLM integration
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Define schemas for structured outputs
 ENTITY_EXTRACTION_SCHEMA = {
@@ -12,9 +12,15 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
 from src.core.models import Recommendation
+from src.llm.utils import first_present
 
 logger = logging.getLogger(__name__)
 
+# Alternative keys for the same recommendation field, in order of preference
+_CAMPUS_ID_KEYS = ("recommended_campus_id", "recommended_campus")
+_DICT_CAMPUS_ID_KEYS = ("campus_id", "recommended_campus")
+_REASON_KEYS = ("reason", "clinical_reasoning")
+
 class RecommendationHandler:
     """Handles robust recommendation processing with comprehensive error handling.
     
@@ -169,8 +175,8 @@ class RecommendationHandler:
                     logger.info("Using direct Recommendation object")
                 elif isinstance(rec_obj, dict):
                     # Convert dictionary to Recommendation
-                    campus_id = rec_obj.get("recommended_campus_id", rec_obj.get("recommended_campus", "UNKNOWN"))
-                    reason = rec_obj.get("reason", rec_obj.get("clinical_reasoning", "No reason provided"))
+                    campus_id = first_present(rec_obj, _CAMPUS_ID_KEYS, "UNKNOWN")
+                    reason = first_present(rec_obj, _REASON_KEYS, "No reason provided")
                     
                     final_recommendation = Recommendation(
                         transfer_request_id=request_id,
@@ -192,8 +198,8 @@ class RecommendationHandler:
                 print(f"Found recommended_campus data: {type(rec_dict)}")
                 
                 if isinstance(rec_dict, dict):
-                    campus_id = rec_dict.get("campus_id", rec_dict.get("recommended_campus", "UNKNOWN"))
-                    reason = rec_dict.get("reason", rec_dict.get("clinical_reasoning", "No reason provided"))
+                    campus_id = first_present(rec_dict, _DICT_CAMPUS_ID_KEYS, "UNKNOWN")
+                    reason = first_present(rec_dict, _REASON_KEYS, "No reason provided")
                     
                     final_recommendation = Recommendation(
                         transfer_request_id=request_id,
@@ -8,10 +8,178 @@ robust JSON parsing and error handling.
 import json
 import logging
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# orjson parses the multi-KB LLM responses several times faster. Its
+# JSONDecodeError subclasses json.JSONDecodeError, so handlers are unchanged
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Characters that can change the JSON scanner's state; everything else is
+# skipped over by the regex engine instead of the Python loop
+_JSON_STRUCTURAL_CHARS = re.compile(r'[{}\[\]"\\]')
+_CLOSING_BRACKETS = {"{": "}", "[": "]"}
+
+
+def extract_json_text(text: str) -> Optional[str]:
+    """
+    Extract the first JSON object from LLM response text in a single pass.
+
+    Scans from the first '{' while tracking string, escape and bracket state,
+    so leading prose, markdown code fences and trailing prose are dropped
+    without re-scanning the text. If the text ends before the object is
+    closed (e.g. the response hit its token limit), the open string and
+    brackets are closed.
+
+    Args:
+        text: Text containing a JSON object
+
+    Returns:
+        The JSON object text, or None if the text contains no '{'
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    stack = []
+    in_string = False
+    escaped_at = -1
+    for match in _JSON_STRUCTURAL_CHARS.finditer(text, start):
+        pos = match.start()
+        if pos == escaped_at:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped_at = pos + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSING_BRACKETS:
+            stack.append(_CLOSING_BRACKETS[char])
+        elif stack and char == stack[-1]:
+            stack.pop()
+            if not stack:
+                return text[start : pos + 1]
+
+    # Truncated: close the open string and brackets
+    json_text = text[start:]
+    if in_string:
+        if escaped_at == len(json_text) + start:
+            json_text = json_text[:-1]
+        json_text += '"'
+    else:
+        json_text = json_text.rstrip().rstrip(",")
+    return json_text + "".join(reversed(stack))
+
+
+def iter_partial_json(chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse a streamed JSON response as it arrives.
+
+    After each chunk, the text received so far is closed with
+    extract_json_text and parsed. Each time the result changes it is
+    yielded, so callers can use fields as soon as they are complete. A
+    response that is cut off still yields everything received.
+
+    Args:
+        chunks: Response text chunks, in order (e.g. LLMClient.generate_stream)
+
+    Yields:
+        The JSON object parsed from the text received so far
+    """
+    buffer = ""
+    last = None
+    for chunk in chunks:
+        buffer += chunk
+        json_text = extract_json_text(buffer)
+        if json_text is None:
+            continue
+        try:
+            parsed = _json_loads(json_text)
+        except json.JSONDecodeError:
+            # Cut off mid-token (e.g. after a key); wait for more text
+            continue
+        if isinstance(parsed, dict) and parsed != last:
+            last = parsed
+            yield parsed
+
+
+class JsonStreamScanner:
+    """
+    Detect the end of the first JSON object or array in streamed text.
+
+    Tracks string, escape and bracket state across chunks, looking at each
+    character once, so a caller can stop a stream as soon as the value is
+    complete instead of waiting for trailing prose.
+    """
+
+    def __init__(self, opener: str = "{"):
+        """
+        Initialize the scanner.
+
+        Args:
+            opener: Bracket that starts the value, "{" or "["
+        """
+        self.opener = opener
+        self.buffer = ""
+        self.start = -1
+        self.end = -1
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped_at = -1
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Add the next chunk of text.
+
+        Args:
+            chunk: Next piece of the streamed text
+
+        Returns:
+            True once the value is complete; buffer[start:end] is its text
+        """
+        self.buffer += chunk
+        if self.end >= 0:
+            return True
+        if self.start < 0:
+            self.start = self.buffer.find(self.opener, self._pos)
+            if self.start < 0:
+                self._pos = len(self.buffer)
+                return False
+            self._pos = self.start
+
+        for match in _JSON_STRUCTURAL_CHARS.finditer(self.buffer, self._pos):
+            pos = match.start()
+            if pos == self._escaped_at:
+                continue
+            char = match.group()
+            if self._in_string:
+                if char == "\\":
+                    self._escaped_at = pos + 1
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in _CLOSING_BRACKETS:
+                self._stack.append(_CLOSING_BRACKETS[char])
+            elif self._stack and char == self._stack[-1]:
+                self._stack.pop()
+                if not self._stack:
+                    self.end = pos + 1
+                    return True
+
+        self._pos = len(self.buffer)
+        return False
+
 
 def robust_json_parser(text: str) -> Dict[str, Any]:
     """
@@ -19,12 +187,13 @@ def robust_json_parser(text: str) -> Dict[str, Any]:
 
     This function attempts multiple strategies to parse JSON:
     1. Parse the entire text as JSON
-    2. Extract JSON between code blocks (```json ... ```)
-    3. Extract JSON between regular code blocks (``` ... ```)
-    4. Find any JSON-like structure in the text using regex
-    5. Attempt to fix common JSON formatting issues and retry parsing
-    6. Handle truncated JSON by attempting to complete missing brackets
-    7. Handle repetitive content by finding the first complete JSON structure
+    2. Extract the first JSON object in a single pass (see extract_json_text)
+    3. Extract JSON between code blocks (```json ... ```)
+    4. Extract JSON between regular code blocks (``` ... ```)
+    5. Find any JSON-like structure in the text using regex
+    6. Attempt to fix common JSON formatting issues and retry parsing
+    7. Handle truncated JSON by attempting to complete missing brackets
+    8. Handle repetitive content by finding the first complete JSON structure
 
     Args:
         text: Text containing JSON to parse
@@ -40,10 +209,19 @@ def robust_json_parser(text: str) -> Dict[str, Any]:
 
     # Strategy 1: Try parsing the entire text
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except json.JSONDecodeError:
         logger.debug("Failed to parse entire text as JSON, trying alternative methods")
 
+    # Single pass over the text: handles code fences, surrounding prose and
+    # truncation, which covers most LLM responses
+    json_text = extract_json_text(text)
+    if json_text is not None:
+        try:
+            return _json_loads(json_text)
+        except json.JSONDecodeError:
+            logger.debug("Extracted JSON object did not parse, trying other methods")
+
     # Strategy 2: Handle repeated JSON blocks (common in LLM outputs)
     # Look for first complete JSON object within code blocks
     json_block_patterns = [
@@ -59,14 +237,14 @@ def robust_json_parser(text: str) -> Dict[str, Any]:
             # Try each match separately
             for match in matches:
                 try:
-                    return json.loads(match)
+                    return _json_loads(match)
                 except json.JSONDecodeError:
                     # Try to fix this particular match
                     try:
                         # Fix common JSON issues
                         fixed_match = re.sub(r",\s*}", "}", match)
                         fixed_match = re.sub(r",\s*]", "]", fixed_match)
-                        return json.loads(fixed_match)
+                        return _json_loads(fixed_match)
                     except json.JSONDecodeError:
                         continue
 
@@ -75,7 +253,7 @@ def robust_json_parser(text: str) -> Dict[str, Any]:
     matches = re.findall(json_pattern, text)
     for match in matches:
         try:
-            return json.loads(match)
+            return _json_loads(match)
         except json.JSONDecodeError:
             continue
 
@@ -101,7 +279,7 @@ def robust_json_parser(text: str) -> Dict[str, Any]:
 
             # Try parsing the completed JSON
             try:
-                return json.loads(fixed_text)
+                return _json_loads(fixed_text)
             except json.JSONDecodeError:
                 pass
     except Exception as e:
@@ -127,7 +305,7 @@ def robust_json_parser(text: str) -> Dict[str, Any]:
 
         # Try parsing again
         try:
-            return json.loads(fixed_text)
+            return _json_loads(fixed_text)
         except json.JSONDecodeError:
             pass
     except Exception as e:
@@ -165,3 +343,24 @@ def extract_fields_safely(
             return default
 
     return current
+
+
+def first_present(
+    data: Dict[str, Any], keys: Sequence[str], default: Any = None
+) -> Any:
+    """
+    Return the value of the first key present in a dictionary.
+
+    Unlike chaining ``data.get(a) or data.get(b)``, falsy values such as 0
+    are returned, and unlike nesting ``data.get(a, data.get(b))``, later
+    keys are only looked up when earlier ones are missing.
+
+    Args:
+        data: Dictionary to look up
+        keys: Keys to try, in order of preference
+        default: Value to return if none of the keys are present
+
+    Returns:
+        Value of the first present key, or default
+    """
+    return next((data[key] for key in keys if key in data), default)
@@ -1,4 +1,5 @@
 import json
+import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -335,4 +336,5 @@ def recommend_transfer(
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     app()
@@ -7,6 +7,8 @@ data with the latest bed availability information.
 import csv
 import json
 import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 from collections import defaultdict
@@ -313,7 +315,9 @@ def update_hospital_campuses(
     """Update hospital campuses with latest census information.
 
     Reads hospital data from JSON, updates bed counts and unit information
-    from census data, and writes changes back to the file.
+    from census data, and writes changes back to the file. The file is
+    replaced in one step, so concurrent readers see either the old or the
+    new data, and is not written at all when nothing changed.
 
     Args:
         campus_file_path: Path to hospital campuses JSON file
@@ -329,8 +333,9 @@ def update_hospital_campuses(
 
     try:
         # Read existing hospital data
-        with file_path.open("r+", encoding="utf-8") as file:
-            hospital_data = json.load(file)
+        with file_path.open("r", encoding="utf-8") as file:
+            original = file.read()
+        hospital_data = json.loads(original)
 
         # Update each campus with census data
         for campus in hospital_data:
@@ -363,9 +368,20 @@ def update_hospital_campuses(
                 },
             }
 
-        # Write updated data back to the file
-        with open(campus_file_path, "w", encoding="utf-8") as file:
-            json.dump(hospital_data, file, indent=2)
+        # Leave the file (and its modification time) alone when the census
+        # did not change any bed counts, so readers can keep their parsed copy
+        updated = json.dumps(hospital_data, indent=2)
+        if updated == original:
+            logger.info("Hospital campuses data already matches the census")
+            return True
+
+        # Write updated data to a temporary file and rename it over the
+        # original, so a reader never sees a partly written file
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=file_path.parent, suffix=".tmp", delete=False
+        ) as file:
+            file.write(updated)
+        os.replace(file.name, file_path)
 
         logger.info(
             "Successfully updated hospital campuses data with latest census information"
@@ -18,11 +18,8 @@ from src.utils.exclusion.processors import (
     parse_community_exclusions,
 )
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger("exclusion_parser")
+logger.addHandler(logging.NullHandler())
 
 
 def convert_pdfs_to_json() -> Dict[str, Any]:
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for Batch Pediatric Scoring
+
+This module checks that the vectorized cohort scoring functions agree with the
+per-patient scoring functions, including missing optional vitals.
+"""
+
+import unittest
+
+import numpy as np
+
+from src.core.models import PatientData
+from src.core.scoring.batch import (
+    CHEWS_ALERT_LEVELS,
+    MISSING,
+    calculate_chews_batch,
+    extract_vitals_batch,
+    process_patient_batch,
+)
+from src.core.scoring.pediatric import calculate_chews
+from src.core.scoring.score_processor import extract_vital_signs
+
+
+class TestCHEWSBatch(unittest.TestCase):
+    """Test cases for calculate_chews_batch"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        size = 2000
+        self.rr = rng.integers(5, 90, size, dtype=np.int16)
+        self.hr = rng.integers(30, 230, size, dtype=np.int16)
+        self.age = rng.integers(-2, 240, size, dtype=np.int16)
+        self.sbp = rng.integers(40, 130, size, dtype=np.int16)
+        self.cap = rng.integers(0, 60, size, dtype=np.int8)
+        self.spo2 = rng.integers(75, 101, size, dtype=np.int8)
+        self.sbp[::7] = MISSING
+        self.cap[::5] = MISSING
+        self.spo2[::3] = MISSING
+        self.effort = rng.choice(["mild", "Severe", "normal", "unknown"], size)
+        self.oxygen = rng.choice(["none", "nasal cannula", "CPAP", "ventilator"], size)
+
+    def test_matches_scalar_scores(self):
+        """Test that batch scores match calculate_chews patient by patient"""
+        result = calculate_chews_batch(
+            self.rr,
+            self.hr,
+            self.age,
+            systolic_bp=self.sbp,
+            capillary_refill_tenths=self.cap,
+            oxygen_saturation=self.spo2,
+            respiratory_effort=self.effort,
+            oxygen_therapy=self.oxygen,
+        )
+
+        for i in range(len(self.rr)):
+
+            def optional(values, scale=1):
+                value = int(values[i])
+                return None if value == MISSING else value / scale
+
+            expected = calculate_chews(
+                respiratory_rate=int(self.rr[i]),
+                respiratory_effort=str(self.effort[i]),
+                heart_rate=int(self.hr[i]),
+                systolic_bp=optional(self.sbp),
+                capillary_refill=optional(self.cap, 10),
+                oxygen_therapy=str(self.oxygen[i]),
+                oxygen_saturation=optional(self.spo2),
+                age_months=int(self.age[i]),
+            )
+            self.assertEqual(int(result["score"][i]), expected["score"])
+            self.assertEqual(
+                CHEWS_ALERT_LEVELS[result["alert_level_index"][i]],
+                expected["alert_level"],
+            )
+            for key, value in expected["subscores"].items():
+                self.assertEqual(int(result["subscores"][key][i]), value, key)
+
+    def test_keeps_compact_dtypes(self):
+        """Test that results stay int8 rather than upcasting to int64"""
+        result = calculate_chews_batch(self.rr, self.hr, self.age, systolic_bp=self.sbp)
+
+        self.assertEqual(result["score"].dtype, np.int8)
+        self.assertEqual(result["alert_level_index"].dtype, np.int8)
+        for subscore in result["subscores"].values():
+            self.assertEqual(subscore.dtype, np.int8)
+
+    def test_optional_vitals_omitted(self):
+        """Test that omitted optional vitals score zero"""
+        result = calculate_chews_batch(self.rr, self.hr, self.age)
+
+        for key in ("systolic_bp", "capillary_refill", "oxygen_saturation"):
+            self.assertFalse(result["subscores"][key].any())
+
+
+class TestPatientBatch(unittest.TestCase):
+    """Test cases for extract_vitals_batch and process_patient_batch"""
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        notes = [
+            "Increased work of breathing on nasal cannula. Capillary refill 3.5 sec.",
+            "Alert, on room air. Capillary refill 2.3 seconds.",
+            "Intubated and ventilated. Responds to pain.",
+            "",
+        ]
+        self.patients = []
+        for i in range(300):
+            extracted = {
+                "age_years": int(rng.integers(0, 18)),
+                "respiratory_rate": int(rng.integers(10, 70)),
+                "heart_rate": float(rng.integers(50, 200)),
+                "systolic_bp": int(rng.integers(50, 130)),
+                "oxygen_saturation": int(rng.integers(80, 101)),
+            }
+            if i % 4 == 0:
+                extracted["respiratory_rate"] += 0.5
+            if i % 5 == 0:
+                del extracted["systolic_bp"]
+            if i % 11 == 0:
+                del extracted["heart_rate"]
+            self.patients.append(
+                PatientData(
+                    patient_id=f"P{i}",
+                    extracted_data=extracted,
+                    clinical_text=notes[i % len(notes)],
+                )
+            )
+
+    def test_extract_columns(self):
+        """Test that vitals are laid out as columns with NaN for missing values"""
+        columns = extract_vitals_batch(self.patients)
+
+        self.assertEqual(columns["heart_rate"].dtype, np.float64)
+        self.assertTrue(np.isnan(columns["heart_rate"][0]))
+        self.assertEqual(columns["oxygen_requirement"][2], "ventilator")
+        self.assertEqual(len(columns["age_months"]), len(self.patients))
+
+    def test_matches_scalar_scores(self):
+        """Test that batch CHEWS matches calculate_chews patient by patient"""
+        frame = process_patient_batch(self.patients)
+
+        self.assertEqual(
+            list(frame["patient_id"]), [p.patient_id for p in self.patients]
+        )
+        for i, patient in enumerate(self.patients):
+            vitals = extract_vital_signs(patient)
+            expected = calculate_chews(
+                respiratory_rate=vitals["respiratory_rate"],
+                respiratory_effort=vitals["respiratory_effort"],
+                heart_rate=vitals["heart_rate"],
+                systolic_bp=vitals["systolic_bp"],
+                capillary_refill=vitals["capillary_refill"],
+                oxygen_therapy=vitals["oxygen_requirement"],
+                oxygen_saturation=vitals["oxygen_saturation"],
+                age_months=vitals["age_months"],
+            )
+            if expected["score"] == "N/A":
+                self.assertTrue(frame["chews_score"].isna()[i])
+                self.assertTrue(frame["chews_alert_level"].isna()[i])
+            else:
+                self.assertEqual(frame["chews_score"][i], expected["score"])
+                self.assertEqual(frame["chews_alert_level"][i], expected["alert_level"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ various scenarios correctly, including:
 import unittest
 
 from src.core.scoring.pediatric import (
+    ChewsResult,
     calculate_cameo2,
     calculate_chews,
     calculate_pews,
@@ -23,6 +24,7 @@ from src.core.scoring.pediatric import (
     calculate_tps,
     calculate_trap,
 )
+from src.core.scoring.utils import NA
 
 
 class TestPEWS(unittest.TestCase):
@@ -63,6 +65,8 @@ class TestPEWS(unittest.TestCase):
         self.assertEqual(result["score"], "N/A")
         self.assertIn("missing_parameters", result)
         self.assertIn("respiratory_rate", result["missing_parameters"])
+        self.assertIs(result["score"], NA)
+        self.assertIs(result["subscores"]["respiratory"], NA)
 
     def test_missing_age(self):
         """Test PEWS calculation with missing age"""
@@ -553,6 +557,27 @@ class TestCHEWS(unittest.TestCase):
         self.assertGreaterEqual(result["score"], 10)  # Should be critical alert
         self.assertIn("Critical", result["alert_level"])
 
+    def test_lazy_result_matches_dict(self):
+        """Test that the lazy CHEWS result exposes the same data as the dict"""
+        kwargs = dict(
+            respiratory_rate=25,
+            respiratory_effort="mild",
+            heart_rate=120,
+            systolic_bp=90,
+            capillary_refill=2,
+            oxygen_therapy="nasal cannula",
+            oxygen_saturation=95,
+            age_months=48,
+        )
+        expected = calculate_chews(**kwargs)
+        result = calculate_chews(**kwargs, lazy=True)
+
+        self.assertIsInstance(result, ChewsResult)
+        self.assertEqual(result["score"], expected["score"])
+        self.assertEqual(result["subscores"], expected["subscores"])
+        self.assertEqual(result.get("normal_ranges"), expected["normal_ranges"])
+        self.assertEqual(dict(result), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
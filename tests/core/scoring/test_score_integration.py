@@ -15,8 +15,12 @@ from src.core.models import Location, PatientData, TransferRequest
 from src.core.scoring.score_processor import (
     calculate_all_scores,
     determine_care_level,
+    determine_trauma_status,
     extract_vital_signs,
+    get_clinical_text,
+    process_batch,
     process_patient_scores,
+    scan_patient,
 )
 
 
@@ -48,6 +52,19 @@ class TestScoringExtraction(unittest.TestCase):
         self.assertEqual(vitals.get("diastolic_bp"), 60)
         self.assertEqual(vitals.get("oxygen_saturation"), 96)
 
+    def test_extract_age_prefers_total_months(self):
+        """Test that age_months is a remainder only when under a year."""
+        for extracted, expected in (
+            ({"age_years": 2, "age_months": 6}, 30),
+            ({"age_years": 2, "age_months": 24}, 24),
+            ({"age_years": 2}, 24),
+            ({"age_months": 18}, 18),
+            ({"age_years": "bad", "age_months": 6}, 6),
+        ):
+            patient = PatientData(patient_id="P123", extracted_data=extracted)
+            vitals = extract_vital_signs(patient)
+            self.assertEqual(vitals.get("age_months"), expected, extracted)
+
     def test_extract_vitals_from_notes(self):
         """Test extraction of values from clinical notes."""
         patient = PatientData(
@@ -69,6 +86,37 @@ class TestScoringExtraction(unittest.TestCase):
         self.assertEqual(vitals.get("gcs"), 14)
         self.assertEqual(vitals.get("capillary_refill"), 2.5)
 
+    def test_extract_vitals_from_notes_sentence_end(self):
+        """Test numeric extraction when values end a sentence."""
+        patient = PatientData(
+            patient_id="P123",
+            extracted_data={"age_years": 3},
+            clinical_text="GCS: 13. Capillary refill 2.5.",
+        )
+
+        vitals = extract_vital_signs(patient)
+
+        self.assertEqual(vitals.get("gcs"), 13)
+        self.assertEqual(vitals.get("capillary_refill"), 2.5)
+
+    def test_clinical_text_resolution(self):
+        """Test the clinical text fallback and passing resolved text."""
+        patient = PatientData(
+            patient_id="P123",
+            extracted_data={"clinical_notes": "On high flow oxygen."},
+        )
+        self.assertEqual(get_clinical_text(patient), "On high flow oxygen.")
+        self.assertEqual(
+            extract_vital_signs(patient)["oxygen_requirement"], "high flow"
+        )
+        self.assertEqual(
+            extract_vital_signs(patient, "Room air, no oxygen.")["oxygen_requirement"],
+            "none",
+        )
+
+        patient.extracted_data["clinical_notes"] = None
+        self.assertEqual(get_clinical_text(patient), "")
+
 
 class TestScoreCalculation(unittest.TestCase):
     """Test the calculation of pediatric scores."""
@@ -113,6 +161,26 @@ class TestScoreCalculation(unittest.TestCase):
                         f"{score_name} score should be numeric",
                     )
 
+    def test_calculate_all_scores_cached_copy(self):
+        """Test that repeat calls return equal but independent results."""
+        patient = PatientData(
+            patient_id="P124",
+            extracted_data={
+                "age_years": 3,
+                "respiratory_rate": 30,
+                "heart_rate": 140,
+                "oxygen_saturation": 92,
+            },
+            clinical_text="Increased work of breathing. On nasal cannula oxygen.",
+        )
+
+        first = calculate_all_scores(patient)
+        first["chews"]["subscores"]["heart_rate"] = 99
+        second = calculate_all_scores(patient)
+
+        self.assertNotEqual(second["chews"]["subscores"]["heart_rate"], 99)
+        self.assertIsNot(first["chews"], second["chews"])
+
     def test_trauma_detection(self):
         """Test detection of trauma cases."""
         trauma_patient = PatientData(
@@ -136,6 +204,24 @@ class TestScoreCalculation(unittest.TestCase):
         self.assertIn("queensland_trauma", scores)
         self.assertNotIn("queensland_non_trauma", scores)
 
+    def test_scan_patient_matches_helpers(self):
+        """Test that the fused scan agrees with the separate helpers."""
+        patient = PatientData(
+            patient_id="P125",
+            extracted_data={
+                "age_years": 8,
+                "clinical_notes": "Fall from bicycle with wrist fracture. "
+                "On room air. GCS 15.",
+            },
+        )
+
+        vitals, is_trauma = scan_patient(patient)
+
+        self.assertTrue(is_trauma)
+        self.assertEqual(vitals["gcs"], 15)
+        self.assertEqual(vitals, extract_vital_signs(patient))
+        self.assertEqual(is_trauma, determine_trauma_status(patient))
+
 
 class TestCareLevel(unittest.TestCase):
     """Test determination of care level based on scores."""
@@ -223,6 +309,28 @@ class TestProcessorIntegration(unittest.TestCase):
         self.assertTrue(len(result["recommended_care_levels"]) > 0)
         self.assertTrue(len(result["justifications"]) > 0)
 
+    def test_process_batch_matches_serial(self):
+        """Test that parallel batch processing keeps patient order and results."""
+        patients = [
+            PatientData(
+                patient_id=f"P{i}",
+                extracted_data={
+                    "age_years": i % 12,
+                    "respiratory_rate": 20 + i,
+                    "heart_rate": 90 + 3 * i,
+                    "oxygen_saturation": 99 - i,
+                },
+                clinical_text="Fall with arm fracture." if i % 3 == 0 else "",
+            )
+            for i in range(12)
+        ]
+
+        results = process_batch(patients, workers=2, chunksize=4)
+
+        self.assertEqual(
+            results, [process_patient_scores(patient) for patient in patients]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the Hospital Search Index
+
+This module tests that the indexed HospitalSearch.search_hospitals returns the
+same cached hospitals as a substring scan, and that hospitals are loaded,
+without making geocoding calls.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from geopy.exc import GeocoderTimedOut
+from geopy.extra.rate_limiter import RateLimiter
+
+from src.gui.hospital_search import HospitalSearch, _geocode_query
+
+
+class TestHospitalSearchIndex(unittest.TestCase):
+    """Test cases for the HospitalSearch substring index"""
+
+    @patch("src.gui.hospital_search.PUBLIC_GEOCODE_DELAY", 0)
+    def setUp(self):
+        with patch("src.gui.hospital_search.Nominatim") as mock_nominatim:
+            mock_nominatim.return_value.geocode.return_value = None
+            with tempfile.TemporaryDirectory() as cache_dir:
+                with patch(
+                    "src.gui.hospital_search.GEOCODE_CACHE_PATH",
+                    Path(cache_dir) / "geocode.json",
+                ):
+                    self.search = HospitalSearch()
+        self.search.hospitals_cache = {
+            "Dell Children's Medical Center": {
+                "latitude": 30.3,
+                "longitude": -97.7,
+                "address": "4900 Mueller Blvd, Austin, TX 78723",
+                "campus_id": "DCMC",
+            },
+            "Children's Health Dallas": {
+                "latitude": 32.8,
+                "longitude": -96.8,
+                "address": "1935 Medical District Dr, Dallas, TX 75235",
+                "campus_id": "",
+            },
+            "Memorial Hermann Houston": {
+                "latitude": 29.7,
+                "longitude": -95.4,
+                "address": None,
+                "campus_id": "",
+            },
+        }
+        self.search._build_search_index()
+        _geocode_query.cache_clear()
+        self.addCleanup(_geocode_query.cache_clear)
+
+    def test_matches_substring_scan(self):
+        """Test that indexed search finds the same hospitals as a full scan"""
+        for query in ["", "a", "TX", "children", "medical", "L H", "ston", "xyzzy"]:
+            expected = [
+                name
+                for name, details in self.search.hospitals_cache.items()
+                if query.lower() in name.lower()
+                or query.lower() in (details["address"] or "").lower()
+            ]
+            with patch.object(self.search.geolocator, "geocode", return_value=None):
+                results = self.search.search_hospitals(query)
+            self.assertEqual([hospital["name"] for hospital in results], expected)
+
+    def test_new_cache_entries_are_indexed(self):
+        """Test that hospitals added after indexing are still found"""
+        self.search.hospitals_cache["Baylor Scott & White Temple"] = {
+            "latitude": 31.1,
+            "longitude": -97.4,
+            "address": "2401 S 31st St, Temple, TX 76508",
+        }
+
+        results = self.search.search_hospitals("temple")
+
+        self.assertEqual(
+            [hospital["name"] for hospital in results], ["Baylor Scott & White Temple"]
+        )
+
+    def test_replaced_cache_entries_are_indexed(self):
+        """Test that replacing a hospital without changing the count reindexes"""
+        self.search.search_hospitals("dallas", geocode=False)
+        self.search.hospitals_cache["Children's Health Dallas"] = {
+            "latitude": 33.0,
+            "longitude": -96.7,
+            "address": "7601 Preston Rd, Plano, TX 75024",
+            "campus_id": "",
+        }
+
+        results = self.search.search_hospitals("plano", geocode=False)
+
+        self.assertEqual(
+            [hospital["name"] for hospital in results], ["Children's Health Dallas"]
+        )
+
+    def test_search_without_geocoding(self):
+        """Test that geocode=False only searches the cached hospitals"""
+        with patch.object(self.search.geolocator, "geocode") as mock_geocode:
+            results = self.search.search_hospitals("6565 Fannin St", geocode=False)
+
+        self.assertEqual(results, [])
+        mock_geocode.assert_not_called()
+
+    def test_repeated_geocode_is_cached(self):
+        """Test that geocoding the same address twice sends one request"""
+        location = MagicMock(latitude=29.7, longitude=-95.4)
+        with patch.object(
+            self.search.geolocator, "geocode", return_value=location
+        ) as mock_geocode:
+            first = self.search.geocode_address("6565 Fannin St")
+            second = self.search.geocode_address("6565 Fannin St")
+
+        self.assertEqual(first, (29.7, -95.4))
+        self.assertEqual(second, first)
+        mock_geocode.assert_called_once()
+
+    def test_geocode_errors_are_not_cached(self):
+        """Test that an address is geocoded again after a timeout"""
+        with patch.object(
+            self.search.geolocator,
+            "geocode",
+            side_effect=[GeocoderTimedOut("timed out"), None],
+        ) as mock_geocode:
+            self.search.geocode_address("6565 Fannin St")
+            self.search.geocode_address("6565 Fannin St")
+
+        self.assertEqual(mock_geocode.call_count, 2)
+
+
+class TestHospitalLoading(unittest.TestCase):
+    """Test cases for geocoding hospitals while loading"""
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_path = Path(cache_dir.name) / "geocode.json"
+        cache_patch = patch(
+            "src.gui.hospital_search.GEOCODE_CACHE_PATH", self.cache_path
+        )
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        delay_patch = patch("src.gui.hospital_search.PUBLIC_GEOCODE_DELAY", 0)
+        delay_patch.start()
+        self.addCleanup(delay_patch.stop)
+
+    @patch("src.gui.hospital_search.Nominatim")
+    def test_failed_geocodes_are_skipped(self, mock_nominatim):
+        """Test that concurrent geocoding keeps the hospitals that resolved"""
+
+        def geocode(address, timeout):
+            if "Austin" in address:
+                raise GeocoderTimedOut("timed out")
+            return MagicMock(latitude=30.0, longitude=-97.0)
+
+        mock_nominatim.return_value.geocode.side_effect = geocode
+
+        search = HospitalSearch()
+
+        self.assertIn("Memorial Hermann Houston", search.hospitals_cache)
+        self.assertNotIn("Dell Children's Medical Center", search.hospitals_cache)
+        self.assertEqual(
+            search.hospitals_cache["Baylor Scott & White Temple"]["address"],
+            "2401 S 31st St, Temple, TX 76508",
+        )
+
+    @patch("src.gui.hospital_search.Nominatim")
+    def test_saved_coordinates_skip_geocoding(self, mock_nominatim):
+        """Test that a second load reads coordinates from the cache file"""
+        geocode = mock_nominatim.return_value.geocode
+        geocode.return_value = MagicMock(latitude=30.0, longitude=-97.0)
+        first = HospitalSearch()
+        calls = geocode.call_count
+
+        second = HospitalSearch()
+
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(geocode.call_count, calls)
+        self.assertEqual(second.hospitals_cache, first.hospitals_cache)
+
+    @patch.dict("os.environ", {"NOMINATIM_URL": "localhost:8080"})
+    @patch("src.gui.hospital_search.Nominatim")
+    def test_self_hosted_nominatim(self, mock_nominatim):
+        """Test that NOMINATIM_URL points the geocoder at a local server"""
+        mock_nominatim.return_value.geocode.return_value = None
+
+        search = HospitalSearch()
+
+        self.assertEqual(mock_nominatim.call_args.kwargs["domain"], "localhost:8080")
+        self.assertEqual(mock_nominatim.call_args.kwargs["scheme"], "http")
+        self.assertEqual(search._geocode_workers, 8)
+
+    @patch("src.gui.hospital_search.Nominatim")
+    def test_public_nominatim_is_rate_limited(self, mock_nominatim):
+        """Test that the public server is geocoded one request at a time"""
+        geocode = mock_nominatim.return_value.geocode
+        geocode.return_value = None
+
+        search = HospitalSearch()
+
+        self.assertIsInstance(search._geocode, RateLimiter)
+        self.assertEqual(search._geocode_workers, 1)
+        self.assertEqual(geocode.call_count, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
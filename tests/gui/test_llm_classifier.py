@@ -0,0 +1,483 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the GUI LLM Classifier
+
+This module tests the LLMClassifier prompt chain against a mocked async
+OpenAI client, without making any network calls.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.gui.llm_integration import (
+    _CLIENT_POOL,
+    LLMClassifier,
+    _extract_json,
+    _scan_care_level,
+)
+
+
+class _Stream:
+    """Async chat completion stream returning content in small chunks."""
+
+    def __init__(self, content, chunk_size=8):
+        self.chunks = [
+            content[start : start + chunk_size]
+            for start in range(0, len(content), chunk_size)
+        ]
+        self.sent = 0
+        self.closed = False
+        self._chunks = self._iter_chunks()
+
+    async def _iter_chunks(self):
+        for text in self.chunks:
+            self.sent += 1
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = text
+            yield chunk
+
+    def __aiter__(self):
+        return self._chunks
+
+    async def close(self):
+        self.closed = True
+        await self._chunks.aclose()
+
+
+def _completion(content):
+    """Build a streamed chat completion with the given message content."""
+    return _Stream(content)
+
+
+# Complete response for the combined single-call chain
+COMBINED_RESPONSE = {
+    "extracted_clinical_entities": {"medical_problems": ["bronchiolitis"]},
+    "identified_specialties_needed": [],
+    "exclusion_criteria_evaluation": [],
+    "final_recommendation": {"recommended_care_level": "PICU"},
+}
+
+# Responses for each step of the chain, keyed by a phrase from its prompt
+STEP_RESPONSES = {
+    "in four steps": "Sorry, I can only answer one step at a time.",
+    "clinical information extractor": {
+        "symptoms": ["fever"],
+        "medical_problems": ["bronchiolitis"],
+        "demographics": {"age": 3},
+    },
+    "expert triage physician": {
+        "identified_specialties_needed": [
+            {"specialty_name": "pulmonology", "likelihood_score": 90}
+        ]
+    },
+    "meets any\n        exclusion criteria": {
+        "exclusion_criteria_evaluation": [
+            {"exclusion_rule_id": "1", "status": "uncertain", "confidence_score": 40}
+        ]
+    },
+    "final recommendation": {
+        "recommended_care_level": "PICU",
+        "confidence": 80,
+        "explanation": "Needs respiratory support",
+    },
+}
+
+
+class TestLLMClassifierChain(unittest.TestCase):
+    """Test cases for LLMClassifier.process_text"""
+
+    def setUp(self):
+        # Each test mocks methods on the client, so give it one of its own
+        pool = patch.dict(_CLIENT_POOL, clear=True)
+        pool.start()
+        self.addCleanup(pool.stop)
+        with patch.object(LLMClassifier, "refresh_models", return_value=[]):
+            self.classifier = LLMClassifier(model="test-model")
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        for phrase, result in STEP_RESPONSES.items():
+            if phrase in prompt:
+                return _completion(
+                    result if isinstance(result, str) else json.dumps(result)
+                )
+        raise AssertionError("Unexpected prompt")
+
+    def test_combined_chain_single_call(self):
+        """Test that a complete combined response needs only one call"""
+        self.classifier.client.chat.completions.create = AsyncMock(
+            return_value=_completion(json.dumps(COMBINED_RESPONSE))
+        )
+
+        result = self.classifier.process_text_sync("3yo with fever")
+
+        self.assertEqual(result["chief_complaint"], "bronchiolitis")
+        self.assertEqual(result["suggested_care_level"], "PICU")
+        self.classifier.client.chat.completions.create.assert_called_once()
+
+    def test_terse_response_keys_are_expanded(self):
+        """Test that short wire keys map back to the descriptive field names"""
+        terse = {
+            "entities": {"symptoms": ["cough"]},
+            "specs": [{"spec": "pulmonology", "score": 70, "why": "cough"}],
+            "excl": [{"id": "#2", "status": "uncertain", "score": 30, "ev": "?"}],
+            "rec": {"level": "ICU", "score": 60, "why": "work of breathing"},
+        }
+        self.classifier.client.chat.completions.create = AsyncMock(
+            return_value=_completion(json.dumps(terse))
+        )
+
+        result = self.classifier.process_text_sync("3yo with cough")
+
+        rules = self.classifier._prepare_exclusions(self.classifier.exclusion_criteria)[
+            0
+        ]
+        self.assertEqual(result["specialty_needs"][0]["specialty_name"], "pulmonology")
+        self.assertEqual(result["exclusion_matches"][0]["rule_text"], rules[1])
+        self.assertEqual(result["suggested_care_level"], "ICU")
+        self.assertEqual(result["explainability"]["confidence"], 60)
+
+    def test_response_constrained_to_schema(self):
+        """Test that a response outside the schema is rejected"""
+        invalid = dict(
+            COMBINED_RESPONSE, final_recommendation={"recommended_care_level": "Ward"}
+        )
+        self.classifier.client.chat.completions.create = AsyncMock(
+            side_effect=[_completion(json.dumps(invalid)), Exception("down")]
+        )
+
+        result = self.classifier.process_text_sync("3yo with fever")
+
+        self.assertEqual(result["note"], "Generated by rule-based system")
+        response_format = self.classifier.client.chat.completions.create.call_args_list[
+            0
+        ].kwargs["response_format"]
+        self.assertEqual(response_format["json_schema"]["name"], "CombinedChainResult")
+
+    def test_stream_closed_when_object_complete(self):
+        """Test that the response stream stops after the JSON object"""
+        stream = _Stream(json.dumps(COMBINED_RESPONSE) + " I hope this helps!" * 20)
+        self.classifier.client.chat.completions.create = AsyncMock(return_value=stream)
+
+        result = self.classifier.process_text_sync("3yo with fever")
+
+        self.assertEqual(result["suggested_care_level"], "PICU")
+        self.assertTrue(stream.closed)
+        self.assertLess(stream.sent, len(stream.chunks))
+        self.assertTrue(
+            self.classifier.client.chat.completions.create.call_args.kwargs["stream"]
+        )
+
+    def test_truncated_response_is_closed(self):
+        """Test that a response cut off by the token limit is still parsed"""
+        self.classifier.client.chat.completions.create = AsyncMock(
+            return_value=_completion(json.dumps(COMBINED_RESPONSE)[:-2])
+        )
+
+        result = self.classifier.process_text_sync("3yo with fever")
+
+        self.assertEqual(result["suggested_care_level"], "PICU")
+        self.classifier.client.chat.completions.create.assert_called_once()
+
+    def test_human_suggestion_raises_care_level(self):
+        """Test that the highest suggested care level overrides the LLM's"""
+        self.classifier.client.chat.completions.create = AsyncMock(
+            return_value=_completion(json.dumps(COMBINED_RESPONSE))
+        )
+
+        result = self.classifier.process_text_sync(
+            "3yo with fever", {"care_level": ["ICU", "NICU"]}
+        )
+
+        self.assertEqual(result["suggested_care_level"], "NICU")
+
+    def test_repeat_vignette_served_from_cache(self):
+        """Test that re-running a vignette does not call the LLM again"""
+        self.classifier.client.chat.completions.create = AsyncMock(
+            return_value=_completion(json.dumps(COMBINED_RESPONSE))
+        )
+
+        first = self.classifier.process_text_sync("3yo with fever")
+        first["specialty_needs"].append("cardiology")
+        second = self.classifier.process_text_sync("3yo with fever")
+
+        self.assertEqual(second["suggested_care_level"], "PICU")
+        self.assertEqual(second["specialty_needs"], [])
+        self.classifier.client.chat.completions.create.assert_called_once()
+
+    def test_step_chain_result_and_concurrent_steps(self):
+        """Test the step-by-step fallback and that steps 2 and 3 overlap"""
+        self.classifier.client.chat.completions.create = AsyncMock(
+            side_effect=self._create
+        )
+
+        result = self.classifier.process_text_sync("3yo with fever")
+
+        self.assertEqual(result["chief_complaint"], "bronchiolitis")
+        self.assertEqual(result["suggested_care_level"], "PICU")
+        self.assertEqual(result["specialty_needs"][0]["specialty_name"], "pulmonology")
+        self.assertEqual(result["exclusion_matches"][0]["exclusion_rule_id"], "1")
+        self.assertEqual(self.classifier.client.chat.completions.create.call_count, 5)
+        self.assertEqual(self.max_in_flight, 2)
+
+    def test_step_chain_accepts_loosely_typed_responses(self):
+        """Test that numeric ids, list histories and nested vitals validate"""
+        responses = dict(STEP_RESPONSES)
+        responses["clinical information extractor"] = {
+            "medical_problems": ["asthma"],
+            "medical_history": ["asthma", "prematurity"],
+            "vital_signs": {"bp": {"sys": 90, "dia": 60}},
+        }
+        responses["meets any\n        exclusion criteria"] = {
+            "exclusion_criteria_evaluation": [
+                {"id": 5, "status": "likely_not_met", "score": 70}
+            ]
+        }
+
+        with patch.dict(STEP_RESPONSES, responses):
+            self.classifier.client.chat.completions.create = AsyncMock(
+                side_effect=self._create
+            )
+            result = self.classifier.process_text_sync("3yo with wheeze")
+
+        self.assertEqual(result["suggested_care_level"], "PICU")
+        self.assertEqual(result["vital_signs"], {"bp": {"sys": 90, "dia": 60}})
+        self.assertEqual(result["exclusion_matches"][0]["exclusion_rule_id"], "5")
+
+    def test_step_chain_sends_entities_text_to_later_steps(self):
+        """Test that steps 2-4 receive the same compact entities JSON"""
+        self.classifier.client.chat.completions.create = AsyncMock(
+            side_effect=self._create
+        )
+
+        self.classifier.process_text_sync("3yo with fever")
+
+        prompts = [
+            call.kwargs["messages"][0]["content"]
+            for call in self.classifier.client.chat.completions.create.call_args_list
+        ]
+        entities_text = prompts[2].rsplit("\n\n", 1)[1].strip()
+        combined = json.loads(prompts[-1].rsplit("\n\n", 1)[1])
+        self.assertIn(entities_text, prompts[3])
+        self.assertEqual(
+            combined["extracted_clinical_entities"], json.loads(entities_text)
+        )
+        self.assertEqual(
+            combined["identified_specialties_needed"][0]["specialty_name"],
+            "pulmonology",
+        )
+
+    def test_batch_keeps_order_and_retries_incomplete_results(self):
+        """Test that vignettes are batched and unusable results are retried"""
+        general = dict(
+            COMBINED_RESPONSE, final_recommendation={"recommended_care_level": "ICU"}
+        )
+
+        async def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            if "Vignette 1:" not in prompt:
+                return _completion(json.dumps(general))
+            return _completion(json.dumps([COMBINED_RESPONSE, {}, COMBINED_RESPONSE]))
+
+        self.classifier.client.chat.completions.create = AsyncMock(side_effect=create)
+
+        results = self.classifier.process_texts_sync(["a", "b", "c"], rows_per_call=3)
+
+        self.assertEqual(
+            [result["suggested_care_level"] for result in results],
+            ["PICU", "ICU", "PICU"],
+        )
+        self.assertEqual(self.classifier.client.chat.completions.create.call_count, 2)
+
+    @patch("src.gui.llm_integration.parse_patient_text", return_value={})
+    def test_fallback_critical_vitals_suggest_icu(self, mock_parse):
+        """Test that an extreme heart rate or low saturation suggests ICU"""
+        levels = [
+            self.classifier._fallback_process_text(text)["suggested_care_level"]
+            for text in ("HR 200, SpO2 97%", "HR 50", "HR 120, SpO2 85%", "HR 120")
+        ]
+
+        self.assertEqual(levels, ["ICU", "ICU", "ICU", "General"])
+
+    def test_batches_in_flight_bounded(self):
+        """Test that process_texts keeps at most max_concurrency requests open"""
+
+        async def create(**kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return _completion(json.dumps([COMBINED_RESPONSE]))
+
+        self.classifier.client.chat.completions.create = AsyncMock(side_effect=create)
+
+        results = self.classifier.process_texts_sync(
+            ["a", "b", "c", "d", "e"], rows_per_call=1, max_concurrency=2
+        )
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(self.classifier.client.chat.completions.create.call_count, 5)
+        self.assertEqual(self.max_in_flight, 2)
+
+    def test_failed_extraction_falls_back_to_rules(self):
+        """Test that a failed entity extraction uses rule-based processing"""
+        self.classifier.client.chat.completions.create = AsyncMock(
+            side_effect=Exception("down")
+        )
+
+        result = self.classifier.process_text_sync("Newborn with poor feeding.")
+
+        self.assertEqual(result["note"], "Generated by rule-based system")
+        self.assertEqual(result["suggested_care_level"], "NICU")
+
+    @patch("src.gui.llm_integration.parse_patient_text", return_value={})
+    def test_fallback_extracts_vitals_and_keywords(self, mock_parse):
+        """Test the rule-based vital signs and keyword extraction"""
+        result = self.classifier._fallback_process_text(
+            "Toddler with Croup. Pulse: 150, BP 90/60, resp 30, T 38.5C, SpO2 92%"
+        )
+
+        self.assertEqual(
+            result["vital_signs"],
+            {"hr": "150", "bp": "90/60", "rr": "30", "o2": "92%", "temp": "38.5°C"},
+        )
+        self.assertEqual(result["keywords"], ["croup"])
+
+
+class TestLLMClassifierClient(unittest.TestCase):
+    """Test cases for LLMClassifier client management"""
+
+    def setUp(self):
+        pool = patch.dict(_CLIENT_POOL, clear=True)
+        pool.start()
+        self.addCleanup(pool.stop)
+
+    @patch.object(LLMClassifier, "refresh_models", return_value=[])
+    def test_client_replaced_only_when_url_changes(self, mock_refresh):
+        """Test that re-applying the current URL keeps the pooled client"""
+        classifier = LLMClassifier(model="test-model")
+        client = classifier.client
+
+        classifier.set_api_url(classifier.api_url)
+        self.assertIs(classifier.client, client)
+
+        classifier.set_api_url("http://localhost:5678/v1")
+        self.assertIsNot(classifier.client, client)
+        self.assertFalse(client.is_closed())
+        self.assertEqual(str(classifier.client.base_url), "http://localhost:5678/v1/")
+        self.assertEqual(classifier.client.max_retries, 3)
+
+    @patch.object(LLMClassifier, "refresh_models", return_value=[])
+    def test_client_shared_per_url(self, mock_refresh):
+        """Test that classifiers for the same URL share one client"""
+        classifier = LLMClassifier(model="test-model")
+        other_url = LLMClassifier("http://localhost:5678/v1", model="test-model")
+
+        self.assertIs(LLMClassifier(model="other-model").client, classifier.client)
+        self.assertIsNot(other_url.client, classifier.client)
+
+        other_url.set_api_url(classifier.api_url)
+        self.assertIs(other_url.client, classifier.client)
+
+    @patch.object(LLMClassifier, "refresh_models", return_value=[])
+    def test_client_per_event_loop(self, mock_refresh):
+        """Test that each event loop gets its own client until it closes"""
+        classifier = LLMClassifier(model="test-model")
+
+        async def loop_client():
+            return classifier._loop_client()
+
+        first = asyncio.run(loop_client())
+        second = asyncio.run(loop_client())
+
+        self.assertIsNot(first, classifier.client)
+        self.assertIsNot(second, first)
+        self.assertNotIn(first, _CLIENT_POOL.values())
+        self.assertIn(classifier.client, _CLIENT_POOL.values())
+
+    def test_model_list_reused_until_url_changes(self):
+        """Test that the model list is fetched once per URL within the TTL"""
+        with patch.object(LLMClassifier, "refresh_models", return_value=[]):
+            classifier = LLMClassifier(model="local-model")
+        models = MagicMock(data=[MagicMock(id="local-model")])
+        classifier.client.models.list = AsyncMock(return_value=models)
+
+        self.assertEqual(classifier.test_connection(), (True, "Connection successful"))
+        classifier.test_connection(classifier.api_url)
+        self.assertEqual(classifier.client.models.list.call_count, 1)
+
+        classifier.refresh_models(force=True)
+        self.assertEqual(classifier.client.models.list.call_count, 2)
+
+        with patch.object(LLMClassifier, "refresh_models"):
+            classifier.set_api_url("http://localhost:5678/v1")
+        classifier.client.models.list = AsyncMock(return_value=models)
+        classifier.test_connection()
+        classifier.client.models.list.assert_called_once()
+
+    def test_exclusion_criteria_reloaded_when_file_changes(self):
+        """Test that the criteria file is only re-read after it is modified"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "exclusion_criteria_clean.json")
+            with open(path, "w") as f:
+                json.dump({"campuses": {}}, f)
+            with patch("src.gui.llm_integration.EXCLUSION_CRITERIA_PATH", path):
+                with patch.object(LLMClassifier, "refresh_models", return_value=[]):
+                    classifier = LLMClassifier(model="test-model")
+                criteria = classifier._get_exclusion_criteria()
+                self.assertIs(classifier._get_exclusion_criteria(), criteria)
+
+                with open(path, "w") as f:
+                    json.dump({"campuses": {"main": {}}}, f)
+                os.utime(path, (0, 0))
+
+                self.assertEqual(
+                    classifier._get_exclusion_criteria(), {"campuses": {"main": {}}}
+                )
+
+
+class TestExtractJson(unittest.TestCase):
+    """Test cases for _extract_json"""
+
+    def test_object_surrounded_by_prose(self):
+        """Test that parsing stops at the end of the first object"""
+        text = 'Here you go:\n```json\n{"a": "}", "b": [1]}\n```\nAlso {"c": 2}'
+
+        self.assertEqual(
+            _extract_json(text), ({"a": "}", "b": [1]}, '{"a": "}", "b": [1]}')
+        )
+
+    def test_truncated_object(self):
+        """Test that an object cut off mid-response is closed"""
+        self.assertEqual(_extract_json('{"a": [1, 2'), ({"a": [1, 2]}, '{"a": [1, 2]}'))
+
+    def test_no_object(self):
+        """Test that a response without an object returns None"""
+        self.assertIsNone(_extract_json("I cannot help with that."))
+
+
+class TestScanCareLevel(unittest.TestCase):
+    """Test cases for _scan_care_level"""
+
+    def test_highest_priority_keyword_wins(self):
+        """Test that neonatal terms beat PICU, which beats ICU terms"""
+        self.assertEqual(_scan_care_level("septic shock, premature infant"), "NICU")
+        self.assertEqual(_scan_care_level("sepsis, admit to pediatric icu"), "PICU")
+        self.assertEqual(_scan_care_level("intubated in the ed"), "ICU")
+        self.assertEqual(_scan_care_level("mild cough"), "General")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the LLM Client
+
+This module tests the response caching behavior of the LLM client without
+making any network calls.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.llm.llm_client import LLMClient, _get_cached_client, get_llm_client
+
+
+class TestLLMClientCache(unittest.TestCase):
+    """Test cases for LLMClient response caching"""
+
+    def setUp(self):
+        self.client = LLMClient(provider="openai", api_key="test-key", cache_size=2)
+
+    @patch.object(LLMClient, "_generate_openai", return_value="explanation")
+    def test_deterministic_prompt_is_cached(self, mock_generate):
+        """Test that a repeated temperature 0 prompt calls the API once"""
+        self.assertEqual(self.client.generate("prompt"), "explanation")
+        self.assertEqual(self.client.generate("prompt"), "explanation")
+
+        mock_generate.assert_called_once()
+
+    @patch.object(LLMClient, "_generate_openai", return_value="explanation")
+    def test_sampled_prompt_is_not_cached(self, mock_generate):
+        """Test that prompts with a non-zero temperature always call the API"""
+        self.client.generate("prompt", temperature=0.7)
+        self.client.generate("prompt", temperature=0.7)
+
+        self.assertEqual(mock_generate.call_count, 2)
+
+    @patch.object(LLMClient, "_generate_openai", side_effect=Exception("down"))
+    def test_errors_are_not_cached(self, mock_generate):
+        """Test that error responses are retried on the next call"""
+        self.assertTrue(self.client.generate("prompt").startswith("ERROR:"))
+        self.client.generate("prompt")
+
+        self.assertEqual(mock_generate.call_count, 2)
+
+    @patch.object(LLMClient, "_generate_openai", side_effect=lambda p, m, t: p)
+    def test_least_recently_used_prompt_is_evicted(self, mock_generate):
+        """Test that the cache keeps only the most recently used prompts"""
+        self.client.generate("a")
+        self.client.generate("b")
+        self.client.generate("a")
+        self.client.generate("c")  # Evicts "b"
+        self.client.generate("a")
+        self.client.generate("b")
+
+        self.assertEqual(
+            [call.args[0] for call in mock_generate.call_args_list],
+            ["a", "b", "c", "b"],
+        )
+
+
+class TestLLMClientBatch(unittest.TestCase):
+    """Test cases for LLMClient.generate_batch"""
+
+    @patch.object(LLMClient, "_generate_openai", side_effect=lambda p, m, t: p.upper())
+    def test_batch_keeps_order_and_sends_duplicates_once(self, mock_generate):
+        """Test that responses come back in prompt order, one call per prompt"""
+        client = LLMClient(provider="openai", api_key="test-key", cache_size=0)
+
+        responses = client.generate_batch(["a", "b", "a", "c"], max_workers=3)
+
+        self.assertEqual(responses, ["A", "B", "A", "C"])
+        self.assertEqual(mock_generate.call_count, 3)
+
+    @patch.object(LLMClient, "_generate_openai", return_value="fallback")
+    @patch.object(LLMClient, "_generate_anthropic", side_effect=Exception("down"))
+    def test_fallback_leaves_provider_unchanged(self, mock_anthropic, mock_openai):
+        """Test that the OpenAI fallback does not switch the client's provider"""
+        client = LLMClient(provider="anthropic", api_key="test-key")
+
+        self.assertEqual(client.generate_batch(["a", "b"]), ["fallback", "fallback"])
+        self.assertEqual(client.provider, "anthropic")
+        self.assertEqual(mock_openai.call_args.kwargs["config"]["model"], "gpt-4o")
+
+
+class TestLLMClientStream(unittest.TestCase):
+    """Test cases for LLMClient.generate_stream"""
+
+    def _stream_response(self, lines):
+        response = MagicMock(status_code=200)
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = iter(lines)
+        return response
+
+    def test_openai_stream_yields_content(self):
+        """Test that OpenAI delta content is yielded until [DONE]"""
+        client = LLMClient(provider="openai", api_key="test-key")
+        lines = [
+            'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            "",
+            'data: {"choices": [{"delta": {"content": "{\\"a\\""}}]}',
+            'data: {"choices": [{"delta": {"content": ": 1}"}}]}',
+            "data: [DONE]",
+        ]
+
+        with patch.object(
+            client._session, "post", return_value=self._stream_response(lines)
+        ) as mock_post:
+            chunks = list(client.generate_stream("prompt"))
+
+        self.assertEqual(chunks, ['{"a"', ": 1}"])
+        self.assertTrue(mock_post.call_args.kwargs["json"]["stream"])
+
+    def test_anthropic_stream_yields_text(self):
+        """Test that Anthropic text deltas are yielded and other events skipped"""
+        client = LLMClient(provider="anthropic", api_key="test-key")
+        lines = [
+            "event: message_start",
+            'data: {"type": "message_start", "message": {}}',
+            'data: {"type": "content_block_delta", "delta": {"text": "Hi"}}',
+            'data: {"type": "message_stop"}',
+        ]
+
+        with patch.object(
+            client._session, "post", return_value=self._stream_response(lines)
+        ):
+            self.assertEqual(list(client.generate_stream("prompt")), ["Hi"])
+
+
+class TestGetLLMClient(unittest.TestCase):
+    """Test cases for the get_llm_client factory"""
+
+    def setUp(self):
+        _get_cached_client.cache_clear()
+        self.addCleanup(_get_cached_client.cache_clear)
+
+    def test_client_is_shared_per_provider(self):
+        """Test that repeat calls reuse one client for each provider"""
+        client = get_llm_client("openai")
+
+        self.assertIs(get_llm_client("openai"), client)
+        self.assertIsNot(get_llm_client("anthropic"), client)
+
+    @patch.dict("os.environ", {"LLM_PROVIDER": "anthropic"})
+    def test_default_provider_from_environment(self):
+        """Test that the provider defaults to LLM_PROVIDER"""
+        self.assertIs(get_llm_client(), get_llm_client("anthropic"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the LLM utility functions
+
+This module tests JSON extraction from the kinds of responses LLMs return:
+code fences, surrounding prose and truncated output.
+"""
+
+import unittest
+
+from src.llm.utils import (
+    JsonStreamScanner,
+    extract_json_text,
+    first_present,
+    iter_partial_json,
+    robust_json_parser,
+)
+
+
+class TestExtractJsonText(unittest.TestCase):
+    """Test cases for extract_json_text"""
+
+    def test_strips_code_fence_and_prose(self):
+        """Test that only the first JSON object is returned"""
+        text = 'Result:\n```json\n{"a": "x}y", "b": [1, {"c": 2}]}\n```\n{"d": 3}'
+
+        self.assertEqual(extract_json_text(text), '{"a": "x}y", "b": [1, {"c": 2}]}')
+
+    def test_escaped_quotes_stay_in_string(self):
+        """Test that escaped quotes do not end a string"""
+        text = '{"a": "say \\"}\\" \\\\", "b": 1} done'
+
+        self.assertEqual(extract_json_text(text), '{"a": "say \\"}\\" \\\\", "b": 1}')
+
+    def test_truncated_object_is_closed(self):
+        """Test that open strings and brackets are closed at end of text"""
+        self.assertEqual(extract_json_text('{"a": [1, 2,'), '{"a": [1, 2]}')
+        self.assertEqual(extract_json_text('{"a": {"b": "tru'), '{"a": {"b": "tru"}}')
+        self.assertEqual(extract_json_text('{"a": "x\\'), '{"a": "x"}')
+
+    def test_no_object(self):
+        """Test that text without an object returns None"""
+        self.assertIsNone(extract_json_text("no json here"))
+
+
+class TestIterPartialJson(unittest.TestCase):
+    """Test cases for iter_partial_json"""
+
+    def test_yields_fields_as_they_arrive(self):
+        """Test that each new parseable state of the stream is yielded once"""
+        chunks = ['```json\n{"reason": "Needs', ' PICU",', ' "le', 'vel": 3', "}\n```"]
+
+        self.assertEqual(
+            list(iter_partial_json(chunks)),
+            [
+                {"reason": "Needs"},
+                {"reason": "Needs PICU"},
+                {"reason": "Needs PICU", "level": 3},
+            ],
+        )
+
+
+class TestJsonStreamScanner(unittest.TestCase):
+    """Test cases for JsonStreamScanner"""
+
+    def test_detects_end_across_chunks(self):
+        """Test that string and escape state carry over chunk boundaries"""
+        scanner = JsonStreamScanner()
+        chunks = ['Sure: {"a": "x\\', '"}', '", "b": [1', "]}", " and more"]
+
+        self.assertEqual([scanner.feed(chunk) for chunk in chunks[:3]], [False] * 3)
+        self.assertTrue(scanner.feed(chunks[3]))
+        self.assertEqual(
+            scanner.buffer[scanner.start : scanner.end], '{"a": "x\\"}", "b": [1]}'
+        )
+
+    def test_array_opener(self):
+        """Test that an array is scanned when "[" is the opener"""
+        scanner = JsonStreamScanner("[")
+
+        self.assertTrue(scanner.feed('[{"a": 1}, {"b": "]"}] {'))
+        self.assertEqual(scanner.end, 22)
+
+
+class TestRobustJsonParser(unittest.TestCase):
+    """Test cases for robust_json_parser"""
+
+    def test_parses_truncated_response_with_prose(self):
+        """Test parsing a fenced response cut off by the token limit"""
+        text = 'Here is my answer:\n```json\n{"care_level": "PICU", "reasons": ["a", "b'
+
+        self.assertEqual(
+            robust_json_parser(text), {"care_level": "PICU", "reasons": ["a", "b"]}
+        )
+
+
+class TestFirstPresent(unittest.TestCase):
+    """Test cases for first_present"""
+
+    def test_returns_first_present_key(self):
+        """Test key preference, falsy values and the default"""
+        keys = ("age_years", "age")
+
+        self.assertEqual(first_present({"age_years": 0, "age": 5}, keys), 0)
+        self.assertEqual(first_present({"age": 5}, keys), 5)
+        self.assertEqual(first_present({}, keys, "N/A"), "N/A")
+
+
+if __name__ == "__main__":
+    unittest.main()